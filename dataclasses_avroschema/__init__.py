@@ -59,9 +59,30 @@ from .fields.fields import (
     UnionField,
     UUIDField,
 )
+from .lazy import LazyRecord
 from .main import AvroModel
 from .model_generator.generator import BaseClassEnum, ModelGenerator, ModelType
-from .serialization import AVRO, AVRO_JSON, SerializationType, deserialize, serialize
+from .router import ModelRouter
+from .schema_registry import ConfluentSerializer, LocalSchemaRegistry, SchemaRegistry
+from .serialization import (
+    AVRO,
+    AVRO_JSON,
+    AVRO_SINGLE_OBJECT,
+    FingerprintIndex,
+    SchemaResolutionCache,
+    SerializationType,
+    deserialize,
+    deserialize_many,
+    fingerprint_index,
+    parse_schema,
+    project_schema,
+    read_container,
+    schema_resolution_cache,
+    serialize,
+    serialize_into,
+    serialize_many,
+    write_container,
+)
 from .types import DateTimeMicro, Float32, Int32, LocalDateTime, LocalDateTimeMicro, TimeMicro, condecimal, confixed
 
 __all__ = [
@@ -139,4 +160,21 @@ __all__ = [
     "SerializationType",
     "serialize",
     "deserialize",
+    "parse_schema",
+    "serialize_many",
+    "deserialize_many",
+    "write_container",
+    "read_container",
+    "serialize_into",
+    "SchemaResolutionCache",
+    "schema_resolution_cache",
+    "AVRO_SINGLE_OBJECT",
+    "FingerprintIndex",
+    "fingerprint_index",
+    "ConfluentSerializer",
+    "LocalSchemaRegistry",
+    "SchemaRegistry",
+    "ModelRouter",
+    "project_schema",
+    "LazyRecord",
 ]
@@ -0,0 +1,599 @@
+import dataclasses
+import enum
+import functools
+import typing
+from collections.abc import Mapping
+
+from dacite import Config, MissingValueError, from_dict
+
+from .utils import is_union
+
+if typing.TYPE_CHECKING:
+    from .main import AvroModel  # pragma: no cover
+
+
+# A value decoder converts one value of the fastavro output into the python value of the field.
+# `None` stands for the identity, so values that do not need conversion are used as they are.
+ValueDecoder = typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+ModelDecoder = typing.Callable[[typing.Mapping], "AvroModel"]
+DictDecoder = typing.Callable[[typing.Mapping], typing.Dict[str, typing.Any]]
+# Returns the type of every field of a model, or None when its `to_dict` can not be predicted from them
+FieldTypes = typing.Callable[[typing.Type["AvroModel"]], typing.Optional[typing.Dict[str, typing.Any]]]
+
+COLLECTIONS = (list, tuple, dict)
+
+
+def _type_args(type_: typing.Any, defaults: typing.Tuple[typing.Any, ...]) -> typing.Tuple[typing.Any, ...]:
+    return typing.get_args(type_) or defaults
+
+
+def _is_collection(type_: typing.Any) -> bool:
+    return typing.get_origin(type_) in COLLECTIONS
+
+
+def _is_optional(type_: typing.Any) -> bool:
+    return is_union(type_) and type(None) in typing.get_args(type_)
+
+
+def _is_subclass(type_: typing.Any, base_type: typing.Any) -> bool:
+    type_ = typing.get_origin(type_) or type_
+    return isinstance(type_, type) and isinstance(base_type, type) and issubclass(type_, base_type)
+
+
+class _Undecided(Exception):
+    # dacite decides the conversion of the value, so the model is created with `from_dict`
+    pass
+
+
+def _undecided(value: typing.Any) -> typing.NoReturn:
+    raise _Undecided
+
+
+def _missing_value(name: str) -> typing.NoReturn:
+    raise MissingValueError(name)
+
+
+class _DecoderBuilder:
+    """
+    Compile the decoders of a model and of all its nested models with the same dacite config.
+
+    The decisions that dacite takes for every value (type hooks, optionals, collections,
+    nested dataclasses and casts) are taken once per type here. A model with a field that
+    can not be resolved upfront, for example a union with more than one type, is created
+    by `from_dict` itself, so the result is always the same that `from_dict` would return.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.decoders: typing.Dict[typing.Type, ModelDecoder] = {}
+
+    def is_cast(self, type_: typing.Any) -> bool:
+        return any(_is_subclass(type_, cast_type) for cast_type in self.config.cast)
+
+    def value_decoder(self, type_: typing.Any) -> ValueDecoder:
+        if type_ in self.config.type_hooks:
+            if isinstance(type_, type) and not dataclasses.is_dataclass(type_) and not self.is_cast(type_):
+                return self.config.type_hooks[type_]
+            raise _Undecided
+
+        if is_union(type_):
+            types = typing.get_args(type_)
+            if len(types) == 2 and _is_optional(type_):
+                return self.optional_decoder(self.value_decoder(next(arg for arg in types if arg is not type(None))))
+            raise _Undecided
+        elif _is_collection(type_):
+            return self.collection_decoder(type_)
+        elif isinstance(type_, type) and dataclasses.is_dataclass(type_) and not self.is_cast(type_):
+            return self.record_decoder(type_)
+        elif self.is_cast(type_):
+            # enums are the only cast types that are not collections
+            if isinstance(type_, type):
+                return type_
+            raise _Undecided
+        elif isinstance(type_, type) or type_ is typing.Any or typing.get_origin(type_) is typing.Literal:
+            return None
+        raise _Undecided
+
+    @staticmethod
+    def optional_decoder(decoder: ValueDecoder) -> ValueDecoder:
+        if decoder is None:
+            return None
+
+        def decode(value: typing.Any) -> typing.Any:
+            return None if value is None else decoder(value)
+
+        return decode
+
+    def collection_decoder(self, type_: typing.Any) -> ValueDecoder:
+        # a value of another type than `fastavro` returns is converted by `from_dict`
+        origin = typing.get_origin(type_)
+
+        if origin is list and not self.is_cast(type_):
+            item_decoder = self.value_decoder(_type_args(type_, (typing.Any,))[0])
+
+            def decode_list(value: typing.Any) -> typing.Any:
+                if type(value) is not list:
+                    _undecided(value)
+                if item_decoder is None:
+                    return list(value)
+                return [item_decoder(item) for item in value]
+
+            return decode_list
+        elif origin is tuple:
+            # avro arrays are read as lists and dacite decodes every item with the first type
+            item_decoder = self.value_decoder(_type_args(type_, (typing.Any,))[0])
+
+            def decode_tuple(value: typing.Any) -> typing.Any:
+                if type(value) is not list:
+                    _undecided(value)
+                if item_decoder is None:
+                    return tuple(value)
+                return tuple(item_decoder(item) for item in value)
+
+            return decode_tuple
+        elif origin is dict and not self.is_cast(type_):
+            item_decoder = self.value_decoder(_type_args(type_, (typing.Any, typing.Any))[1])
+
+            def decode_dict(value: typing.Any) -> typing.Any:
+                if type(value) is not dict:
+                    _undecided(value)
+                if item_decoder is None:
+                    return dict(value)
+                return {key: item_decoder(item) for key, item in value.items()}
+
+            return decode_dict
+
+        raise _Undecided
+
+    def get_model_decoder(self, model: typing.Type) -> ModelDecoder:
+        model_decoder = self.decoders.get(model)
+        if model_decoder is None:
+            # for self relationships the decoder is looked up once it has been generated
+            self.decoders[model] = lambda data: self.decoders[model](data)
+            model_decoder = self.decoders[model] = self.model_decoder(model)
+        return model_decoder
+
+    def record_decoder(self, model: typing.Type) -> ValueDecoder:
+        model_decoder = self.get_model_decoder(model)
+
+        def decode(value: typing.Any) -> typing.Any:
+            if isinstance(value, Mapping):
+                return model_decoder(value)
+            return value
+
+        return decode
+
+    def model_decoder(self, model: typing.Type) -> ModelDecoder:
+        fallback = functools.partial(from_dict, model, config=self.config)
+        if self.config.check_types or self.config.strict:
+            return fallback
+
+        try:
+            type_hints = typing.get_type_hints(model, localns=self.config.forward_references)
+        except NameError:
+            # dacite raises the proper error
+            return fallback
+
+        fields = dataclasses.fields(model)
+        if any(not field.init for field in fields) or any(
+            isinstance(type_, dataclasses.InitVar) for type_ in type_hints.values()
+        ):
+            return fallback
+
+        namespace: typing.Dict[str, typing.Any] = {
+            "_model": model,
+            "_missing_value": _missing_value,
+            "_Undecided": _Undecided,
+            "_fallback": fallback,
+        }
+        arguments = []
+
+        for index, field in enumerate(fields):
+            type_ = type_hints[field.name]
+            key = self.config.convert_key(field.name)
+            try:
+                decoder = self.value_decoder(type_)
+            except _Undecided:
+                return fallback
+
+            value = f"data[{key!r}]"
+            if decoder is not None:
+                namespace[f"_decoder_{index}"] = decoder
+                value = f"_decoder_{index}({value})"
+
+            if field.default is not dataclasses.MISSING:
+                namespace[f"_default_{index}"] = field.default
+                value = f"{value} if {key!r} in data else _default_{index}"
+            elif field.default_factory is not dataclasses.MISSING:
+                namespace[f"_default_factory_{index}"] = field.default_factory
+                value = f"{value} if {key!r} in data else _default_factory_{index}()"
+            elif _is_optional(type_):
+                value = f"{value} if {key!r} in data else None"
+            else:
+                # the same error that dacite raises
+                value = f"{value} if {key!r} in data else _missing_value({field.name!r})"
+
+            arguments.append(f"{field.name}={value}")
+
+        source = (
+            "def decode(data):\n"
+            "    try:\n"
+            f"        return _model({', '.join(arguments)})\n"
+            "    except _Undecided:\n"
+            "        return _fallback(data)\n"
+        )
+        exec(source, namespace)  # noqa: S102
+
+        decode = namespace["decode"]
+        decode.__qualname__ = f"{model.__name__}.decode"
+        return decode
+
+
+def generate_decoder(model: typing.Type["AvroModel"], config: Config) -> ModelDecoder:
+    """
+    Generate the function that creates instances of a model from the `fastavro` output.
+
+    It is equivalent to `dacite.from_dict` with the same config, but the conversions
+    that every field needs are decided once, when the decoder is generated, and the
+    nested models are created directly instead of being resolved value by value.
+
+    Arguments:
+        model (Type[AvroModel]): the model to generate the decoder for
+        config (dacite.Config): the dacite config of the model
+
+    Returns:
+        A function that receives a dict and returns an instance of the model
+    """
+    return _DecoderBuilder(config).get_model_decoder(model)
+
+
+def _field_decoder(
+    model: typing.Type["AvroModel"], field: dataclasses.Field, type_: typing.Any, builder: _DecoderBuilder
+) -> ValueDecoder:
+    try:
+        decoder = builder.value_decoder(type_)
+    except _Undecided:
+        decoder = _undecided
+
+    if decoder is None:
+        return None
+
+    # a model with only the field, so `from_dict` converts its value like in the model
+    holder = dataclasses.make_dataclass(model.__name__, [(field.name, type_)])
+    fallback = functools.partial(from_dict, holder, config=builder.config)
+
+    def decode(value: typing.Any) -> typing.Any:
+        try:
+            return decoder(value)  # type: ignore[misc]
+        except _Undecided:
+            return getattr(fallback({field.name: value}), field.name)
+
+    return decode
+
+
+def generate_field_decoders(model: typing.Type["AvroModel"], config: Config) -> typing.Dict[str, ValueDecoder]:
+    """
+    Generate the decoders that convert the value of every field, as it comes from `fastavro`,
+    into the python value that an instance of the model has for it. They are used when
+    only some of the fields are needed, so the model is never created.
+
+    Arguments:
+        model (Type[AvroModel]): the model to generate the decoders for
+        config (dacite.Config): the dacite config of the model
+
+    Returns:
+        The decoders by field name, in the order of the model fields
+    """
+    builder = _DecoderBuilder(config)
+    type_hints = typing.get_type_hints(model, localns=config.forward_references)
+    return {
+        field.name: _field_decoder(model, field, type_hints[field.name], builder)
+        for field in dataclasses.fields(model)  # type: ignore[arg-type]
+    }
+
+
+class _UnsupportedType(Exception):
+    pass
+
+
+class _Untrusted(Exception):
+    # the value does not come from `fastavro` as expected, so the model is created with validation
+    pass
+
+
+def _untrusted() -> typing.NoReturn:
+    raise _Untrusted
+
+
+def _as_is(data: typing.Mapping) -> typing.Dict[str, typing.Any]:
+    return data  # type: ignore[return-value]
+
+
+def _enum_decoder(enum_type: typing.Type[enum.Enum]) -> ValueDecoder:
+    members = enum_type._value2member_map_
+
+    def decode(value: typing.Any) -> typing.Any:
+        # a dict lookup instead of calling the enum, which is much slower
+        member = members.get(value)
+        return enum_type(value) if member is None else member
+
+    return decode
+
+
+class _FastavroDecoderBuilder:
+    """
+    Compile the decoders that turn the `fastavro` output of a model into the dict that
+    `to_dict` returns for its instances, without creating them, or with `construct`
+    into the instances themselves, without any hook, cast or check.
+
+    `fastavro` already returns the logical types, so only the enums, the tuples, the nested
+    records and the unions with more than one record (read with their names) need a conversion.
+    Any type that can not be decided upfront raises `_UnsupportedType`.
+    """
+
+    def __init__(
+        self,
+        base_class: typing.Type["AvroModel"],
+        field_types: FieldTypes,
+        enums_as_members: bool,
+        plain_types: typing.Optional[typing.Tuple[typing.Type, ...]],
+        construct: bool = False,
+    ) -> None:
+        self.base_class = base_class
+        self.field_types = field_types
+        self.enums_as_members = enums_as_members
+        self.plain_types = plain_types
+        self.construct = construct
+        self.decoders: typing.Dict[typing.Type, ValueDecoder] = {}
+
+    def is_record(self, type_: typing.Any) -> bool:
+        return isinstance(type_, type) and issubclass(type_, self.base_class)
+
+    def value_decoder(self, type_: typing.Any) -> ValueDecoder:
+        if type_ is typing.Any or type_ is type(None) or typing.get_origin(type_) is typing.Literal:
+            return None
+        elif is_union(type_):
+            return self.union_decoder(type_)
+        elif _is_collection(type_):
+            return self.collection_decoder(type_)
+        elif self.is_record(type_):
+            return self.record_decoder(type_)
+        elif isinstance(type_, type) and issubclass(type_, enum.Enum):
+            return _enum_decoder(type_) if self.enums_as_members else None
+        elif isinstance(type_, type) and (self.plain_types is None or type_ in self.plain_types):
+            return None
+        raise _UnsupportedType(type_)
+
+    def union_decoder(self, type_: typing.Any) -> ValueDecoder:
+        types = [arg for arg in typing.get_args(type_) if arg is not type(None)]
+        if len(types) == 1 and not self.is_record(types[0]):
+            return _DecoderBuilder.optional_decoder(self.value_decoder(types[0]))
+
+        records = [arg for arg in types if self.is_record(arg)]
+        enums = [arg for arg in types if isinstance(arg, type) and issubclass(arg, enum.Enum)]
+        others = [arg for arg in types if arg not in records and arg not in enums]
+
+        if (
+            len(enums) > 1
+            or (enums and any(arg is str or typing.get_origin(arg) is typing.Literal for arg in others))
+            or (records and any(typing.get_origin(arg) is dict for arg in others))
+            or any(self.value_decoder(arg) is not None for arg in others)
+        ):
+            # the values that need a conversion can not be told apart from the other types
+            raise _UnsupportedType(type_)
+
+        enum_decoder = self.value_decoder(enums[0]) if enums else None
+        if not records and enum_decoder is None:
+            return None
+
+        decoders = {record.__name__: self.record_decoder(record) for record in records}
+        fields = [({field.name for field in record.get_fields()}, decoders[record.__name__]) for record in records]
+
+        def decode(value: typing.Any) -> typing.Any:
+            name = None
+            if isinstance(value, tuple):
+                # `fastavro` returns the name of the type when the union has more than one record
+                name, value = value
+
+            if type(value) is dict or isinstance(value, Mapping):
+                if name is not None:
+                    decoder = decoders.get(name.split(".")[-1])
+                elif len(fields) == 1:
+                    decoder = fields[0][1]
+                else:
+                    # the json reader does not return the name, so the record is found by its fields
+                    decoder = next((decoder for names, decoder in fields if value.keys() == names), None)
+                if decoder is None and self.construct:
+                    # the instance would get a dict where a record is expected
+                    raise _Untrusted
+            elif isinstance(value, str):
+                decoder = enum_decoder
+            else:
+                return value
+            return value if decoder is None else decoder(value)
+
+        return decode
+
+    def collection_decoder(self, type_: typing.Any) -> ValueDecoder:
+        origin = typing.get_origin(type_)
+
+        if origin is list:
+            item_decoder = self.value_decoder(_type_args(type_, (typing.Any,))[0])
+            if item_decoder is None:
+                return None
+
+            def decode_list(value: typing.Any) -> typing.Any:
+                return [item_decoder(item) for item in value] if type(value) is list else value  # type: ignore[misc]
+
+            return decode_list
+        elif origin is tuple:
+            item_decoder = self.value_decoder(_type_args(type_, (typing.Any,))[0])
+
+            def decode_tuple(value: typing.Any) -> typing.Any:
+                if type(value) is not list:
+                    return value
+                if item_decoder is None:
+                    return tuple(value)
+                return tuple(item_decoder(item) for item in value)
+
+            return decode_tuple
+        elif origin is dict:
+            item_decoder = self.value_decoder(_type_args(type_, (typing.Any, typing.Any))[1])
+            if item_decoder is None:
+                return None
+
+            def decode_dict(value: typing.Any) -> typing.Any:
+                if type(value) is not dict:
+                    return value
+                return {key: item_decoder(item) for key, item in value.items()}  # type: ignore[misc]
+
+            return decode_dict
+
+        raise _UnsupportedType(type_)
+
+    def record_decoder(self, model: typing.Type["AvroModel"]) -> ValueDecoder:
+        if model in self.decoders:
+            return self.decoders[model]
+
+        # for self relationships the decoder is looked up once it has been generated
+        self.decoders[model] = lambda data: (self.decoders[model] or _as_is)(data)
+        model_decoder = self.decoders[model] = self.model_decoder(model)
+        return model_decoder
+
+    def model_decoder(self, model: typing.Type["AvroModel"]) -> ValueDecoder:
+        field_types = self.field_types(model)
+        if field_types is None or set(field_types) != {field.name for field in model.get_fields()}:
+            raise _UnsupportedType(model)
+        if self.construct:
+            return self.construct_decoder(model, field_types)
+
+        namespace: typing.Dict[str, typing.Any] = {"Mapping": Mapping}
+        items = []
+        decoders = 0
+        for index, (name, type_) in enumerate(field_types.items()):
+            decoder = self.value_decoder(type_)
+            value = f"data[{name!r}]"
+            if decoder is not None:
+                decoders += 1
+                namespace[f"_decoder_{index}"] = decoder
+                value = f"_decoder_{index}({value})"
+            items.append(f"{name!r}: {value}")
+
+        if not decoders:
+            # the dict that `fastavro` returns is used as it is
+            return None
+
+        source = (
+            "def decode(data):\n"
+            "    if type(data) is not dict and not isinstance(data, Mapping):\n"
+            "        return data\n"
+            "    return {" + ", ".join(items) + "}\n"
+        )
+        exec(source, namespace)  # noqa: S102
+
+        decode = namespace["decode"]
+        decode.__qualname__ = f"{model.__name__}.decode_dict"
+        return decode
+
+    def construct_decoder(
+        self, model: typing.Type["AvroModel"], field_types: typing.Dict[str, typing.Any]
+    ) -> ModelDecoder:
+        if dataclasses.is_dataclass(model) and any(not field.init for field in dataclasses.fields(model)):
+            raise _UnsupportedType(model)
+
+        namespace: typing.Dict[str, typing.Any] = {
+            "Mapping": Mapping,
+            "_model": model,
+            "_untrusted": _untrusted,
+            "_Untrusted": _Untrusted,
+            "_fallback": functools.partial(model.parse_obj, trusted=False),
+        }
+        arguments = []
+        for index, (name, type_) in enumerate(field_types.items()):
+            decoder = self.value_decoder(type_)
+            value = f"data[{name!r}]"
+            if decoder is not None:
+                namespace[f"_decoder_{index}"] = decoder
+                value = f"_decoder_{index}({value})"
+            # a dict that does not come from `fastavro` might miss the fields with defaults
+            arguments.append(f"{name}={value} if {name!r} in data else _untrusted()")
+
+        source = (
+            "def decode(data):\n"
+            "    if type(data) is not dict and not isinstance(data, Mapping):\n"
+            "        return data\n"
+            "    try:\n"
+            f"        return _model({', '.join(arguments)})\n"
+            "    except _Untrusted:\n"
+            "        return _fallback(data)\n"
+        )
+        exec(source, namespace)  # noqa: S102
+
+        decode = namespace["decode"]
+        decode.__qualname__ = f"{model.__name__}.decode_trusted"
+        return decode
+
+
+def dataclass_field_types(model: typing.Type["AvroModel"]) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    try:
+        type_hints = typing.get_type_hints(model, localns={model.__name__: model})
+    except (NameError, TypeError):
+        return None
+    return {field.name: type_hints[field.name] for field in dataclasses.fields(model)}  # type: ignore[arg-type]
+
+
+def generate_dict_decoder(
+    model: typing.Type["AvroModel"],
+    base_class: typing.Type["AvroModel"],
+    field_types: FieldTypes = dataclass_field_types,
+    enums_as_members: bool = True,
+    plain_types: typing.Optional[typing.Tuple[typing.Type, ...]] = None,
+) -> typing.Optional[DictDecoder]:
+    """
+    Generate the function that returns the same dict as `to_dict` straight from the `fastavro`
+    output, so `deserialize(create_instance=False)` never creates the instances.
+
+    Arguments:
+        model (Type[AvroModel]): the model to generate the decoder for
+        base_class (Type[AvroModel]): the class that nested records inherit from
+        field_types (FieldTypes): returns the types of the fields of a model
+        enums_as_members (bool): whether `to_dict` returns the enum members or their values
+        plain_types (Tuple[type] | None): the classes whose values `to_dict` returns as `fastavro`
+            reads them, or None when it is the case for all of them
+
+    Returns:
+        A function that receives the `fastavro` output and returns the dict, or None when
+        the dict can not be predicted from the types, then the instance has to be created
+    """
+    try:
+        decoder = _FastavroDecoderBuilder(base_class, field_types, enums_as_members, plain_types).record_decoder(model)
+    except _UnsupportedType:
+        return None
+    return decoder or _as_is
+
+
+def generate_trusted_decoder(
+    model: typing.Type["AvroModel"],
+    base_class: typing.Type["AvroModel"],
+    field_types: FieldTypes = dataclass_field_types,
+) -> typing.Optional[ModelDecoder]:
+    """
+    Generate the function that creates instances of a model straight from the `fastavro` output,
+    trusting that the values already have the right types: the dacite type hooks, casts and
+    checks are skipped and only the enums, the tuples and the nested records are converted.
+
+    Arguments:
+        model (Type[AvroModel]): the model to generate the decoder for
+        base_class (Type[AvroModel]): the class that nested records inherit from
+        field_types (FieldTypes): returns the types of the fields of a model
+
+    Returns:
+        A function that receives a dict and returns an instance of the model, or None
+        when the conversions can not be decided from the types
+    """
+    try:
+        return _FastavroDecoderBuilder(
+            base_class, field_types, enums_as_members=True, plain_types=None, construct=True
+        ).record_decoder(model)
+    except _UnsupportedType:
+        return None
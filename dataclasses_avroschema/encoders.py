@@ -0,0 +1,224 @@
+import dataclasses
+import enum
+import typing
+
+from .fields.fields import (
+    DecimalField,
+    DictField,
+    EnumField,
+    ImmutableField,
+    ListField,
+    RecordField,
+    SelfReferenceField,
+    TupleField,
+)
+from .types import JsonDict
+from .utils import is_faust_record, is_union_field, standardize_custom_type
+
+if typing.TYPE_CHECKING:
+    from .main import AvroModel  # pragma: no cover
+    from .protocol import FieldProtocol  # pragma: no cover
+
+
+# A field encoder converts one python value into the value that `asdict` returns for it.
+# `None` stands for the identity, so no call is made at all for primitive fields.
+FieldEncoder = typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+ModelEncoder = typing.Callable[["AvroModel"], JsonDict]
+
+
+def _record_asdict(value: typing.Any) -> JsonDict:
+    if is_faust_record(type(value)):  # type: ignore[arg-type]
+        # faust does not let us override asdict, same trick as in `standardize_custom_type`
+        return value.standardize_type(include_type=True)
+    return value.asdict()
+
+
+def _standardize_value(
+    value: typing.Any, *, base_class: typing.Type["AvroModel"], include_record_name: bool = False
+) -> typing.Any:
+    """
+    Runtime version of `standardize_custom_type` for the values whose shape is not known
+    upfront (unions, literals and custom types). The union check is resolved once when the
+    encoder is generated and arrives here as `include_record_name`.
+    """
+    if isinstance(value, dict):
+        return {k: _standardize_value(v, base_class=base_class) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_standardize_value(v, base_class=base_class) for v in value]
+    elif isinstance(value, tuple):
+        return tuple(_standardize_value(v, base_class=base_class) for v in value)
+    elif isinstance(value, enum.Enum):
+        return value.value
+    elif isinstance(value, base_class):
+        if include_record_name:
+            return (value.get_fullname(), _record_asdict(value))
+        return _record_asdict(value)
+
+    return value
+
+
+def _generic_encoder(base_class: typing.Type["AvroModel"], include_record_name: bool = False) -> FieldEncoder:
+    def encode(value: typing.Any) -> typing.Any:
+        return _standardize_value(value, base_class=base_class, include_record_name=include_record_name)
+
+    return encode
+
+
+def _encode_enum(value: typing.Any) -> typing.Any:
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _record_encoder(base_class: typing.Type["AvroModel"]) -> FieldEncoder:
+    def encode(value: typing.Any) -> typing.Any:
+        if isinstance(value, base_class):
+            return _record_asdict(value)
+        return _standardize_value(value, base_class=base_class)
+
+    return encode
+
+
+def _sequence_encoder(
+    item_encoder: FieldEncoder, sequence_type: typing.Type, base_class: typing.Type["AvroModel"]
+) -> FieldEncoder:
+    def encode(value: typing.Any) -> typing.Any:
+        if type(value) is not sequence_type:
+            return _standardize_value(value, base_class=base_class)
+        if item_encoder is None:
+            # lists are copied, like the generic path does, tuples are immutable
+            return list(value) if sequence_type is list else value
+        if sequence_type is tuple:
+            return tuple(item_encoder(item) for item in value)
+        return [item_encoder(item) for item in value]
+
+    return encode
+
+
+def _map_encoder(item_encoder: FieldEncoder, base_class: typing.Type["AvroModel"]) -> FieldEncoder:
+    def encode(value: typing.Any) -> typing.Any:
+        if type(value) is not dict:
+            return _standardize_value(value, base_class=base_class)
+        if item_encoder is None:
+            return dict(value)
+        return {key: item_encoder(item) for key, item in value.items()}
+
+    return encode
+
+
+def compile_field_encoder(field: "FieldProtocol", base_class: typing.Type["AvroModel"]) -> FieldEncoder:
+    """
+    Build the encoder for a parsed field that is not a top level union.
+
+    Arguments:
+        field (FieldProtocol): field created by the parser
+        base_class (Type[AvroModel]): the class that nested records inherit from
+
+    Returns:
+        The encoder, or None when the value is returned as it is
+    """
+    if isinstance(field, (ImmutableField, DecimalField)):
+        return None
+    elif isinstance(field, EnumField):
+        return _encode_enum
+    elif isinstance(field, (RecordField, SelfReferenceField)):
+        return _record_encoder(base_class)
+    elif isinstance(field, (ListField, TupleField)) and hasattr(field, "internal_field"):
+        sequence_type = tuple if isinstance(field, TupleField) else list
+        return _sequence_encoder(compile_field_encoder(field.internal_field, base_class), sequence_type, base_class)
+    elif isinstance(field, DictField) and field.internal_field is not None:
+        return _map_encoder(compile_field_encoder(field.internal_field, base_class), base_class)
+
+    # unions inside collections, literals and types that the encoder does not know about
+    return _generic_encoder(base_class)
+
+
+def _fallback_encoder(field_names: typing.Sequence[str], base_class: typing.Type["AvroModel"]) -> ModelEncoder:
+    def encode(instance: "AvroModel") -> JsonDict:
+        return {
+            name: standardize_custom_type(
+                field_name=name, value=getattr(instance, name), model=instance, base_class=base_class
+            )
+            for name in field_names
+        }
+
+    return encode
+
+
+def generate_encoder(
+    model: typing.Type["AvroModel"],
+    base_class: typing.Type["AvroModel"],
+    field_names: typing.Optional[typing.Sequence[str]] = None,
+    dumped_fields: typing.AbstractSet[str] = frozenset(),
+    mapping: bool = False,
+) -> ModelEncoder:
+    """
+    Generate the function that `asdict` uses for the instances of a model.
+
+    The parsed fields tell upfront which conversion every field needs, so the
+    generated function only calls an encoder for the fields that need one
+    (records, enums, collections and unions) and reads the rest as they are.
+
+    Arguments:
+        model (Type[AvroModel]): the model to generate the encoder for
+        base_class (Type[AvroModel]): the class that nested records inherit from
+        field_names (Sequence[str]): the names of the model fields, the dataclass fields by default
+        dumped_fields (AbstractSet[str]): the fields that `model_dump` already returns in their
+            avro form (pydantic), they are converted by a single `model_dump` call
+        mapping (bool): whether the encoder receives a dict with the values of the fields instead of an instance.
+            The type hints of the model must be resolvable
+
+    Returns:
+        A function that receives an instance of the model and returns its dict representation
+    """
+    if field_names is None:
+        field_names = [field.name for field in dataclasses.fields(model)]  # type: ignore[arg-type]
+
+    try:
+        union_fields = {name: is_union_field(model, name, base_class) for name in field_names}
+    except (NameError, TypeError):
+        # the hints can not be resolved, so every value goes through the generic path
+        if mapping:
+            raise
+        return _fallback_encoder(field_names, base_class)
+
+    fields_map = {field.name: field for field in model.get_fields()}
+    namespace: typing.Dict[str, typing.Any] = {"_dumped_fields": set(dumped_fields)}
+    items = []
+
+    for index, name in enumerate(field_names):
+        field = fields_map.get(name)
+
+        if name in dumped_fields:
+            items.append(f"{name!r}: dumped[{name!r}]")
+            continue
+
+        if union_fields[name]:
+            encoder = _generic_encoder(base_class, include_record_name=True)
+        elif field is None:
+            # excluded fields are not parsed
+            encoder = _generic_encoder(base_class)
+        else:
+            encoder = compile_field_encoder(field, base_class)
+
+        value = f"instance[{name!r}]" if mapping else f"instance.{name}"
+        if encoder is None:
+            items.append(f"{name!r}: {value}")
+        else:
+            encoder_name = f"_encoder_{index}"
+            namespace[encoder_name] = encoder
+            items.append(f"{name!r}: {encoder_name}({value})")
+
+    if dumped_fields and len(dumped_fields) == len(field_names):
+        source = "def encode(instance):\n    return instance.model_dump(include=_dumped_fields)\n"
+    elif dumped_fields:
+        source = (
+            "def encode(instance):\n"
+            "    dumped = instance.model_dump(include=_dumped_fields)\n"
+            "    return {" + ", ".join(items) + "}\n"
+        )
+    else:
+        source = "def encode(instance):\n    return {" + ", ".join(items) + "}\n"
+    exec(source, namespace)  # noqa: S102
+
+    encode = namespace["encode"]
+    encode.__qualname__ = f"{model.__name__}.encode"
+    return encode
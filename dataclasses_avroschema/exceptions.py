@@ -50,3 +50,75 @@ class InvalidSymbol(Exception):
 
     def __str__(self) -> str:
         return f"Symbol {self.symbol} does not match the regular expression [A-Za-z_][A-Za-z0-9_]*"
+
+
+class UnknownSchemaFingerprint(Exception):
+    """
+    An event serialized with the `avro-single-object` type carries the fingerprint of a
+    schema that has not been registered in the fingerprint index.
+    """
+
+    def __init__(self, fingerprint: bytes) -> None:
+        self.fingerprint = fingerprint
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__  # pragma: no cover
+        return f"{class_name} {self.fingerprint.hex()}"  # pragma: no cover
+
+    def __str__(self) -> str:
+        return (
+            f"There is no schema registered with the fingerprint {self.fingerprint.hex()}. "
+            "Register the writer schema with `fingerprint_index.register` before deserializing"
+        )
+
+
+class SchemaFingerprintCollision(Exception):
+    """
+    Schemas that are decoded differently have the same CRC-64-AVRO fingerprint. The parsing
+    canonical form drops the logical types, so it happens when they only differ in them.
+    """
+
+    def __init__(self, fingerprint: bytes) -> None:
+        self.fingerprint = fingerprint
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__  # pragma: no cover
+        return f"{class_name} {self.fingerprint.hex()}"  # pragma: no cover
+
+    def __str__(self) -> str:
+        return (
+            f"Schemas with different logical types have the fingerprint {self.fingerprint.hex()}, "
+            "so their events can not be told apart with the `avro-single-object` type"
+        )
+
+
+class UnknownSchemaId(Exception):
+    """
+    A schema registry does not have a schema with the id found in the header of an event.
+    """
+
+    def __init__(self, schema_id: int) -> None:
+        self.schema_id = schema_id
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__  # pragma: no cover
+        return f"{class_name} {self.schema_id}"  # pragma: no cover
+
+    def __str__(self) -> str:
+        return f"There is no schema registered with the id {self.schema_id}"
+
+
+class UnknownModel(Exception):
+    """
+    A `ModelRouter` does not have a model registered for the record of an event.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__  # pragma: no cover
+        return f"{class_name} {self.name}"  # pragma: no cover
+
+    def __str__(self) -> str:
+        return f"There is no model registered for the record {self.name}"
@@ -1 +1,2 @@
 from .main import AvroRecord  # noqa: F401 I001
+from .codec import AvroRecordCodec  # noqa: F401 I001
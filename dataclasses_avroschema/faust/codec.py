@@ -0,0 +1,103 @@
+import typing
+
+from faust.serializers import codecs
+
+from dataclasses_avroschema import serialization
+from dataclasses_avroschema.encoders import ModelEncoder, generate_encoder
+from dataclasses_avroschema.types import BytesLike
+
+from .main import AvroRecord
+
+
+class AvroRecordCodec(codecs.Codec):
+    """
+    `faust` codec that serializes the events of an `AvroRecord` with avro.
+
+    The schema is parsed once for the model and the values are converted with compiled encoders,
+    so the codec can be registered in the `faust` codec registry and used as the serializer of
+    topics and agents, for example with `value_serializer="avro-user"`.
+
+    Arguments:
+        model: The `AvroRecord` of the events
+        serialization_type: `avro`, `avro-json` or `avro-single-object`
+
+    !!! Example
+        ```python
+        from faust.serializers import codecs
+
+        codecs.register("avro-user", AvroRecordCodec(User))
+        topic = app.topic("users", value_type=User, value_serializer="avro-user")
+        ```
+    """
+
+    def __init__(
+        self,
+        model: typing.Type[AvroRecord],
+        serialization_type: serialization.SerializationType = "avro",
+        children: typing.Tuple[codecs.CodecT, ...] = (),
+        **kwargs: typing.Any,
+    ) -> None:
+        # the arguments are kept in `kwargs`, so `clone` creates the same codec
+        super().__init__(children=children, model=model, serialization_type=serialization_type, **kwargs)
+        self.model = model
+        self.serialization_type = serialization_type
+        self._mapping_encoder: typing.Optional[ModelEncoder] = None
+
+    def _encode(self, obj: typing.Any) -> typing.Dict[str, typing.Any]:
+        if isinstance(obj, self.model):
+            return obj.standardize_type()
+
+        # `Record.dumps` sends `to_representation()`, a dict with the values of the fields
+        if self._mapping_encoder is None:
+            self.model.generate_schema()
+            self._mapping_encoder = generate_encoder(self.model, base_class=AvroRecord, mapping=True)
+
+        try:
+            return self._mapping_encoder(obj)
+        except KeyError:
+            # a dict without the fields that have a default value
+            return self.model.from_data(obj, preferred_type=self.model).standardize_type()
+
+    def _dumps(self, obj: typing.Any) -> bytes:
+        return serialization.serialize(
+            self._encode(obj),
+            self.model._get_parsed_schema(),
+            serialization_type=self.serialization_type,
+        )
+
+    def _loads(self, s: BytesLike) -> AvroRecord:
+        # `faust` uses the instance as it is when it is a model
+        return self.model.deserialize(s, serialization_type=self.serialization_type)
+
+    def dumps_many(self, objs: typing.Iterable[typing.Any]) -> typing.List[bytes]:
+        """
+        Encode many objects at once. All the events are written into a single buffer
+
+        Arguments:
+            objs: The instances of the model, or dicts with the values of their fields
+
+        Returns:
+            The events, in the same order as the objects
+        """
+        events = serialization.serialize_many(
+            (self._encode(obj) for obj in objs),
+            self.model._get_parsed_schema(),
+            serialization_type=self.serialization_type,
+        )
+        for node in self.children:
+            events = [typing.cast(codecs.Codec, node)._dumps(event) for event in events]  # type: ignore[union-attr]
+        return events  # type: ignore[return-value]
+
+    def loads_many(self, events: typing.Iterable[bytes]) -> typing.List[AvroRecord]:
+        """
+        Decode many events at once. The schemas are resolved only once for the whole batch
+
+        Arguments:
+            events: The events to decode
+
+        Returns:
+            The instances of the model, in the same order as the events
+        """
+        for node in reversed(self.children):
+            events = [typing.cast(codecs.Codec, node)._loads(event) for event in events]
+        return list(self.model.deserialize_many(events, serialization_type=self.serialization_type))
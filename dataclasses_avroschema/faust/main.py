@@ -3,6 +3,8 @@ import typing
 from fastavro.validation import validate
 
 from dataclasses_avroschema import AvroModel, serialization
+from dataclasses_avroschema.decoders import DictDecoder, ModelDecoder, generate_dict_decoder, generate_trusted_decoder
+from dataclasses_avroschema.encoders import ModelEncoder, generate_encoder
 from dataclasses_avroschema.types import JsonDict
 from dataclasses_avroschema.utils import standardize_custom_type
 
@@ -15,12 +17,14 @@ except ImportError as ex:  # pragma: no cover
 
 
 class AvroRecord(Record, AvroModel):  # type: ignore
+    # `faust` generates an `asdict` for every record, which shadows `AvroModel.asdict` and returns the values
+    # as they are, so the methods that serialize the instances use `standardize_type` instead
+
     def validate_avro(self) -> bool:
         """
         Validate that instance matches the avro schema
         """
-        schema = self.avro_schema_to_python()
-        return validate(self.asdict(), schema)
+        return validate(self.asdict(), self._get_parsed_schema())
 
     def standardize_type(self, include_type: bool = True) -> typing.Any:
         """
@@ -28,6 +32,10 @@ class AvroRecord(Record, AvroModel):  # type: ignore
         user-defined pydantic json_encoders prior to passing values
         to the standard type conversion factory
         """
+        if include_type:
+            # the compiled encoder sends the records of the unions with their names
+            return type(self)._get_encoder()(self)
+
         return {
             field_name: standardize_custom_type(
                 field_name=field_name, value=value, model=self, base_class=AvroRecord, include_type=include_type
@@ -37,18 +45,87 @@ class AvroRecord(Record, AvroModel):  # type: ignore
 
     def serialize(self, serialization_type: serialization.SerializationType = "avro") -> bytes:
         """
-        Overrides the base AvroModel's serialize method to inject this
-        class's standardization factory method
+        Serialize the instance into avro
         """
-        schema = self.avro_schema_to_python()
-        data = self.standardize_type()
-
         return serialization.serialize(
-            data,
-            schema,
+            self.standardize_type(),
+            self._get_parsed_schema(),
             serialization_type=serialization_type,
         )
 
+    def serialize_into(
+        self,
+        out: typing.Union[bytearray, typing.IO[bytes]],
+        serialization_type: serialization.SerializationType = "avro",
+    ) -> int:
+        """
+        Serialize the instance into avro, writing the event into `out`
+        """
+        return serialization.serialize_into(
+            self.standardize_type(),
+            self._get_parsed_schema(),
+            out,
+            serialization_type=serialization_type,
+        )
+
+    @classmethod
+    def serialize_many(  # type: ignore[override]
+        cls,
+        instances: typing.Iterable["AvroRecord"],
+        serialization_type: serialization.SerializationType = "avro",
+        sink: typing.Optional[typing.Callable[[bytes], typing.Any]] = None,
+    ) -> typing.Optional[typing.List[bytes]]:
+        """
+        Serialize many instances into avro at once
+        """
+        return serialization.serialize_many(
+            (instance.standardize_type() for instance in instances),
+            cls._get_parsed_schema(),
+            serialization_type=serialization_type,
+            sink=sink,
+        )
+
+    @classmethod
+    def write_container(
+        cls,
+        fileobj: typing.IO[bytes],
+        records: typing.Iterable["AvroRecord"],
+        codec: str = "null",
+        sync_interval: int = serialization.DEFAULT_SYNC_INTERVAL,
+        codec_compression_level: typing.Optional[int] = None,
+        metadata: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> None:
+        """
+        Write the records into an avro object container file
+        """
+        serialization.write_container(
+            fileobj,
+            (record.standardize_type() for record in records),
+            cls._get_parsed_schema(),
+            codec=codec,
+            sync_interval=sync_interval,
+            codec_compression_level=codec_compression_level,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def _generate_encoder(cls: typing.Type["AvroRecord"]) -> ModelEncoder:
+        # the fields are read from the dataclass that the parser creates
+        cls.generate_schema()
+        return generate_encoder(cls, base_class=AvroRecord)
+
+    @classmethod
+    def _generate_dict_decoder(cls: typing.Type["AvroRecord"]) -> typing.Optional[DictDecoder]:
+        cls.generate_schema()
+        if cls._parser.metadata.dacite_config is not None:  # type: ignore[union-attr]
+            return None
+        # `to_dict` returns the values of the enums
+        return generate_dict_decoder(cls, base_class=AvroRecord, enums_as_members=False)
+
+    @classmethod
+    def _generate_trusted_decoder(cls: typing.Type["AvroRecord"]) -> typing.Optional[ModelDecoder]:
+        return generate_trusted_decoder(cls, base_class=AvroRecord)
+
     def to_dict(self) -> JsonDict:
         return self.standardize_type(include_type=False)
 
@@ -0,0 +1,98 @@
+import typing
+
+from .types import BytesLike, JsonDict
+
+if typing.TYPE_CHECKING:
+    from .main import AvroModel  # pragma: no cover
+
+TModel = typing.TypeVar("TModel", bound="AvroModel")
+
+
+class LazyRecord(typing.Generic[TModel]):
+    """
+    Read only view of an event returned by `deserialize(..., lazy=True)`.
+
+    The event is decoded with `fastavro` the first time that a field is accessed, and every
+    field is converted into its python value (logical types, enums, nested records) only when
+    it is accessed, then the value is cached. The original event is kept in `_event`, so it can
+    be forwarded as it is. Like in `namedtuple`, the methods and attributes start with an
+    underscore so they do not collide with the field names.
+
+    !!! Example
+        ```python
+        record = User.deserialize(event, lazy=True)
+
+        if record.age > 18:
+            producer.send(record._event)
+
+        user = record._materialize()
+        ```
+    """
+
+    __slots__ = ("_model", "_event", "_read", "_trusted", "_payload", "_values", "_instance")
+
+    def __init__(
+        self,
+        model: typing.Type[TModel],
+        event: BytesLike,
+        read: typing.Callable[[], JsonDict],
+        trusted: typing.Optional[bool] = None,
+    ) -> None:
+        self._model = model
+        self._event = event
+        self._read = read
+        self._trusted = trusted
+        self._payload: typing.Optional[JsonDict] = None
+        self._values: typing.Dict[str, typing.Any] = {}
+        self._instance: typing.Optional[TModel] = None
+
+    def _get_payload(self) -> JsonDict:
+        if self._payload is None:
+            self._payload = self._read()
+        return self._payload
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name in LazyRecord.__slots__ or (name.startswith("__") and name.endswith("__")):
+            # a slot that is not set yet, for example while `copy` or `pickle` create the record
+            raise AttributeError(name)
+
+        values = self._values
+        if name in values:
+            return values[name]
+
+        field_decoders = self._model._get_field_decoders()
+        if name not in field_decoders:
+            raise AttributeError(f"'{self._model.__name__}' has no field '{name}'")
+
+        decoder = field_decoders[name]
+        value = self._get_payload()[name]
+        if decoder is not None:
+            value = decoder(value)
+
+        values[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if name not in LazyRecord.__slots__:
+            raise AttributeError(f"The fields of a lazy '{self._model.__name__}' can not be modified")
+        object.__setattr__(self, name, value)
+
+    def __dir__(self) -> typing.List[str]:
+        return [*super().__dir__(), *self._model._get_field_decoders()]
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        # the copies decode the event again, the values are not shared
+        return (LazyRecord, (self._model, self._event, self._read, self._trusted))
+
+    def __repr__(self) -> str:
+        status = "decoded" if self._payload is not None else "encoded"
+        return f"<lazy {self._model.__name__} ({status})>"
+
+    def _materialize(self) -> TModel:
+        """
+        Returns:
+            The instance of the model with all the fields. It is created once
+        """
+        if self._instance is None:
+            self._instance = self._model.parse_obj(self._get_payload(), trusted=self._trusted)
+        return self._instance
@@ -1,24 +1,78 @@
 import dataclasses
+import functools
 import inspect
 import json
+import os
 from collections import OrderedDict
-from typing import Any, Dict, List, Literal, Optional, Set, Type, TypeVar, Union, overload
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from dacite import Config, from_dict
+from fastavro.schema import fingerprint, to_parsing_canonical_form
 from fastavro.validation import validate
 
 from . import case, serialization
 from .dacite_config import generate_dacite_config
+from .decoders import (
+    DictDecoder,
+    ModelDecoder,
+    ValueDecoder,
+    generate_decoder,
+    generate_dict_decoder,
+    generate_field_decoders,
+    generate_trusted_decoder,
+)
+from .encoders import ModelEncoder, generate_encoder
+from .lazy import LazyRecord
 from .parser import Parser
 from .protocol import FieldProtocol, ModelProtocol, ParserProtocol
-from .types import JsonDict
-from .utils import UserDefinedType, standardize_custom_type
-
-_schemas_cache: Dict["Type[AvroModel]", dict] = {}
+from .types import BytesLike, FingerprintAlgorithm, JsonDict
+from .utils import UserDefinedType, clear_union_fields_cache
+
+# the schemas of the models as the root of the tree, with the parser that rendered them
+_schemas_cache: Dict[Tuple["Type[AvroModel]", Optional[str]], Tuple[Optional[ParserProtocol], JsonDict]] = {}
+# the parsers created for the models as the root of the tree, after resetting them
+_root_parsers: Dict["Type[AvroModel]", Optional[ParserProtocol]] = {}
+_parsed_schemas_cache: Dict["Type[AvroModel]", dict] = {}
+_union_paths_cache: Dict["Type[AvroModel]", serialization.UnionPaths] = {}
 _dacite_config_cache: Dict["Type[AvroModel]", Config] = {}
+_encoders_cache: Dict["Type[AvroModel]", ModelEncoder] = {}
+_decoders_cache: Dict["Type[AvroModel]", ModelDecoder] = {}
+_trusted_decoders_cache: Dict[Tuple["Type[AvroModel]", Optional[bool]], Optional[ModelDecoder]] = {}
+_dict_decoders_cache: Dict["Type[AvroModel]", Optional[DictDecoder]] = {}
+_canonical_schemas_cache: Dict[Tuple["Type[AvroModel]", Optional[str]], str] = {}
+_fingerprints_cache: Dict[Tuple["Type[AvroModel]", Optional[str], str], str] = {}
+_field_decoders_cache: Dict["Type[AvroModel]", Dict[str, ValueDecoder]] = {}
+_projections_cache: Dict[Tuple["Type[AvroModel]", FrozenSet[str]], JsonDict] = {}
 TSelf = TypeVar("TSelf", bound="AvroModel")
 
 
+def _copy_schema(value: Any) -> Any:
+    # the schemas only have dicts, lists and immutable values, so this is cheaper than `deepcopy`
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_schema(item) for key, item in value.items()}
+    elif value_type is list:
+        return [_copy_schema(item) for item in value]
+    return value
+
+
 class AvroModel:
     _parser: Optional[ParserProtocol] = None
     _parent: Optional[Type["ModelProtocol"]] = None
@@ -76,13 +130,43 @@ class AvroModel:
         """
         return {user_type.model.__name__: user_type.model for user_type in cls._user_defined_types}
 
+    @classmethod
+    def _get_parsed_schema(cls) -> JsonDict:
+        """
+        Returns:
+            Dict[str, Any] with the avro schema of the model parsed by `fastavro`.
+            The schema is parsed only once per model, including the named types
+            of its nested models, and it is reused by every serialization/deserialization
+        """
+        parsed_schema = _parsed_schemas_cache.get(cls)
+        if parsed_schema is None:
+            parsed_schema = serialization.parse_schema(cls._get_schema())
+            _parsed_schemas_cache[cls] = parsed_schema
+            # so the events serialized with `avro-single-object` can find their writer schema
+            serialization.fingerprint_index.register(parsed_schema)
+        return parsed_schema
+
+    @classmethod
+    def _get_union_paths(cls) -> serialization.UnionPaths:
+        """
+        Returns:
+            The paths of the model schema, including its nested models, that lead to
+            unions with more than one record. Only those paths are visited when the
+            records are replaced with models after the deserialization
+        """
+        union_paths = _union_paths_cache.get(cls)
+        if union_paths is None:
+            union_paths = serialization.UnionPaths(cls._get_parsed_schema())
+            _union_paths_cache[cls] = union_paths
+        return union_paths
+
     @classmethod
     def _generate_parser(cls: Type["AvroModel"]) -> Parser:
         return Parser(type=cls, parent=cls._parent or cls)
 
     @classmethod
     def avro_schema(cls: Type["AvroModel"], case_type: Optional[str] = None, **kwargs) -> str:
-        return json.dumps(cls.avro_schema_to_python(case_type=case_type), **kwargs)
+        return json.dumps(cls._get_schema(case_type=case_type), **kwargs)
 
     @classmethod
     def avro_schema_to_python(
@@ -95,8 +179,32 @@ class AvroModel:
             # we recalculate the schema definition to prevent re usages
             cls._parent = parent
             cls._parser = None
-        else:
-            # This happens when an AvroModel is the root of the tree (first class in the hierarchy)
+
+            avro_schema = cls.generate_schema()
+            if case_type is not None:
+                avro_schema = case.case_record(cls._rendered_schema, case_type)  # type: ignore
+            return json.loads(json.dumps(avro_schema))
+
+        # a copy, so the cached schema is not modified by the caller
+        return _copy_schema(cls._get_schema(case_type=case_type))
+
+    @classmethod
+    def _get_schema(cls: Type["AvroModel"], case_type: Optional[str] = None) -> JsonDict:
+        """
+        Returns:
+            The schema of the model as the root of the tree. It is rendered once per `case_type`,
+            and again only when the model has been rendered as a child of another model since then.
+            The schema is shared, so it must not be modified
+        """
+        key = (cls, case_type)
+        # the parser of a base class is inherited, so only the one of the model itself is valid
+        parser = cls.__dict__.get("_parser")
+        cached = _schemas_cache.get(key)
+        if cached is not None and parser is not None and cached[0] is parser:
+            return cached[1]
+
+        if parser is None or parser is not _root_parsers.get(cls):
+            # The parser was not created for the AvroModel as the root of the tree (first class in the hierarchy)
             # Because intermediate schemas can be reused as a root later, we need to reset them
             # Example with A as a root:
             #     A -> B -> C -> D
@@ -107,11 +215,56 @@ class AvroModel:
             cls._reset_parser()
 
         avro_schema = cls.generate_schema()
-
+        _root_parsers[cls] = cls._parser
         if case_type is not None:
             avro_schema = case.case_record(cls._rendered_schema, case_type)  # type: ignore
 
-        return json.loads(json.dumps(avro_schema))
+        schema = json.loads(json.dumps(avro_schema))
+        _schemas_cache[key] = (cls._parser, schema)
+        return schema
+
+    @classmethod
+    def canonical_schema(cls: Type["AvroModel"], case_type: Optional[str] = None) -> str:
+        """
+        The [Parsing Canonical Form](https://avro.apache.org/docs/current/specification/#parsing-canonical-form-for-schemas)
+        of the model schema. It is computed once per model and `case_type`.
+
+        Arguments:
+            case_type: The case to apply to the schema before computing its canonical form
+
+        Returns:
+            The canonical form as a json string
+        """
+        key = (cls, case_type)
+        canonical_schema = _canonical_schemas_cache.get(key)
+        if canonical_schema is None:
+            schema = cls._get_parsed_schema() if case_type is None else cls._get_schema(case_type=case_type)
+            canonical_schema = to_parsing_canonical_form(schema)
+            _canonical_schemas_cache[key] = canonical_schema
+        return canonical_schema
+
+    @classmethod
+    def fingerprint(
+        cls: Type["AvroModel"], algorithm: FingerprintAlgorithm = "CRC-64-AVRO", case_type: Optional[str] = None
+    ) -> str:
+        """
+        The fingerprint of the model schema, computed from its canonical form once per
+        model, `algorithm` and `case_type`, so it can be used as a cache or registry key
+        for every message.
+
+        Arguments:
+            algorithm: `CRC-64-AVRO`, `md5` or `sha256`
+            case_type: The case to apply to the schema before computing its fingerprint
+
+        Returns:
+            The fingerprint as a hex string. For `CRC-64-AVRO` the bytes are in little-endian order
+        """
+        key = (cls, case_type, algorithm)
+        schema_fingerprint = _fingerprints_cache.get(key)
+        if schema_fingerprint is None:
+            schema_fingerprint = fingerprint(cls.canonical_schema(case_type=case_type), algorithm)
+            _fingerprints_cache[key] = schema_fingerprint
+        return schema_fingerprint
 
     @classmethod
     def get_fields(cls: Type["AvroModel"]) -> List[FieldProtocol]:
@@ -127,34 +280,70 @@ class AvroModel:
         cls._user_defined_types = set()
         cls._parser = None
         cls._parent = None
+        clear_union_fields_cache(cls)
 
     @classmethod
     @overload
     def deserialize(
         cls: Type[TSelf],
-        data: bytes,
+        data: BytesLike,
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: Literal[True] = ...,
+        writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
+        fields: None = ...,
+        *,
+        lazy: Literal[True],
+        trusted: Optional[bool] = ...,
+    ) -> LazyRecord[TSelf]: ...
+    @classmethod
+    @overload
+    def deserialize(
+        cls: Type[TSelf],
+        data: BytesLike,
         serialization_type: serialization.SerializationType = ...,
         create_instance: Literal[True] = ...,
         writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
+        fields: None = ...,
+        lazy: Literal[False] = ...,
+        trusted: Optional[bool] = ...,
     ) -> TSelf: ...
     @classmethod
     @overload
     def deserialize(
         cls: Type[TSelf],
-        data: bytes,
+        data: BytesLike,
         serialization_type: serialization.SerializationType = ...,
         create_instance: Literal[False] = ...,
         writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
+        fields: None = ...,
+        lazy: Literal[False] = ...,
+        trusted: Optional[bool] = ...,
     ) -> JsonDict: ...
     @classmethod
     @overload
     def deserialize(
         cls: Type[TSelf],
-        data: bytes,
+        data: BytesLike,
         serialization_type: serialization.SerializationType = ...,
         create_instance: bool = ...,
         writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
-    ) -> Union[TSelf, JsonDict]: ...
+        *,
+        fields: Iterable[str],
+        lazy: Literal[False] = ...,
+        trusted: Optional[bool] = ...,
+    ) -> JsonDict: ...
+    @classmethod
+    @overload
+    def deserialize(
+        cls: Type[TSelf],
+        data: BytesLike,
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: bool = ...,
+        writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
+        fields: Optional[Iterable[str]] = ...,
+        lazy: bool = ...,
+        trusted: Optional[bool] = ...,
+    ) -> Union[TSelf, JsonDict, LazyRecord[TSelf]]: ...
     @classmethod
     def deserialize(
         cls,
@@ -162,44 +351,380 @@ class AvroModel:
         serialization_type="avro",
         create_instance=True,
         writer_schema=None,
+        fields=None,
+        lazy=False,
+        trusted=None,
     ):
+        if lazy:
+            if fields is not None or not create_instance:
+                raise ValueError("`lazy` can not be combined with `fields` or `create_instance=False`")
+            return LazyRecord(
+                cls,
+                data,
+                functools.partial(cls.deserialize_to_python, data, serialization_type, writer_schema),
+                trusted=trusted,
+            )
+
+        if fields is not None:
+            return cls._deserialize_fields(data, serialization_type, create_instance, writer_schema, fields)
+
+        if not create_instance:
+            dict_decoder = cls._get_dict_decoder()
+            if dict_decoder is not None:
+                return dict_decoder(cls._deserialize_raw(data, serialization_type, writer_schema))
+
+        trusted_decoder = cls._get_trusted_decoder(trusted) if create_instance else None
+        if trusted_decoder is not None:
+            # the records of the unions are created from their names as well
+            return trusted_decoder(cls._deserialize_raw(data, serialization_type, writer_schema))
+
         payload = cls.deserialize_to_python(data, serialization_type, writer_schema)
-        obj = cls.parse_obj(payload)
+        obj = cls.parse_obj(payload, trusted=trusted)
 
         if not create_instance:
             return obj.to_dict()
         return obj
 
+    @classmethod
+    def _get_dict_decoder(cls: Type["AvroModel"]) -> Optional[DictDecoder]:
+        if cls in _dict_decoders_cache:
+            return _dict_decoders_cache[cls]
+
+        dict_decoder = _dict_decoders_cache[cls] = cls._generate_dict_decoder()
+        return dict_decoder
+
+    @classmethod
+    def _generate_dict_decoder(cls: Type["AvroModel"]) -> Optional[DictDecoder]:
+        """
+        Returns:
+            The function that returns the same dict as `to_dict` from the `fastavro` output, or None
+            when it can not be predicted from the fields, for example with a custom `dacite_config`
+        """
+        cls.generate_schema()
+        if cls._parser.metadata.dacite_config is not None:  # type: ignore[union-attr]
+            return None
+        return generate_dict_decoder(cls, base_class=AvroModel)
+
+    @classmethod
+    def _deserialize_raw(
+        cls: Type["AvroModel"],
+        data: BytesLike,
+        serialization_type: serialization.SerializationType,
+        writer_schema: Union[JsonDict, Type["AvroModel"], None],
+    ) -> JsonDict:
+        """
+        Returns:
+            The `fastavro` output as it is, with the record names of the unions
+        """
+        if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
+            writer_schema = writer_schema._get_parsed_schema()
+
+        return serialization.deserialize(
+            data=data,
+            schema=cls._get_parsed_schema(),
+            serialization_type=serialization_type,
+            writer_schema=writer_schema,  # type: ignore[arg-type]
+        )
+
+    @classmethod
+    def _get_projection(cls: Type["AvroModel"], fields: Iterable[str]) -> JsonDict:
+        """
+        Returns:
+            The reader schema with only the `fields`, computed once per model and set of fields
+        """
+        key = (cls, frozenset(fields))
+        schema = _projections_cache.get(key)
+        if schema is None:
+            schema = serialization.project_schema(cls._get_parsed_schema(), key[1])
+            _projections_cache[key] = schema
+        return schema
+
+    @classmethod
+    def _get_field_decoders(cls: Type["AvroModel"]) -> Dict[str, ValueDecoder]:
+        """
+        Returns:
+            The decoders that convert the value of every field into the value that an
+            instance of the model has, or None when the value is used as it is
+        """
+        field_decoders = _field_decoders_cache.get(cls)
+        if field_decoders is None:
+            field_decoders = cls._generate_field_decoders()
+            _field_decoders_cache[cls] = field_decoders
+        return field_decoders
+
+    @classmethod
+    def _generate_field_decoders(cls: Type["AvroModel"]) -> Dict[str, ValueDecoder]:
+        return generate_field_decoders(cls, cls._get_dacite_config())
+
+    @classmethod
+    def _deserialize_fields(
+        cls: Type["AvroModel"],
+        data: BytesLike,
+        serialization_type: serialization.SerializationType,
+        create_instance: bool,
+        writer_schema: Union[JsonDict, Type["AvroModel"], None],
+        fields: Iterable[str],
+    ) -> JsonDict:
+        """
+        Deserialize only some fields of an event. The event is read with a reader schema that
+        only has those fields, so the rest of them are skipped and never become python objects.
+
+        Returns:
+            A dict with the fields. Their values are converted like in an instance
+            of the model if `create_instance` is True, otherwise they are returned
+            as they are deserialized
+        """
+        schema = cls._get_projection(fields)
+        if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
+            writer_schema = writer_schema._get_parsed_schema()
+
+        payload = serialization.deserialize(
+            data=data,
+            schema=schema,
+            serialization_type=serialization_type,
+            # without models in the context the unions of records are returned as plain dicts
+            context=cls._get_serialization_context() if create_instance else {},
+            writer_schema=writer_schema or cls._get_parsed_schema(),  # type: ignore[arg-type]
+        )
+        if not create_instance:
+            return payload
+
+        field_decoders = cls._get_field_decoders()
+        return {
+            name: value if field_decoders[name] is None else field_decoders[name](value)  # type: ignore[misc]
+            for name, value in payload.items()
+        }
+
     @classmethod
     def deserialize_to_python(  # This can be used straight with a pydantic dataclass to bypass dacite
         cls: Type["AvroModel"],
-        data: bytes,
+        data: BytesLike,
         serialization_type: serialization.SerializationType = "avro",
         writer_schema: Union[JsonDict, Type["AvroModel"], None] = None,
     ) -> dict:
         if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
-            # mypy does not understand redefinitions
-            writer_schema: JsonDict = writer_schema.avro_schema_to_python()  # type: ignore
+            # the parsed schema is cached per model, so its resolution against this model is cached as well
+            writer_schema: JsonDict = writer_schema._get_parsed_schema()  # type: ignore
 
-        schema = _schemas_cache.get(cls)
-        if schema is None:
-            schema = cls.avro_schema_to_python()
-            _schemas_cache[cls] = schema
         return serialization.deserialize(
             data=data,
-            schema=schema,
+            schema=cls._get_parsed_schema(),
             serialization_type=serialization_type,
             context=cls._get_serialization_context(),
             writer_schema=writer_schema,  # type: ignore
+            union_paths=cls._get_union_paths(),
         )
 
     @classmethod
-    def parse_obj(cls: Type[TSelf], data: Dict) -> TSelf:
+    @overload
+    def deserialize_many(
+        cls: Type[TSelf],
+        data: Iterable[BytesLike],
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: Literal[True] = ...,
+        writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
+        trusted: Optional[bool] = ...,
+    ) -> Iterator[TSelf]: ...
+    @classmethod
+    @overload
+    def deserialize_many(
+        cls: Type[TSelf],
+        data: Iterable[BytesLike],
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: Literal[False] = ...,
+        writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
+        trusted: Optional[bool] = ...,
+    ) -> Iterator[JsonDict]: ...
+    @classmethod
+    @overload
+    def deserialize_many(
+        cls: Type[TSelf],
+        data: Iterable[BytesLike],
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: bool = ...,
+        writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = ...,
+        trusted: Optional[bool] = ...,
+    ) -> Iterator[Union[TSelf, JsonDict]]: ...
+    @classmethod
+    def deserialize_many(
+        cls,
+        data,
+        serialization_type="avro",
+        create_instance=True,
+        writer_schema=None,
+        trusted=None,
+    ):
+        """
+        Lazily deserialize many events written with the same schema, for example a batch
+        of messages consumed at once. The schemas and the serialization context are
+        resolved only once for the whole batch.
+
+        Arguments:
+            data: The events to deserialize
+            serialization_type: `avro`, `avro-json` or `avro-single-object`
+            create_instance: Whether to return instances of the model or python dicts
+            writer_schema: The schema or model used to write the events, if it differs from this model
+            trusted: Whether to create the instances without the dacite hooks, casts and checks.
+                By default `Meta.trusted`
+
+        Returns:
+            An iterator that deserializes every event when it is reached
+        """
+        if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
+            writer_schema = writer_schema._get_parsed_schema()
+
+        dict_decoder = cls._get_trusted_decoder(trusted) if create_instance else cls._get_dict_decoder()
+        if dict_decoder is not None:
+            payloads = serialization.deserialize_many(
+                data=data,
+                schema=cls._get_parsed_schema(),
+                serialization_type=serialization_type,
+                writer_schema=writer_schema,
+            )
+            return (dict_decoder(payload) for payload in payloads)
+
+        payloads = serialization.deserialize_many(
+            data=data,
+            schema=cls._get_parsed_schema(),
+            serialization_type=serialization_type,
+            context=cls._get_serialization_context(),
+            writer_schema=writer_schema,
+            union_paths=cls._get_union_paths(),
+        )
+        parse_obj = cls.parse_obj
+
+        if create_instance:
+            return (parse_obj(payload, trusted=trusted) for payload in payloads)
+        return (parse_obj(payload).to_dict() for payload in payloads)
+
+    @classmethod
+    @overload
+    def read_container(
+        cls: Type[TSelf],
+        path_or_file: Union[str, os.PathLike, IO[bytes]],
+        create_instance: Literal[True] = ...,
+        memory_map: bool = ...,
+    ) -> Iterator[TSelf]: ...
+    @classmethod
+    @overload
+    def read_container(
+        cls: Type[TSelf],
+        path_or_file: Union[str, os.PathLike, IO[bytes]],
+        create_instance: Literal[False] = ...,
+        memory_map: bool = ...,
+    ) -> Iterator[JsonDict]: ...
+    @classmethod
+    @overload
+    def read_container(
+        cls: Type[TSelf],
+        path_or_file: Union[str, os.PathLike, IO[bytes]],
+        create_instance: bool = ...,
+        memory_map: bool = ...,
+    ) -> Iterator[Union[TSelf, JsonDict]]: ...
+    @classmethod
+    def read_container(
+        cls,
+        path_or_file,
+        create_instance=True,
+        memory_map=False,
+    ):
+        """
+        Lazily read the records of an avro object container file as instances of the model.
+        Blocks are decoded on demand and the schema stored in the file header is resolved
+        against the model schema, so files written with an older compatible schema can be read.
+
+        Arguments:
+            path_or_file: Path of the file or a binary file-like object
+            create_instance: Whether to return instances of the model or python dicts
+            memory_map: Whether to memory-map the file instead of reading it through a file buffer
+
+        Returns:
+            An iterator that decodes every record when it is reached
+        """
+        payloads = serialization.read_container(
+            path_or_file,
+            schema=cls._get_parsed_schema(),
+            context=cls._get_serialization_context(),
+            memory_map=memory_map,
+        )
+        parse_obj = cls.parse_obj
+
+        if create_instance:
+            return (parse_obj(payload) for payload in payloads)
+        return (parse_obj(payload).to_dict() for payload in payloads)
+
+    @classmethod
+    def parse_obj(cls: Type[TSelf], data: Dict, trusted: Optional[bool] = None) -> TSelf:
+        """
+        Create an instance of the model from a dict
+
+        Arguments:
+            data: The values of the fields
+            trusted: Whether the values already have the right types, as the `fastavro` output does,
+                so the instance is created without the dacite hooks, casts and checks. By default `Meta.trusted`
+
+        Returns:
+            An instance of the model
+        """
+        trusted_decoder = cls._get_trusted_decoder(trusted)
+        if trusted_decoder is not None:
+            return trusted_decoder(data)  # type: ignore[return-value]
+
+        decoder = _decoders_cache.get(cls)
+        if decoder is None:
+            decoder = cls._generate_decoder()
+            _decoders_cache[cls] = decoder
+        return decoder(data)  # type: ignore[return-value]
+
+    @classmethod
+    def _get_trusted_decoder(cls: Type["AvroModel"], trusted: Optional[bool] = None) -> Optional[ModelDecoder]:
+        """
+        Returns:
+            The decoder that creates the instances without the dacite hooks, casts and checks when
+            `trusted`, or `Meta.trusted` if it is None, is set. None when it is not set or when the
+            conversions can not be decided from the field types, then the dacite decoder is used
+        """
+        key = (cls, trusted)
+        if key in _trusted_decoders_cache:
+            return _trusted_decoders_cache[key]
+
+        if trusted is None:
+            cls.generate_schema()
+            metadata = cls._parser.metadata  # type: ignore[union-attr]
+            decoder = cls._get_trusted_decoder(True) if metadata.trusted else None
+        elif trusted:
+            decoder = cls._generate_trusted_decoder()
+        else:
+            decoder = None
+
+        _trusted_decoders_cache[key] = decoder
+        return decoder
+
+    @classmethod
+    def _generate_trusted_decoder(cls: Type["AvroModel"]) -> Optional[ModelDecoder]:
+        return generate_trusted_decoder(cls, base_class=AvroModel)
+
+    @classmethod
+    def _get_dacite_config(cls: Type["AvroModel"]) -> Config:
         config = _dacite_config_cache.get(cls)
         if config is None:
             config = generate_dacite_config(cls)
             _dacite_config_cache[cls] = config
-        return from_dict(data_class=cls, data=data, config=config)
+        return config
+
+    @classmethod
+    def _generate_decoder(cls: Type["AvroModel"]) -> ModelDecoder:
+        """
+        Returns:
+            The function that creates instances of the model from a dict. It is `dacite.from_dict`
+            unless the model opts in to a compiled decoder with `Meta.compiled_decoder`
+        """
+        config = cls._get_dacite_config()
+
+        cls.generate_schema()
+        if cls._parser.metadata.compiled_decoder:  # type: ignore[union-attr]
+            return generate_decoder(cls, config)
+        return functools.partial(from_dict, cls, config=config)
 
     @classmethod
     def fake(cls: Type["AvroModel"], **data: Any) -> "AvroModel":
@@ -217,29 +742,133 @@ class AvroModel:
         return from_dict(data_class=cls, data=payload, config=generate_dacite_config(cls))
 
     def asdict(self) -> JsonDict:
-        return {
-            field.name: standardize_custom_type(
-                field_name=field.name, value=getattr(self, field.name), model=self, base_class=AvroModel
-            )
-            for field in dataclasses.fields(self)  # type: ignore[arg-type]
-        }
+        return type(self)._get_encoder()(self)
 
-    def serialize(self, serialization_type: serialization.SerializationType = "avro") -> bytes:
-        klass = type(self)
-        schema = _schemas_cache.get(klass)
-        if schema is None:
-            schema = self.avro_schema_to_python()
-            _schemas_cache[klass] = schema
+    @classmethod
+    def _get_encoder(cls: Type["AvroModel"]) -> ModelEncoder:
+        """
+        Returns:
+            The function that converts the instances of the model into their avro representation
+        """
+        encoder = _encoders_cache.get(cls)
+        if encoder is None:
+            encoder = cls._generate_encoder()
+            _encoders_cache[cls] = encoder
+        return encoder
+
+    @classmethod
+    def _generate_encoder(cls: Type["AvroModel"]) -> ModelEncoder:
+        return generate_encoder(cls, base_class=AvroModel)
 
+    def serialize(self, serialization_type: serialization.SerializationType = "avro") -> bytes:
         return serialization.serialize(
             self.asdict(),
-            schema,
+            self._get_parsed_schema(),
             serialization_type=serialization_type,
         )
 
+    def serialize_into(
+        self,
+        out: Union[bytearray, IO[bytes]],
+        serialization_type: serialization.SerializationType = "avro",
+    ) -> int:
+        """
+        Serialize the instance appending the event to a buffer owned by the caller,
+        for example to build a frame of many events without intermediate `bytes` objects.
+
+        Arguments:
+            out: A `bytearray` to extend or a binary file-like object, like `io.BytesIO`,
+                to write at its current position
+            serialization_type: `avro`, `avro-json` or `avro-single-object`
+
+        Returns:
+            The amount of bytes written
+        """
+        return serialization.serialize_into(
+            self.asdict(),
+            self._get_parsed_schema(),
+            out,
+            serialization_type=serialization_type,
+        )
+
+    @classmethod
+    @overload
+    def serialize_many(
+        cls: Type[TSelf],
+        instances: Iterable[TSelf],
+        serialization_type: serialization.SerializationType = ...,
+        sink: None = ...,
+    ) -> List[bytes]: ...
+    @classmethod
+    @overload
+    def serialize_many(
+        cls: Type[TSelf],
+        instances: Iterable[TSelf],
+        serialization_type: serialization.SerializationType = ...,
+        sink: Callable[[bytes], Any] = ...,
+    ) -> None: ...
+    @classmethod
+    def serialize_many(
+        cls,
+        instances,
+        serialization_type="avro",
+        sink=None,
+    ):
+        """
+        Serialize many instances of the model at once. The schema is resolved only once
+        and all the events are written into a single reusable buffer.
+
+        Arguments:
+            instances: The instances to serialize
+            serialization_type: `avro`, `avro-json` or `avro-single-object`
+            sink: Optional callable that receives every event instead of returning them,
+                for example a producer `send` method
+
+        Returns:
+            The list of events, in the same order as the instances, or None if a `sink` was provided
+        """
+        return serialization.serialize_many(
+            (instance.asdict() for instance in instances),
+            cls._get_parsed_schema(),
+            serialization_type=serialization_type,
+            sink=sink,
+        )
+
+    @classmethod
+    def write_container(
+        cls: Type[TSelf],
+        fileobj: IO[bytes],
+        records: Iterable[TSelf],
+        codec: str = "null",
+        sync_interval: int = serialization.DEFAULT_SYNC_INTERVAL,
+        codec_compression_level: Optional[int] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Stream instances of the model into an avro object container file.
+        The records are consumed lazily and written in blocks, so a generator
+        can be used to write datasets that do not fit in memory.
+
+        Arguments:
+            fileobj: The binary file-like object to write to
+            records: The instances to write
+            codec: Compression codec, for example `null`, `deflate` or `snappy`
+            sync_interval: Size in bytes of every block
+            codec_compression_level: Compression level for the codec, if it supports one
+            metadata: Extra metadata to store in the file header
+        """
+        serialization.write_container(
+            fileobj,
+            (record.asdict() for record in records),
+            cls._get_parsed_schema(),
+            codec=codec,
+            sync_interval=sync_interval,
+            codec_compression_level=codec_compression_level,
+            metadata=metadata,
+        )
+
     def validate(self) -> bool:
-        schema = self.avro_schema_to_python()
-        return validate(self.asdict(), schema)
+        return validate(self.asdict(), self._get_parsed_schema())
 
     def to_dict(self) -> JsonDict:
         return dataclasses.asdict(self)  # type: ignore
@@ -4,12 +4,16 @@ import typing
 from collections import OrderedDict
 from typing import Literal, overload
 
-from .types import JsonDict, SerializationType
+from .types import BytesLike, FingerprintAlgorithm, JsonDict, SerializationType
 from .utils import (
     SchemaMetadata,
     UserDefinedType,
 )
 
+if typing.TYPE_CHECKING:
+    from .lazy import LazyRecord  # pragma: no cover
+    from .serialization import UnionPaths  # pragma: no cover
+
 CT = typing.TypeVar("CT", bound="ModelProtocol")
 # This means that when we have List[Protocol] can be use when we have List[ParserProtocol]
 CP = typing.TypeVar("CP", bound="ParserProtocol", covariant=True)
@@ -110,6 +114,12 @@ class ModelProtocol(typing.Protocol[CT]):
     @classmethod
     def _get_serialization_context(cls: typing.Type[CT]) -> JsonDict: ...
 
+    @classmethod
+    def _get_parsed_schema(cls: typing.Type[CT]) -> JsonDict: ...
+
+    @classmethod
+    def _get_union_paths(cls: typing.Type[CT]) -> "UnionPaths": ...
+
     @classmethod
     def _generate_parser(cls: typing.Type[CT]) -> ParserProtocol: ...
 
@@ -123,6 +133,14 @@ class ModelProtocol(typing.Protocol[CT]):
         case_type: typing.Optional[str] = None,
     ) -> typing.Dict[str, typing.Any]: ...
 
+    @classmethod
+    def canonical_schema(cls: typing.Type[CT], case_type: typing.Optional[str] = None) -> str: ...
+
+    @classmethod
+    def fingerprint(
+        cls: typing.Type[CT], algorithm: FingerprintAlgorithm = "CRC-64-AVRO", case_type: typing.Optional[str] = None
+    ) -> str: ...
+
     @classmethod
     def get_fields(cls: typing.Type[CT]) -> typing.List[FieldProtocol]: ...
 
@@ -133,42 +151,79 @@ class ModelProtocol(typing.Protocol[CT]):
     @overload
     def deserialize(
         cls: typing.Type[CT],
-        data: bytes,
+        data: BytesLike,
+        serialization_type: SerializationType = "avro",
+        create_instance: Literal[True] = ...,
+        writer_schema: typing.Optional[typing.Union[JsonDict, typing.Type[CT]]] = None,
+        fields: None = None,
+        *,
+        lazy: Literal[True],
+        trusted: typing.Optional[bool] = None,
+    ) -> "LazyRecord": ...
+
+    @classmethod
+    @overload
+    def deserialize(
+        cls: typing.Type[CT],
+        data: BytesLike,
         serialization_type: SerializationType = "avro",
         create_instance: Literal[True] = ...,
         writer_schema: typing.Optional[typing.Union[JsonDict, typing.Type[CT]]] = None,
+        fields: None = None,
+        lazy: Literal[False] = False,
+        trusted: typing.Optional[bool] = None,
     ) -> CT: ...
 
     @classmethod
     @overload
     def deserialize(
         cls: typing.Type[CT],
-        data: bytes,
+        data: BytesLike,
         serialization_type: SerializationType = "avro",
         create_instance: Literal[False] = ...,
         writer_schema: typing.Optional[typing.Union[JsonDict, typing.Type[CT]]] = None,
+        fields: None = None,
+        lazy: Literal[False] = False,
+        trusted: typing.Optional[bool] = None,
+    ) -> JsonDict: ...
+
+    @classmethod
+    @overload
+    def deserialize(
+        cls: typing.Type[CT],
+        data: BytesLike,
+        serialization_type: SerializationType = "avro",
+        create_instance: bool = ...,
+        writer_schema: typing.Optional[typing.Union[JsonDict, typing.Type[CT]]] = None,
+        *,
+        fields: typing.Iterable[str],
+        lazy: Literal[False] = False,
+        trusted: typing.Optional[bool] = None,
     ) -> JsonDict: ...
 
     @classmethod
     @overload
     def deserialize(
         cls: typing.Type[CT],
-        data: bytes,
+        data: BytesLike,
         serialization_type: SerializationType = "avro",
         create_instance: bool = ...,
         writer_schema: typing.Optional[typing.Union[JsonDict, typing.Type[CT]]] = None,
-    ) -> typing.Union[JsonDict, CT]: ...
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        lazy: bool = False,
+        trusted: typing.Optional[bool] = None,
+    ) -> typing.Union[JsonDict, CT, "LazyRecord"]: ...
 
     @classmethod
     def deserialize_to_python(  # This can be used straight with a pydantic dataclass to bypass dacite
         cls: typing.Type[CT],
-        data: bytes,
+        data: BytesLike,
         serialization_type: SerializationType = "avro",
         writer_schema: typing.Union[JsonDict, typing.Type[CT], None] = None,
     ) -> dict: ...
 
     @classmethod
-    def parse_obj(cls: typing.Type[CT], data: typing.Dict) -> CT: ...
+    def parse_obj(cls: typing.Type[CT], data: typing.Dict, trusted: typing.Optional[bool] = None) -> CT: ...
 
     @classmethod
     def fake(cls: typing.Type[CT], **data: typing.Any) -> CT: ...
@@ -1,20 +1,105 @@
+import datetime
+import decimal
+import inspect
 import json
-from typing import Any, Dict, Type
+import typing
+import uuid
+from typing import Any, Dict, FrozenSet, Iterable, List, Literal, Optional, Type, TypeVar, Union, overload
 
 from fastavro.validation import validate
 
 from dataclasses_avroschema import AvroModel, serialization
-from dataclasses_avroschema.types import JsonDict
-from dataclasses_avroschema.utils import standardize_custom_type
+from dataclasses_avroschema.decoders import DictDecoder, ValueDecoder, generate_dict_decoder
+from dataclasses_avroschema.encoders import ModelEncoder, generate_encoder
+from dataclasses_avroschema.types import BytesLike, JsonDict
+from dataclasses_avroschema.utils import is_union, standardize_custom_type
 
 from .parser import PydanticParser
 
 try:
-    from pydantic import BaseModel  # pragma: no cover
+    from pydantic import BaseModel, TypeAdapter  # pragma: no cover
 except ImportError as ex:  # pragma: no cover
     raise Exception("pydantic must be installed in order to use AvroBaseModel") from ex  # pragma: no cover
 
 
+TSelf = TypeVar("TSelf", bound="AvroBaseModel")
+
+# The adapters that validate a batch of records of a model in a single pydantic-core call
+_batch_adapters: Dict[Type["AvroBaseModel"], TypeAdapter] = {}
+
+# The types that pydantic returns as `fastavro` reads them, others can be converted by the validation
+PLAIN_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+    decimal.Decimal,
+    uuid.UUID,
+)
+
+
+def _field_types(model: Type["AvroBaseModel"]) -> Optional[Dict[str, Any]]:
+    decorators = model.__pydantic_decorators__
+    if (
+        model.model_config.get("use_enum_values")
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or model.model_computed_fields
+        or any(field.exclude for field in model.model_fields.values())
+    ):
+        # `model_dump` does not return the fields as they are
+        return None
+    return {name: field.annotation for name, field in model.model_fields.items()}
+
+
+def _is_dumped(annotation: Any, seen: FrozenSet[type]) -> bool:
+    """
+    Whether `model_dump` returns the values of the type as `asdict` does. The enums,
+    the custom types and the models with serializers or `json_encoders` are not.
+    """
+    if annotation in PLAIN_TYPES or annotation is type(None):
+        return True
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Literal:
+        return all(type(arg) in PLAIN_TYPES for arg in args)
+    elif origin is typing.Annotated:
+        return _is_dumped(args[0], seen)
+    elif origin in (list, tuple, dict) or is_union(annotation):
+        return bool(args) and all(arg is Ellipsis or _is_dumped(arg, seen) for arg in args)
+    elif isinstance(annotation, type) and issubclass(annotation, AvroBaseModel):
+        return annotation not in seen and len(_dumped_fields(annotation, seen)) == len(annotation.model_fields)
+    return False
+
+
+def _is_record(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _dumped_fields(model: Type["AvroBaseModel"], seen: FrozenSet[type] = frozenset()) -> FrozenSet[str]:
+    """
+    Returns:
+        The fields that can be converted to their avro form by `model_dump`
+    """
+    field_types = _field_types(model)
+    if field_types is None or model.model_config.get("json_encoders"):
+        return frozenset()
+
+    seen = seen | {model}
+    return frozenset(
+        name
+        for name, annotation in field_types.items()
+        if _is_dumped(annotation, seen)
+        # the records of the unions are sent with their names
+        and not (is_union(annotation) and any(_is_record(arg) for arg in typing.get_args(annotation)))
+    )
+
+
 class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
     @classmethod
     def json_schema(cls: Type["AvroBaseModel"], *args: Any, **kwargs: Any) -> str:
@@ -36,12 +121,10 @@ class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
                 data[k] = encode_method(v)
         return data
 
-    def asdict(self) -> JsonDict:
+    def _standardize_asdict(self) -> JsonDict:
         """
-        Returns this model in dictionary form. This method differs from
-        pydantic's dict by converting all values to their Avro representation.
-        It also doesn't provide the exclude, include, by_alias, etc.
-        parameters that dict provides.
+        Returns this model in dictionary form converting the values
+        with the user-defined pydantic json_encoders first
         """
         return {
             field_name: standardize_custom_type(
@@ -51,9 +134,128 @@ class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
         }
 
     @classmethod
-    def parse_obj(cls: Type["AvroBaseModel"], data: Dict) -> "AvroBaseModel":
+    def _generate_encoder(cls: Type["AvroBaseModel"]) -> ModelEncoder:
+        """
+        Returns:
+            The compiled encoder. The fields that `model_dump` returns in their avro form are
+            converted by pydantic-core, the enums and the records of the unions by the precomputed
+            field encoders. The models with `json_encoders` use the generic path
+        """
+        if cls.model_config.get("json_encoders"):
+            return cls._standardize_asdict  # type: ignore[return-value]
+
+        return generate_encoder(
+            cls,
+            base_class=AvroBaseModel,
+            field_names=list(cls.model_fields),
+            dumped_fields=_dumped_fields(cls),
+        )
+
+    @classmethod
+    def parse_obj(cls: Type["AvroBaseModel"], data: Dict, trusted: Optional[bool] = None) -> "AvroBaseModel":
+        # pydantic does not use the dacite hooks, the instances are always validated
         return cls.model_validate(obj=data)
 
+    @classmethod  # type: ignore[override]
+    @overload
+    def deserialize_many(
+        cls: Type[TSelf],
+        data: Iterable[BytesLike],
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: Literal[True] = ...,
+        writer_schema: Optional[Union[JsonDict, Type[AvroModel]]] = ...,
+        trusted: Optional[bool] = ...,
+    ) -> List[TSelf]: ...
+    @classmethod
+    @overload
+    def deserialize_many(
+        cls: Type[TSelf],
+        data: Iterable[BytesLike],
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: Literal[False] = ...,
+        writer_schema: Optional[Union[JsonDict, Type[AvroModel]]] = ...,
+        trusted: Optional[bool] = ...,
+    ) -> List[JsonDict]: ...
+    @classmethod
+    @overload
+    def deserialize_many(
+        cls: Type[TSelf],
+        data: Iterable[BytesLike],
+        serialization_type: serialization.SerializationType = ...,
+        create_instance: bool = ...,
+        writer_schema: Optional[Union[JsonDict, Type[AvroModel]]] = ...,
+        trusted: Optional[bool] = ...,
+    ) -> List[Union[TSelf, JsonDict]]: ...
+    @classmethod
+    def deserialize_many(
+        cls,
+        data,
+        serialization_type="avro",
+        create_instance=True,
+        writer_schema=None,
+        trusted=None,
+    ):
+        """
+        Deserialize many events written with the same schema, for example a batch of messages
+        consumed at once. Unlike `AvroModel.deserialize_many` the whole batch is decoded and
+        the instances are validated in a single pydantic-core call, so a list is returned.
+        The errors of the `ValidationError` are located by the index of the event in the batch.
+
+        Arguments:
+            data: The events to deserialize
+            serialization_type: `avro`, `avro-json` or `avro-single-object`
+            create_instance: Whether to return instances of the model or python dicts
+            writer_schema: The schema or model used to write the events, if it differs from this model
+            trusted: Not used, the pydantic instances are always validated
+
+        Returns:
+            The list of instances or dicts, in the same order as the events
+        """
+        if not create_instance:
+            return list(
+                super().deserialize_many(data, serialization_type, create_instance=False, writer_schema=writer_schema)
+            )
+
+        if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
+            writer_schema = writer_schema._get_parsed_schema()
+
+        payloads = serialization.deserialize_many(
+            data=data,
+            schema=cls._get_parsed_schema(),
+            serialization_type=serialization_type,
+            context=cls._get_serialization_context(),
+            writer_schema=writer_schema,
+            union_paths=cls._get_union_paths(),
+        )
+        return cls._get_batch_adapter().validate_python(list(payloads))
+
+    @classmethod
+    def _get_batch_adapter(cls: Type["AvroBaseModel"]) -> TypeAdapter:
+        adapter = _batch_adapters.get(cls)
+        if adapter is None:
+            adapter = _batch_adapters[cls] = TypeAdapter(List[cls])  # type: ignore[valid-type]
+        return adapter
+
+    @classmethod
+    def _generate_trusted_decoder(cls: Type["AvroBaseModel"]) -> None:
+        return None
+
+    @classmethod
+    def _generate_field_decoders(cls: Type["AvroBaseModel"]) -> Dict[str, ValueDecoder]:
+        return {
+            name: TypeAdapter(field.annotation).validate_python  # type: ignore[arg-type]
+            for name, field in cls.model_fields.items()
+        }
+
+    @classmethod
+    def _generate_dict_decoder(cls: Type["AvroBaseModel"]) -> Optional[DictDecoder]:
+        return generate_dict_decoder(
+            cls,
+            base_class=AvroBaseModel,
+            field_types=_field_types,  # type: ignore[arg-type]
+            plain_types=PLAIN_TYPES,
+        )
+
     def to_dict(self) -> JsonDict:
         return self.model_dump()
 
@@ -62,11 +264,9 @@ class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
         Overrides the base AvroModel's serialize method to inject this
         class's standardization factory method
         """
-        schema = self.avro_schema_to_python()
-
         return serialization.serialize(
             self.asdict(),
-            schema,
+            self._get_parsed_schema(),
             serialization_type=serialization_type,
         )
 
@@ -74,8 +274,7 @@ class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
         """
         Validate that instance matches the avro schema
         """
-        schema = self.avro_schema_to_python()
-        return validate(self.asdict(), schema)
+        return validate(self.asdict(), self._get_parsed_schema())
 
     @classmethod
     def fake(cls: Type["AvroBaseModel"], **data: Any) -> "AvroBaseModel":
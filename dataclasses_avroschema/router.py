@@ -0,0 +1,193 @@
+import typing
+from typing import Literal, overload
+
+from . import serialization
+from .exceptions import UnknownModel
+from .schema_registry import CONFLUENT_HEADER_SIZE, ConfluentSerializer, read_confluent_header
+from .types import BytesLike, JsonDict, SerializationType
+
+if typing.TYPE_CHECKING:
+    from .main import AvroModel  # pragma: no cover
+
+TModel = typing.TypeVar("TModel", bound="AvroModel")
+
+# The model that reads an event, the schema that the event was written with
+# (None when it is the schema of the model) and where the avro body starts
+Route = typing.Tuple[typing.Type["AvroModel"], typing.Optional[JsonDict], int]
+
+
+class ModelRouter:
+    """
+    Deserialize streams that carry events of many models. The model of every event is
+    found with a dict lookup using:
+
+    - the fingerprint of the `avro-single-object` header, by default
+    - the schema id of the confluent header, when a `serializer` is provided
+    - the record fullname returned by a `key` function, when it is provided.
+        In this case the events are not framed and they are read with `serialization_type`
+
+    The routes are cached per header, so after the first event of every writer schema
+    routing an event costs a single dict access.
+
+    Arguments:
+        models: The models to register
+        serializer: The serializer to read the events framed with the confluent wire format
+        key: A function that returns the record fullname of an event
+        serialization_type: The serialization type of the events routed with `key`
+    """
+
+    def __init__(
+        self,
+        models: typing.Iterable[typing.Type["AvroModel"]] = (),
+        *,
+        serializer: typing.Optional[ConfluentSerializer] = None,
+        key: typing.Optional[typing.Callable[[BytesLike], str]] = None,
+        serialization_type: SerializationType = "avro",
+    ) -> None:
+        if serializer is not None and key is not None:
+            raise ValueError("Events can be routed either by the confluent header or by a key, not both")
+
+        self.serializer = serializer
+        self.key = key
+        self.serialization_type = serialization_type
+        self._models: typing.Dict[str, typing.Type["AvroModel"]] = {}
+        self._routes: typing.Dict[bytes, Route] = {}
+
+        for model in models:
+            self.register(model)
+
+    def register(self, model: typing.Type[TModel]) -> typing.Type[TModel]:
+        """
+        Register a model by its fullname and the fullname of its record, which are
+        different when the model has a `schema_name`. It can be used as a class decorator.
+
+        Returns:
+            The model
+        """
+        self._models[model.get_fullname()] = model
+        self._models.setdefault(model._get_parsed_schema()["name"], model)
+
+        if self.serializer is None and self.key is None:
+            self._routes[serialization.SINGLE_OBJECT_MARKER + bytes.fromhex(model.fingerprint())] = (
+                model,
+                None,
+                serialization.SINGLE_OBJECT_HEADER_SIZE,
+            )
+        return model
+
+    def get_model(self, name: str) -> typing.Type["AvroModel"]:
+        """
+        Returns:
+            The model registered with the fullname
+
+        Raises:
+            UnknownModel: if there is no model registered with the fullname
+        """
+        model = self._models.get(name)
+        if model is None:
+            raise UnknownModel(name)
+        return model
+
+    def route(self, data: BytesLike) -> Route:
+        """
+        Returns:
+            The model to read the event with, the writer schema of the event, or None
+            when it is the schema of the model, and the offset of the avro body
+        """
+        if self.key is not None:
+            return self.get_model(self.key(data)), None, 0
+
+        if self.serializer is not None:
+            header = bytes(data[:CONFLUENT_HEADER_SIZE])
+            route = self._routes.get(header)
+            if route is None:
+                writer_schema = self.serializer.get_schema(read_confluent_header(header))
+                route = self._add_route(header, writer_schema, CONFLUENT_HEADER_SIZE)
+            return route
+
+        header = bytes(data[: serialization.SINGLE_OBJECT_HEADER_SIZE])
+        route = self._routes.get(header)
+        if route is None:
+            schema_fingerprint = serialization.read_single_object_header(header)
+            writer_schema = serialization.fingerprint_index.get(schema_fingerprint)
+            route = self._add_route(header, writer_schema, serialization.SINGLE_OBJECT_HEADER_SIZE)
+        return route
+
+    def _add_route(self, header: bytes, writer_schema: JsonDict, offset: int) -> Route:
+        model = self.get_model(writer_schema["name"])
+        if writer_schema is model._get_parsed_schema():
+            route: Route = (model, None, offset)
+        else:
+            route = (model, writer_schema, offset)
+
+        self._routes[header] = route
+        return route
+
+    def _body_serialization_type(self) -> SerializationType:
+        return self.serialization_type if self.key is not None else "avro"
+
+    @overload
+    def deserialize(self, data: BytesLike, create_instance: Literal[True] = ...) -> "AvroModel": ...
+    @overload
+    def deserialize(self, data: BytesLike, create_instance: Literal[False] = ...) -> JsonDict: ...
+    def deserialize(self, data, create_instance=True):
+        """
+        Deserialize an event with the model that it is routed to
+
+        Arguments:
+            data: The event to deserialize
+            create_instance: Whether to return an instance of the model or a python dict
+
+        Returns:
+            An instance of the model or a python dict
+        """
+        model, writer_schema, offset = self.route(data)
+        return model.deserialize(
+            memoryview(data)[offset:] if offset else data,
+            serialization_type=self._body_serialization_type(),
+            create_instance=create_instance,
+            writer_schema=writer_schema,
+        )
+
+    @overload
+    def deserialize_many(
+        self, data: typing.Iterable[BytesLike], create_instance: Literal[True] = ...
+    ) -> typing.List["AvroModel"]: ...
+    @overload
+    def deserialize_many(
+        self, data: typing.Iterable[BytesLike], create_instance: Literal[False] = ...
+    ) -> typing.List[JsonDict]: ...
+    def deserialize_many(self, data, create_instance=True):
+        """
+        Deserialize a batch of events of many models. The events are grouped per model and
+        writer schema, and every group is read with the `deserialize_many` of its model,
+        so the schemas are resolved once per group.
+
+        Arguments:
+            data: The events to deserialize
+            create_instance: Whether to return instances of the models or python dicts
+
+        Returns:
+            The deserialized events, in the same order as `data`
+        """
+        groups: typing.Dict[typing.Tuple[typing.Type["AvroModel"], int], typing.List[int]] = {}
+        writer_schemas: typing.Dict[int, typing.Optional[JsonDict]] = {}
+        bodies = []
+
+        for index, event in enumerate(data):
+            model, writer_schema, offset = self.route(event)
+            groups.setdefault((model, id(writer_schema)), []).append(index)
+            writer_schemas[id(writer_schema)] = writer_schema
+            bodies.append(memoryview(event)[offset:] if offset else event)
+
+        results: typing.List[typing.Any] = [None] * len(bodies)
+        for (model, writer_schema_id), indexes in groups.items():
+            payloads = model.deserialize_many(
+                [bodies[index] for index in indexes],
+                serialization_type=self._body_serialization_type(),
+                create_instance=create_instance,
+                writer_schema=writer_schemas[writer_schema_id],
+            )
+            for index, payload in zip(indexes, payloads):
+                results[index] = payload
+        return results
@@ -0,0 +1,192 @@
+import json
+import os
+import typing
+from typing import Literal, overload
+
+from .exceptions import UnknownSchemaId
+from .serialization import parse_schema
+from .types import BytesLike, JsonDict
+
+if typing.TYPE_CHECKING:
+    from .main import AvroModel  # pragma: no cover
+
+TModel = typing.TypeVar("TModel", bound="AvroModel")
+
+# Confluent wire format: a zero byte followed by the schema id as a 4 bytes big-endian integer
+MAGIC_BYTE = b"\x00"
+CONFLUENT_HEADER_SIZE = 5
+
+
+class SchemaRegistry(typing.Protocol):
+    """
+    Interface of the schema registries used by `ConfluentSerializer`.
+    A client of a remote registry only needs to implement these two methods.
+    """
+
+    def get_schema(self, schema_id: int) -> JsonDict:
+        """
+        Returns:
+            The schema registered with the id
+
+        Raises:
+            UnknownSchemaId: if there is no schema with the id
+        """
+        ...  # pragma: no cover
+
+    def register_schema(self, subject: str, schema: JsonDict) -> int:
+        """
+        Register a schema under a subject. Registering a schema that already exists returns its id.
+
+        Returns:
+            The id of the schema
+        """
+        ...  # pragma: no cover
+
+
+class LocalSchemaRegistry:
+    """
+    Schema registry kept in memory, useful for tests and local development.
+    When a `path` is provided the schemas are loaded from a json file, if it exists,
+    and the file is written every time a new schema is registered.
+    """
+
+    def __init__(self, path: typing.Optional[typing.Union[str, os.PathLike]] = None) -> None:
+        self.path = path
+        self.schemas: typing.Dict[int, JsonDict] = {}
+        self.subjects: typing.Dict[str, typing.List[int]] = {}
+
+        if path is not None and os.path.exists(path):
+            with open(path) as registry_file:
+                content = json.load(registry_file)
+            self.schemas = {int(schema_id): schema for schema_id, schema in content["schemas"].items()}
+            self.subjects = content["subjects"]
+
+    def get_schema(self, schema_id: int) -> JsonDict:
+        schema = self.schemas.get(schema_id)
+        if schema is None:
+            raise UnknownSchemaId(schema_id)
+        return schema
+
+    def register_schema(self, subject: str, schema: JsonDict) -> int:
+        for schema_id, registered_schema in self.schemas.items():
+            if registered_schema == schema:
+                break
+        else:
+            schema_id = len(self.schemas) + 1
+            self.schemas[schema_id] = schema
+
+        subject_ids = self.subjects.setdefault(subject, [])
+        if schema_id not in subject_ids:
+            subject_ids.append(schema_id)
+            self.save()
+        return schema_id
+
+    def save(self) -> None:
+        if self.path is not None:
+            with open(self.path, "w") as registry_file:
+                json.dump({"schemas": self.schemas, "subjects": self.subjects}, registry_file)
+
+
+def read_confluent_header(data: BytesLike) -> int:
+    """
+    Returns:
+        The schema id of an event framed with the confluent wire format
+
+    Raises:
+        ValueError: if the event does not start with the magic byte
+    """
+    if len(data) < CONFLUENT_HEADER_SIZE or data[0] != 0:
+        raise ValueError("The event is not framed with the confluent wire format")
+    return int.from_bytes(data[1:CONFLUENT_HEADER_SIZE], "big")
+
+
+class ConfluentSerializer:
+    """
+    Serialize and deserialize models framed with the confluent wire format:
+    the magic byte and the 4 bytes id of the writer schema followed by the avro body.
+
+    The schema ids of the models and the schemas fetched from the registry, already
+    parsed, are cached, so after the first event of every schema there is no registry I/O.
+    The writer schemas are resolved against the reader models like any other `writer_schema`,
+    with `schema_resolution_cache`.
+
+    Arguments:
+        registry: The registry to get and register the schemas
+    """
+
+    def __init__(self, registry: SchemaRegistry) -> None:
+        self.registry = registry
+        self._schemas: typing.Dict[int, JsonDict] = {}
+        self._schema_ids: typing.Dict[typing.Tuple[typing.Type["AvroModel"], str], int] = {}
+
+    def get_schema(self, schema_id: int) -> JsonDict:
+        """
+        Returns:
+            The parsed schema with the id, fetched from the registry only the first time
+        """
+        schema = self._schemas.get(schema_id)
+        if schema is None:
+            schema = self._schemas[schema_id] = parse_schema(self.registry.get_schema(schema_id))
+        return schema
+
+    def get_schema_id(self, model: typing.Type["AvroModel"], subject: typing.Optional[str] = None) -> int:
+        """
+        Returns:
+            The id of the model schema, registered under the subject only the first time.
+            The subject is the fullname of the record by default
+        """
+        subject = subject or model._get_parsed_schema()["name"]
+        key = (model, subject)
+
+        schema_id = self._schema_ids.get(key)
+        if schema_id is None:
+            schema_id = self.registry.register_schema(subject, model.avro_schema_to_python())
+            self._schema_ids[key] = schema_id
+            # the events of the model are read without resolution when the model is the reader
+            self._schemas.setdefault(schema_id, model._get_parsed_schema())
+        return schema_id
+
+    def serialize(self, instance: "AvroModel", subject: typing.Optional[str] = None) -> bytes:
+        """
+        Serialize an instance prepending the confluent header
+
+        Arguments:
+            instance: The instance to serialize
+            subject: The subject to register the schema under, the fullname of the record by default
+
+        Returns:
+            The framed event
+        """
+        schema_id = self.get_schema_id(type(instance), subject)
+        return MAGIC_BYTE + schema_id.to_bytes(4, "big") + instance.serialize()
+
+    @overload
+    def deserialize(
+        self, data: BytesLike, model: typing.Type[TModel], create_instance: Literal[True] = ...
+    ) -> TModel: ...
+    @overload
+    def deserialize(
+        self, data: BytesLike, model: typing.Type[TModel], create_instance: Literal[False] = ...
+    ) -> JsonDict: ...
+    def deserialize(self, data, model, create_instance=True):
+        """
+        Deserialize a framed event, resolving its writer schema against the model
+
+        Arguments:
+            data: The framed event
+            model: The model to read the event with
+            create_instance: Whether to return an instance of the model or a python dict
+
+        Returns:
+            An instance of the model or a python dict
+
+        Raises:
+            ValueError: if the event is not framed with the confluent wire format
+            UnknownSchemaId: if the registry does not have the schema of the event
+        """
+        writer_schema = self.get_schema(read_confluent_header(data))
+        return model.deserialize(
+            memoryview(data)[CONFLUENT_HEADER_SIZE:],
+            create_instance=create_instance,
+            writer_schema=writer_schema,
+        )
@@ -1,14 +1,22 @@
+import collections
 import datetime
 import decimal
 import enum
+import hashlib
 import io
+import json
+import mmap
+import os
 import typing
 import uuid
 
 import fastavro
+from fastavro.const import AVRO_TYPES
+from fastavro.schema import extract_record_type, fingerprint, to_parsing_canonical_form
 
+from .exceptions import SchemaFingerprintCollision, UnknownSchemaFingerprint
 from .protocol import ModelProtocol
-from .types import JsonDict, SerializationType
+from .types import BytesLike, JsonDict, SerializationType
 
 DATETIME_STR_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 DATE_STR_FORMAT = "%Y-%m-%d"
@@ -16,17 +24,218 @@ TIME_STR_FORMAT = "%H:%M:%S"
 
 AVRO = "avro"
 AVRO_JSON = "avro-json"
+AVRO_SINGLE_OBJECT = "avro-single-object"
+
+# avro single object encoding: the marker is followed by the 8 bytes CRC-64-AVRO fingerprint
+# of the writer schema, in little-endian order, and then by the schemaless body
+SINGLE_OBJECT_MARKER = b"\xc3\x01"
+SINGLE_OBJECT_HEADER_SIZE = 10
+
+# same default as `fastavro`: container files are flushed in blocks of ~16KB
+DEFAULT_SYNC_INTERVAL = 16000
 
 decimal_context = decimal.Context()
 
 
+def parse_schema(schema: JsonDict) -> JsonDict:
+    """
+    Parse a schema with `fastavro` so it can be reused by `serialize` and `deserialize`
+    without being parsed again on every call
+
+    Attributes:
+        schema typing.Dict[str, Any]: The avro schema to parse. Named types defined inside
+            the schema, for example nested records, are parsed as well
+
+    Returns:
+        The parsed schema
+
+    !!! Example
+        ```python
+        from dataclasses_avroschema import parse_schema, serialize
+
+
+        schema = {
+            'type': 'record',
+            'name': 'MyRecord',
+            'fields': [
+                {'name': 'event', 'type': 'string', 'default': 'Hello World'}
+            ]
+        }
+        parsed_schema = parse_schema(schema)
+
+        event = serialize(payload={'event': 'Hello world'}, schema=parsed_schema)
+        assert event == b'\x16Hello world'
+        ```
+    """
+    return fastavro.parse_schema(schema)  # type: ignore[return-value]
+
+
+def _serialization_type_error(serialization_type: str) -> ValueError:
+    return ValueError(
+        f"Serialization type should be `avro`, `avro-json` or `avro-single-object`, not {serialization_type}"
+    )
+
+
+TValue = typing.TypeVar("TValue")
+
+
+class _SchemaMemo(typing.Generic[TValue]):
+    """
+    Bounded LRU memo of a value computed from a schema, remembered for the same dict object.
+    The schema is kept with its value, so its id can not be reused while it is in the memo.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: typing.OrderedDict[int, typing.Tuple[JsonDict, TValue]] = collections.OrderedDict()
+
+    def get(self, schema: JsonDict, compute: typing.Callable[[JsonDict], TValue]) -> TValue:
+        entry = self._entries.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            self._entries.move_to_end(id(schema))
+            return entry[1]
+
+        value = compute(schema)
+        self._entries[id(schema)] = (schema, value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _logical_types(schema: typing.Any) -> typing.List[typing.Tuple[typing.Any, ...]]:
+    # The logical types of a schema in the order of its parsing canonical form, which does not have them
+    logical_types = []
+    pending = [schema]
+    while pending:
+        schema = pending.pop()
+        if isinstance(schema, list):
+            pending.extend(reversed(schema))
+        elif isinstance(schema, dict):
+            if "logicalType" in schema:
+                logical_types.append((schema["logicalType"], schema.get("precision"), schema.get("scale")))
+            if "fields" in schema:
+                pending.extend(field["type"] for field in reversed(schema["fields"]))
+            for key in ("items", "values", "type"):
+                if key in schema and not isinstance(schema[key], str):
+                    pending.append(schema[key])
+    return logical_types
+
+
+class FingerprintIndex:
+    """
+    In process index of schemas by their CRC-64-AVRO fingerprint, used to find the writer
+    schema of the events serialized with the `avro-single-object` type.
+
+    Looking up a fingerprint is a single dict access. The models register their schema the
+    first time it is parsed, so the index knows the schemas of every model that has been used
+    in the process. Other schemas, for example older versions of a model, can be registered
+    with `register`.
+
+    The fingerprint of a schema is remembered for the same dict object, so the registered
+    schemas must not be modified afterwards.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._schemas: typing.Dict[bytes, JsonDict] = {}
+        # fingerprints of schemas that only differ in their logical types
+        self._collisions: typing.Set[bytes] = set()
+        self._fingerprints: _SchemaMemo[bytes] = _SchemaMemo(maxsize)
+
+    def register(self, schema: JsonDict) -> bytes:
+        """
+        Add a schema to the index
+
+        Attributes:
+            schema typing.Dict[str, Any]: The schema to register. It can be a schema already parsed with `parse_schema`
+
+        Returns:
+            The 8 bytes fingerprint of the schema
+        """
+        return self._fingerprints.get(schema, self._index)
+
+    def _index(self, schema: JsonDict) -> bytes:
+        parsed_schema = parse_schema(schema)
+        schema_fingerprint = bytes.fromhex(fingerprint(to_parsing_canonical_form(parsed_schema), "CRC-64-AVRO"))
+        registered = self._schemas.setdefault(schema_fingerprint, parsed_schema)
+        if registered is not parsed_schema and _logical_types(registered) != _logical_types(parsed_schema):
+            # the models register their schemas when they are parsed, so it fails only when the fingerprint is used
+            self._collisions.add(schema_fingerprint)
+        return schema_fingerprint
+
+    def get(self, schema_fingerprint: bytes) -> JsonDict:
+        """
+        Returns:
+            The parsed schema registered with the fingerprint
+
+        Raises:
+            UnknownSchemaFingerprint: if there is no schema registered with the fingerprint
+            SchemaFingerprintCollision: if schemas with other logical types have the fingerprint
+        """
+        schema = self._schemas.get(schema_fingerprint)
+        if schema is None:
+            raise UnknownSchemaFingerprint(schema_fingerprint)
+        if schema_fingerprint in self._collisions:
+            raise SchemaFingerprintCollision(schema_fingerprint)
+        return schema
+
+    def header(self, schema: JsonDict) -> bytes:
+        """
+        Returns:
+            The single object encoding header of the schema, which is registered if needed
+
+        Raises:
+            SchemaFingerprintCollision: if schemas with other logical types have the fingerprint
+        """
+        schema_fingerprint = self.register(schema)
+        if schema_fingerprint in self._collisions:
+            raise SchemaFingerprintCollision(schema_fingerprint)
+        return SINGLE_OBJECT_MARKER + schema_fingerprint
+
+    def __contains__(self, schema_fingerprint: bytes) -> bool:
+        return schema_fingerprint in self._schemas
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def clear(self) -> None:
+        self._schemas.clear()
+        self._collisions.clear()
+        self._fingerprints.clear()
+
+
+# Used to write and read the events serialized with the `avro-single-object` type
+fingerprint_index = FingerprintIndex()
+
+
+def read_single_object_header(data: BytesLike) -> bytes:
+    """
+    Returns:
+        The fingerprint of the writer schema of an event serialized with the `avro-single-object` type
+
+    Raises:
+        ValueError: if the event does not start with the single object marker
+    """
+    if len(data) < SINGLE_OBJECT_HEADER_SIZE or data[:2] != SINGLE_OBJECT_MARKER:
+        raise ValueError("The event is not encoded with the avro single object encoding")
+    return bytes(data[2:SINGLE_OBJECT_HEADER_SIZE])
+
+
 def serialize(payload: JsonDict, schema: typing.Dict, serialization_type: SerializationType = "avro") -> bytes:
     """
     Serialize a payload into avro using `fastavro` as backend
 
     Attributes:
         payload typing.Dict[str, Any]: The payload to serialize
-        serialization_type SerializationType: `avro` or `avro-json`
+        schema typing.Dict[str, Any]: The schema to use for the serialization. It can be
+            a schema already parsed with `parse_schema`
+        serialization_type SerializationType: `avro`, `avro-json` or `avro-single-object`
 
     Returns:
         bytes encoded in avro format
@@ -49,9 +258,12 @@ def serialize(payload: JsonDict, schema: typing.Dict, serialization_type: Serial
         assert event == b'\x16Hello world'
         ```
     """
-    if serialization_type == AVRO:
-        file_like_output: typing.Union[io.BytesIO, io.StringIO] = io.BytesIO()
+    if serialization_type == AVRO or serialization_type == AVRO_SINGLE_OBJECT:
+        binary_output = io.BytesIO()
+        if serialization_type == AVRO_SINGLE_OBJECT:
+            binary_output.write(fingerprint_index.header(schema))
 
+        file_like_output: typing.Union[io.BytesIO, io.StringIO] = binary_output
         fastavro.schemaless_writer(file_like_output, schema, payload)
 
         value = file_like_output.getvalue()
@@ -65,34 +277,531 @@ def serialize(payload: JsonDict, schema: typing.Dict, serialization_type: Serial
             fastavro.json_writer(file_like_output, schema, [payload])
             value = file_like_output.getvalue().encode("utf-8")
     else:
-        raise ValueError(f"Serialization type should be `avro` or `avro-json`, not {serialization_type}")
+        raise _serialization_type_error(serialization_type)
 
     file_like_output.flush()
 
     return value  # type: ignore
 
 
+class _BytearrayWriter:
+    """File-like wrapper that appends everything written to it to a bytearray"""
+
+    __slots__ = ("buffer",)
+
+    def __init__(self, buffer: bytearray) -> None:
+        self.buffer = buffer
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+
+def serialize_into(
+    payload: JsonDict,
+    schema: JsonDict,
+    out: typing.Union[bytearray, typing.IO[bytes]],
+    serialization_type: SerializationType = "avro",
+) -> int:
+    """
+    Serialize a payload into avro using `fastavro` as backend, appending the
+    event to a buffer owned by the caller instead of returning new `bytes`
+
+    Attributes:
+        payload typing.Dict[str, Any]: The payload to serialize
+        schema typing.Dict[str, Any]: The schema to use for the serialization. It can be
+            a schema already parsed with `parse_schema`
+        out bytearray | typing.IO[bytes]: A `bytearray` to extend or a binary file-like object,
+            for example `io.BytesIO`, to write at its current position
+        serialization_type SerializationType: `avro`, `avro-json` or `avro-single-object`
+
+    Returns:
+        The amount of bytes written
+
+    !!! Example
+        ```python
+        from dataclasses_avroschema import serialize_into
+
+
+        schema = {
+            'type': 'record',
+            'name': 'MyRecord',
+            'fields': [
+                {'name': 'event', 'type': 'string', 'default': 'Hello World'}
+            ]
+        }
+
+        frame = bytearray(b'\x00')
+        size = serialize_into({'event': 'Hello world'}, schema, frame)
+        frame[0] = size
+
+        assert frame == b'\x0c\x16Hello world'
+        ```
+    """
+    if isinstance(out, bytearray):
+        start = len(out)
+        stream: typing.Union[_BytearrayWriter, typing.IO[bytes]] = _BytearrayWriter(out)
+    else:
+        start = out.tell()
+        stream = out
+
+    if serialization_type == AVRO or serialization_type == AVRO_SINGLE_OBJECT:
+        if serialization_type == AVRO_SINGLE_OBJECT:
+            stream.write(fingerprint_index.header(schema))
+        # fastavro encodes the whole payload first and then writes it with a single call
+        fastavro.schemaless_writer(stream, schema, payload)  # type: ignore[arg-type]
+    elif serialization_type == AVRO_JSON:
+        stream.write(serialize(payload, schema, serialization_type=serialization_type))
+    else:
+        raise _serialization_type_error(serialization_type)
+
+    if isinstance(out, bytearray):
+        return len(out) - start
+    return out.tell() - start
+
+
+def serialize_many(
+    payloads: typing.Iterable[JsonDict],
+    schema: JsonDict,
+    serialization_type: SerializationType = "avro",
+    sink: typing.Optional[typing.Callable[[bytes], typing.Any]] = None,
+) -> typing.Optional[typing.List[bytes]]:
+    """
+    Serialize many payloads with the same schema using `fastavro` as backend
+
+    All the payloads are written one after the other into a single buffer,
+    which is then sliced into one event per payload.
+
+    Attributes:
+        payloads typing.Iterable[typing.Dict[str, Any]]: The payloads to serialize
+        schema typing.Dict[str, Any]: The schema to use for the serialization. It can be
+            a schema already parsed with `parse_schema`
+        serialization_type SerializationType: `avro`, `avro-json` or `avro-single-object`
+        sink typing.Callable[[bytes], Any] | None: Optional callable that receives every
+            event, for example `list.append` or a producer `send` method
+
+    Returns:
+        The list of events encoded in avro format or None if a `sink` was provided
+
+    !!! Example
+        ```python
+        from dataclasses_avroschema import serialize_many
+
+
+        schema = {
+            'type': 'record',
+            'name': 'MyRecord',
+            'fields': [
+                {'name': 'event', 'type': 'string', 'default': 'Hello World'}
+            ]
+        }
+
+        events = serialize_many(payloads=[{'event': 'Hello'}, {'event': 'world'}], schema=schema)
+        assert events == [b'\nHello', b'\nworld']
+        ```
+    """
+    if serialization_type == AVRO or serialization_type == AVRO_SINGLE_OBJECT:
+        file_like_output = io.BytesIO()
+        header = fingerprint_index.header(schema) if serialization_type == AVRO_SINGLE_OBJECT else b""
+
+        if sink is not None:
+            # every event is handed to the sink as soon as it is encoded, the buffer is reused
+            for payload in payloads:
+                file_like_output.seek(0)
+                file_like_output.truncate()
+                file_like_output.write(header)
+                fastavro.schemaless_writer(file_like_output, schema, payload)
+                sink(file_like_output.getvalue())
+            return None
+
+        offsets = [0]
+        for payload in payloads:
+            file_like_output.write(header)
+            fastavro.schemaless_writer(file_like_output, schema, payload)
+            offsets.append(file_like_output.tell())
+
+        with file_like_output.getbuffer() as buffer:
+            return [bytes(buffer[start:end]) for start, end in zip(offsets, offsets[1:])]
+    elif serialization_type == AVRO_JSON:
+        if sink is not None:
+            # `fastavro.json_writer` keeps all the records in memory, so they are written one by one
+            for payload in payloads:
+                sink(serialize(payload, schema, serialization_type=serialization_type))
+            return None
+
+        payloads = list(payloads)
+
+        if not payloads:
+            return []
+        elif schema.get("type") == "record" and not schema.get("fields"):
+            # see `serialize`, records without fields are encoded directly
+            return [b"{}"] * len(payloads)
+
+        text_output = io.StringIO()
+        fastavro.json_writer(text_output, schema, payloads)
+        # every record is written in its own line, json escapes the new lines inside strings
+        return [line.encode("utf-8") for line in text_output.getvalue().split("\n")]
+    else:
+        raise _serialization_type_error(serialization_type)
+
+
+# A visitor receives a value of the `fastavro` output and the context, and returns the value
+# with the unions of records replaced by their models
+UnionVisitor = typing.Callable[[typing.Any, JsonDict], typing.Any]
+
+
+def _count_union_records(union: typing.List) -> int:
+    # Same count as `fastavro`: a named type that is only referenced might be a record
+    return sum(
+        1
+        for schema in union
+        if extract_record_type(schema) == "record" or extract_record_type(schema) not in AVRO_TYPES
+    )
+
+
+def _visit_union(value: typing.Any, context: JsonDict) -> typing.Any:
+    return deserialize_from_context(data=value, context=context)
+
+
+class _RecordVisitor:
+    __slots__ = ("fields",)
+
+    def __init__(self) -> None:
+        self.fields: typing.List[typing.Tuple[str, UnionVisitor]] = []
+
+    def __call__(self, value: typing.Any, context: JsonDict) -> typing.Any:
+        if isinstance(value, dict):
+            for name, visitor in self.fields:
+                if name in value:
+                    value[name] = visitor(value[name], context)
+        return value
+
+
+class UnionPaths:
+    """
+    The paths of a schema that lead to unions with more than one record.
+
+    `fastavro` only returns the record name (`(name, value)`) for those unions, so they
+    are the only places of the payload that need to be replaced with models. The paths
+    are computed once per schema and they are used by `deserialize` to visit only
+    those places, or nothing at all when the schema does not have such unions.
+    """
+
+    __slots__ = ("_named_schemas", "_needs_visit", "_records", "visitor")
+
+    def __init__(self, schema: JsonDict) -> None:
+        parsed_schema = parse_schema(schema)
+        self._named_schemas: JsonDict = parsed_schema.get("__named_schemas", {})  # type: ignore[union-attr]
+        self._needs_visit = self._get_records_to_visit()
+        self._records = {name: _RecordVisitor() for name, needs_visit in self._needs_visit.items() if needs_visit}
+
+        for name, record_visitor in self._records.items():
+            record_visitor.fields = [
+                (field["name"], visitor)
+                for field in self._named_schemas[name]["fields"]
+                if (visitor := self._get_visitor(field["type"])) is not None
+            ]
+
+        self.visitor: typing.Optional[UnionVisitor] = self._get_visitor(parsed_schema)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.visitor is None
+
+    def visit(self, data: typing.Any, context: JsonDict) -> typing.Any:
+        if self.visitor is None:
+            return data
+        return self.visitor(data, context)
+
+    def _get_records_to_visit(self) -> typing.Dict[str, bool]:
+        records = {
+            name: schema
+            for name, schema in self._named_schemas.items()
+            if extract_record_type(schema) in ("record", "error")
+        }
+        needs_visit = dict.fromkeys(records, False)
+
+        # records can reference each other (or themselves), so iterate until nothing changes
+        changed = True
+        while changed:
+            changed = False
+            for name, schema in records.items():
+                if not needs_visit[name] and any(
+                    self._has_record_unions(field["type"], needs_visit) for field in schema["fields"]
+                ):
+                    needs_visit[name] = changed = True
+
+        return needs_visit
+
+    def _has_record_unions(self, schema: typing.Any, needs_visit: typing.Dict[str, bool]) -> bool:
+        if isinstance(schema, list):
+            return _count_union_records(schema) > 1 or any(
+                self._has_record_unions(item, needs_visit) for item in schema
+            )
+        elif isinstance(schema, str):
+            return needs_visit.get(schema, False)
+
+        schema_type = schema["type"]
+        if schema_type in ("record", "error"):
+            return needs_visit[schema["name"]]
+        elif schema_type == "array":
+            return self._has_record_unions(schema["items"], needs_visit)
+        elif schema_type == "map":
+            return self._has_record_unions(schema["values"], needs_visit)
+        elif isinstance(schema_type, (list, dict)):
+            return self._has_record_unions(schema_type, needs_visit)
+        return False
+
+    def _get_visitor(self, schema: typing.Any) -> typing.Optional[UnionVisitor]:
+        if not self._has_record_unions(schema, self._needs_visit):
+            return None
+
+        if isinstance(schema, list):
+            if _count_union_records(schema) > 1:
+                # `fastavro` returns the record name, so the whole value goes to the context
+                return _visit_union
+            return self._get_union_visitor(schema)
+        elif isinstance(schema, str):
+            return self._records[schema]
+
+        schema_type = schema["type"]
+        if schema_type in ("record", "error"):
+            return self._records[schema["name"]]
+        elif schema_type == "array":
+            return self._get_array_visitor(schema["items"])
+        elif schema_type == "map":
+            return self._get_map_visitor(schema["values"])
+        return self._get_visitor(schema_type)
+
+    def _get_array_visitor(self, items: typing.Any) -> UnionVisitor:
+        items_visitor = typing.cast(UnionVisitor, self._get_visitor(items))
+
+        def visit(value: typing.Any, context: JsonDict) -> typing.Any:
+            if isinstance(value, list):
+                return [items_visitor(item, context) for item in value]
+            return value
+
+        return visit
+
+    def _get_map_visitor(self, values: typing.Any) -> UnionVisitor:
+        values_visitor = typing.cast(UnionVisitor, self._get_visitor(values))
+
+        def visit(value: typing.Any, context: JsonDict) -> typing.Any:
+            if isinstance(value, dict):
+                return {key: values_visitor(item, context) for key, item in value.items()}
+            return value
+
+        return visit
+
+    def _get_union_visitor(self, union: typing.List) -> UnionVisitor:
+        # The union has at most one record, so the value is returned without its name.
+        # Records and maps are read as dicts and arrays as lists, which tells the branches apart
+        dict_visitors: typing.List[UnionVisitor] = []
+        list_visitors: typing.List[UnionVisitor] = []
+        for schema in union:
+            visitor = self._get_visitor(schema)
+            if visitor is not None:
+                is_array = not isinstance(schema, (list, str)) and schema["type"] == "array"
+                (list_visitors if is_array else dict_visitors).append(visitor)
+
+        if len(dict_visitors) > 1 or len(list_visitors) > 1:
+            # a record and a map can not be told apart, so the whole value is visited
+            return _visit_union
+
+        dict_visitor = dict_visitors[0] if dict_visitors else None
+        list_visitor = list_visitors[0] if list_visitors else None
+
+        def visit(value: typing.Any, context: JsonDict) -> typing.Any:
+            if dict_visitor is not None and isinstance(value, dict):
+                return dict_visitor(value, context)
+            elif list_visitor is not None and isinstance(value, list):
+                return list_visitor(value, context)
+            return value
+
+        return visit
+
+
+def _collect_named_types(schema: typing.Any, names: typing.Set[str]) -> None:
+    """
+    Collect the names of the named types defined inside a schema
+    """
+    if isinstance(schema, list):
+        for union_type in schema:
+            _collect_named_types(union_type, names)
+    elif isinstance(schema, dict):
+        schema_type = schema["type"]
+        if schema_type in ("record", "error", "enum", "fixed"):
+            names.add(schema["name"])
+        for field in schema.get("fields", ()):
+            _collect_named_types(field["type"], names)
+        if schema_type == "array":
+            _collect_named_types(schema["items"], names)
+        elif schema_type == "map":
+            _collect_named_types(schema["values"], names)
+
+
+def project_schema(schema: JsonDict, fields: typing.Iterable[str]) -> JsonDict:
+    """
+    Derive from a record schema a reader schema with only some of its fields.
+    When it is used to read events written with the whole schema, `fastavro`
+    skips the rest of the fields without decoding them.
+
+    Attributes:
+        schema typing.Dict[str, Any]: The record schema, it can be a schema already parsed with `parse_schema`
+        fields typing.Iterable[str]: The names of the fields to keep
+
+    Returns:
+        The reduced schema, already parsed
+
+    Raises:
+        ValueError: if a field is not part of the schema
+
+    !!! Example
+        ```python
+        from dataclasses_avroschema import deserialize, project_schema
+
+
+        schema = {
+            'type': 'record',
+            'name': 'MyRecord',
+            'fields': [
+                {'name': 'event', 'type': 'string'},
+                {'name': 'tags', 'type': {'type': 'array', 'items': 'string'}},
+            ]
+        }
+        reader_schema = project_schema(schema, ['event'])
+
+        payload = deserialize(data=b'\nHello\x02\x06foo\x00', schema=reader_schema, writer_schema=schema)
+        assert payload == {'event': 'Hello'}
+        ```
+    """
+    schema = parse_schema(schema)
+    fields = set(fields)
+
+    missing_fields = fields - {field["name"] for field in schema["fields"]}
+    if missing_fields:
+        raise ValueError(f"The fields {sorted(missing_fields)} are not part of the record {schema['name']}")
+
+    record = {key: value for key, value in schema.items() if not key.startswith("__")}
+    record["fields"] = [field for field in schema["fields"] if field["name"] in fields]
+
+    # the named types that were defined in the fields left out are provided already parsed
+    defined_names: typing.Set[str] = set()
+    _collect_named_types(record, defined_names)
+    named_schemas = {
+        name: named_schema for name, named_schema in schema["__named_schemas"].items() if name not in defined_names
+    }
+    return fastavro.parse_schema(record, named_schemas=named_schemas)  # type: ignore[return-value]
+
+
+class ResolvedSchemas(typing.NamedTuple):
+    writer_schema: JsonDict
+    # None when the writer schema is the same than the reader schema, so there is nothing to resolve
+    reader_schema: typing.Optional[JsonDict]
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _schema_fingerprint(schema: JsonDict) -> str:
+    # The whole schema is hashed, not only its Parsing Canonical Form, because the canonical
+    # form drops the logical types, which change how the values are read
+    schema = {key: value for key, value in schema.items() if key not in ("__fastavro_parsed", "__named_schemas")}
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+class SchemaResolutionCache:
+    """
+    Bounded LRU cache of the writer schemas already resolved against a reader schema.
+
+    The entries are keyed by the fingerprints of both schemas and keep the writer schema
+    parsed by `fastavro`, so it is parsed only once. When both schemas are the same the
+    reader schema is dropped and the event is read without any resolution.
+
+    The fingerprint of a schema is remembered for the same dict object, so the schemas
+    used with the cache must not be modified afterwards.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._resolved: typing.OrderedDict[typing.Tuple[str, str], ResolvedSchemas] = collections.OrderedDict()
+        self._fingerprints: _SchemaMemo[str] = _SchemaMemo(2 * maxsize)
+
+    def fingerprint(self, schema: JsonDict) -> str:
+        return self._fingerprints.get(schema, _schema_fingerprint)
+
+    def resolve(self, writer_schema: JsonDict, reader_schema: JsonDict) -> ResolvedSchemas:
+        key = (self.fingerprint(writer_schema), self.fingerprint(reader_schema))
+        resolved = self._resolved.get(key)
+
+        if resolved is not None:
+            self.hits += 1
+            self._resolved.move_to_end(key)
+            return resolved
+
+        self.misses += 1
+        if key[0] == key[1]:
+            resolved = ResolvedSchemas(writer_schema=parse_schema(reader_schema), reader_schema=None)
+        else:
+            resolved = ResolvedSchemas(
+                writer_schema=parse_schema(writer_schema), reader_schema=parse_schema(reader_schema)
+            )
+
+        self._resolved[key] = resolved
+        if len(self._resolved) > self.maxsize:
+            self._resolved.popitem(last=False)
+        return resolved
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._resolved))
+
+    def clear(self) -> None:
+        self.hits = self.misses = 0
+        self._resolved.clear()
+        self._fingerprints.clear()
+
+
+# Used by `deserialize` and `deserialize_many` when a `writer_schema` is provided
+schema_resolution_cache = SchemaResolutionCache()
+
+
 def deserialize(
     *,
-    data: bytes,
+    data: BytesLike,
     schema: JsonDict,
     serialization_type: SerializationType = "avro",  # ADd enum
     context: typing.Optional[JsonDict] = None,
     writer_schema: typing.Optional[JsonDict] = None,
+    union_paths: typing.Optional[UnionPaths] = None,
 ) -> JsonDict:
     """
     Deserialize an binary `event` into a python Dict using `fastavro` as backend
 
     Attributes:
-        data bytes: The event to deserialize
-        schema: Dict[str, Any]: The schema to use for the deserialization
-        serialization_type SerializationType: `avro` or `avro-json`
+        data BytesLike: The event to deserialize. Besides `bytes` it can be any object that
+            implements the buffer protocol, like a `bytearray`, a `memoryview` slice of a
+            larger buffer or a `mmap`
+        schema: Dict[str, Any]: The schema to use for the deserialization. It can be
+            a schema already parsed with `parse_schema`
+        serialization_type SerializationType: `avro`, `avro-json` or `avro-single-object`
         context Dict[str, Any] | None: Optional extra context to use.
             Usually in includes an entry with all the extra models defined
             by the end user by name. Example AvroModel.__name__: AvroModel
         writer_schema Dict[str, Any] | None: The schema that was used to write
             the event. If it is not provided it is assumed that the event was
-            written with the `schema` provided
+            written with the `schema` provided, or with the schema registered in
+            `fingerprint_index` for `avro-single-object` events.
+            The resolution of both schemas is kept in `schema_resolution_cache`
+        union_paths UnionPaths | None: The union paths of `schema`, computed when they are not provided.
+            When they are provided only those paths are visited to apply the `context`,
+            otherwise the whole payload is. They are ignored when `writer_schema` is
+            different from `schema`
 
     Returns:
         The object dezerialized python Dict
@@ -116,19 +825,39 @@ def deserialize(
         ```
     """
 
-    if serialization_type == AVRO:
-        input_stream: typing.Union[io.BytesIO, io.StringIO] = io.BytesIO(data)
-
+    # `io.BytesIO` shares the memory of a `bytes` object instead of copying it.
+    # Other buffers (bytearray, memoryview, mmap) are copied once, in C, because
+    # fastavro needs a stream whose `read` returns `bytes`.
+    input_stream = io.BytesIO(data)
+    # When the event was written with the same schema there is no need to hand
+    # a reader schema to fastavro, which would compare both schemas on every call
+    resolved = ResolvedSchemas(writer_schema=schema, reader_schema=None)
+
+    if serialization_type == AVRO_SINGLE_OBJECT:
+        schema_fingerprint = read_single_object_header(data)
+        if writer_schema is None:
+            writer_schema = fingerprint_index.get(schema_fingerprint)
+        input_stream.seek(SINGLE_OBJECT_HEADER_SIZE)
+
+    # the models register the same parsed schema that they deserialize with
+    if writer_schema is not None and writer_schema is not schema:
+        resolved = schema_resolution_cache.resolve(writer_schema, schema)
+        if resolved.reader_schema is not None:
+            # the record names come from the unions of the writer schema, which can be different
+            union_paths = None
+
+    if serialization_type == AVRO or serialization_type == AVRO_SINGLE_OBJECT:
         payload = fastavro.schemaless_reader(
             input_stream,
-            writer_schema=writer_schema or schema,
-            reader_schema=schema,
-            return_record_name=True,
+            writer_schema=resolved.writer_schema,
+            reader_schema=resolved.reader_schema,
+            return_record_name=union_paths is None or not union_paths.is_empty,
             return_record_name_override=True,
         )
 
     elif serialization_type == AVRO_JSON:
-        input_stream = io.StringIO(data.decode())
+        # The json decoder reads the lines of the stream with `json.loads`, which accepts
+        # bytes, so the event does not need to be decoded into an intermediate string first.
         # This is an iterator, but not a container
         records = fastavro.json_reader(input_stream, schema)
         # records can have multiple payloads, but in this case we return the first one.
@@ -137,15 +866,285 @@ def deserialize(
         # call takes.
         payload = next(iter(records))
     else:
-        raise ValueError(f"Serialization type should be `avro` or `avro-json`, not {serialization_type}")
-
-    input_stream.flush()
+        raise _serialization_type_error(serialization_type)
 
-    if context is not None:
+    if context is None:
+        return payload  # type: ignore
+    elif union_paths is None:
         return deserialize_from_context(data=payload, context=context)  # type: ignore
+    elif serialization_type != AVRO_JSON:
+        return union_paths.visit(payload, context)
+    # the json reader never returns the record names, so there is nothing to replace
     return payload  # type: ignore
 
 
+def deserialize_many(
+    *,
+    data: typing.Iterable[BytesLike],
+    schema: JsonDict,
+    serialization_type: SerializationType = "avro",
+    context: typing.Optional[JsonDict] = None,
+    writer_schema: typing.Optional[JsonDict] = None,
+    union_paths: typing.Optional[UnionPaths] = None,
+) -> typing.Iterator[JsonDict]:
+    """
+    Lazily deserialize many binary `events` written with the same schema into python Dicts
+    using `fastavro` as backend
+
+    The schemas, and the union paths when a `context` is provided, are computed once
+    for the whole batch and every event is decoded only when the returned iterator reaches it.
+
+    Attributes:
+        data typing.Iterable[BytesLike]: The events to deserialize, as `bytes` or any other
+            object that implements the buffer protocol
+        schema: Dict[str, Any]: The schema to use for the deserialization. It can be
+            a schema already parsed with `parse_schema`
+        serialization_type SerializationType: `avro`, `avro-json` or `avro-single-object`
+        context Dict[str, Any] | None: Optional extra context to use.
+            Usually in includes an entry with all the extra models defined
+            by the end user by name. Example AvroModel.__name__: AvroModel
+        writer_schema Dict[str, Any] | None: The schema that was used to write
+            the events. If it is not provided it is assumed that the events were
+            written with the `schema` provided, or with the schema registered in
+            `fingerprint_index` for `avro-single-object` events
+        union_paths UnionPaths | None: The union paths of `schema`, computed when they are not provided.
+            They are computed for the batch if they are not provided
+
+    Returns:
+        An iterator of the deserialized python Dicts
+
+    !!! Example
+        ```python
+        from dataclasses_avroschema import deserialize_many
+
+
+        events = [b'\nHello', b'\nworld']
+        schema = {
+            'type': 'record',
+            'name': 'MyRecord',
+            'fields': [
+                {'name': 'event', 'type': 'string', 'default': 'Hello World'}
+            ]
+        }
+
+        payloads = deserialize_many(data=events, schema=schema)
+        assert list(payloads) == [{'event': 'Hello'}, {'event': 'world'}]
+        ```
+    """
+    if serialization_type not in (AVRO, AVRO_JSON, AVRO_SINGLE_OBJECT):
+        raise _serialization_type_error(serialization_type)
+
+    if writer_schema:
+        resolved = schema_resolution_cache.resolve(writer_schema, schema)
+        # when both schemas are the same the events are read without resolution
+        writer_schema = None if resolved.reader_schema is None else resolved.writer_schema
+
+    schema = parse_schema(schema)
+    if writer_schema is None and context is not None and union_paths is None:
+        union_paths = UnionPaths(schema)
+
+    return _deserialize_many(
+        data=data,
+        schema=schema,
+        serialization_type=serialization_type,
+        context=context,
+        writer_schema=writer_schema,
+        union_paths=union_paths,
+    )
+
+
+def _deserialize_many(
+    *,
+    data: typing.Iterable[BytesLike],
+    schema: JsonDict,
+    serialization_type: SerializationType,
+    context: typing.Optional[JsonDict],
+    writer_schema: typing.Optional[JsonDict],
+    union_paths: typing.Optional[UnionPaths],
+) -> typing.Iterator[JsonDict]:
+    if writer_schema:
+        union_paths = None
+
+    if serialization_type == AVRO:
+        reader_schema = schema if writer_schema else None
+        writer_schema = writer_schema or schema
+        return_record_name = union_paths is None or not union_paths.is_empty
+
+        for event in data:
+            payload = fastavro.schemaless_reader(
+                io.BytesIO(event),
+                writer_schema=writer_schema,
+                reader_schema=reader_schema,
+                return_record_name=return_record_name,
+                return_record_name_override=True,
+            )
+
+            if context is None:
+                yield payload  # type: ignore
+            elif union_paths is None:
+                yield deserialize_from_context(data=payload, context=context)
+            else:
+                yield union_paths.visit(payload, context)
+    elif serialization_type == AVRO_SINGLE_OBJECT:
+        # every event carries the fingerprint of its own writer schema
+        for event in data:
+            yield deserialize(
+                data=event,
+                schema=schema,
+                serialization_type=serialization_type,
+                context=context,
+                writer_schema=writer_schema,
+                union_paths=union_paths,
+            )
+    else:
+        for event in data:
+            yield deserialize(
+                data=event,
+                schema=schema,
+                serialization_type=serialization_type,
+                context=context,
+                union_paths=union_paths,
+            )
+
+
+def write_container(
+    fo: typing.IO[bytes],
+    payloads: typing.Iterable[JsonDict],
+    schema: JsonDict,
+    codec: str = "null",
+    sync_interval: int = DEFAULT_SYNC_INTERVAL,
+    codec_compression_level: typing.Optional[int] = None,
+    metadata: typing.Optional[typing.Dict[str, str]] = None,
+) -> None:
+    """
+    Write payloads into an avro object container file using `fastavro` as backend
+
+    The payloads are consumed one by one and written in blocks, so the whole
+    dataset never needs to be in memory.
+
+    Attributes:
+        fo typing.IO[bytes]: The binary file-like object to write to. If it is opened
+            in `a+b` mode, the records are appended to an existing container file
+        payloads typing.Iterable[typing.Dict[str, Any]]: The payloads to write
+        schema typing.Dict[str, Any]: The schema of the payloads. It can be
+            a schema already parsed with `parse_schema`
+        codec str: Compression codec, for example `null`, `deflate` or `snappy`
+        sync_interval int: Size in bytes of a block. A block is compressed and written
+            followed by a sync marker every time this size is reached
+        codec_compression_level int | None: Compression level for the codec, if it supports one
+        metadata typing.Dict[str, str] | None: Extra metadata to store in the file header
+
+    !!! Example
+        ```python
+        import io
+
+        from dataclasses_avroschema import write_container
+
+
+        schema = {
+            'type': 'record',
+            'name': 'MyRecord',
+            'fields': [
+                {'name': 'event', 'type': 'string', 'default': 'Hello World'}
+            ]
+        }
+
+        container = io.BytesIO()
+        write_container(container, ({'event': str(number)} for number in range(100)), schema, codec="deflate")
+        ```
+    """
+    fastavro.writer(
+        fo,
+        schema,
+        payloads,
+        codec=codec,
+        sync_interval=sync_interval,
+        metadata=metadata,
+        codec_compression_level=codec_compression_level,
+    )
+
+
+def read_container(
+    path_or_file: typing.Union[str, os.PathLike, typing.IO[bytes]],
+    schema: typing.Optional[JsonDict] = None,
+    context: typing.Optional[JsonDict] = None,
+    memory_map: bool = False,
+) -> typing.Iterator[JsonDict]:
+    """
+    Lazily read the records of an avro object container file using `fastavro` as backend
+
+    The blocks of the file are decoded only when the returned iterator reaches them.
+    The schema stored in the file header is used as writer schema, so files written
+    with an older but compatible schema are resolved against `schema` automatically.
+
+    Attributes:
+        path_or_file str | os.PathLike | typing.IO[bytes]: Path of the file or a binary file-like object
+        schema typing.Dict[str, Any] | None: The reader schema. If it is not provided the
+            schema from the file header is used
+        context Dict[str, Any] | None: Optional extra context to use.
+            Usually in includes an entry with all the extra models defined
+            by the end user by name. Example AvroModel.__name__: AvroModel
+        memory_map bool: Whether to memory-map the file instead of reading it through
+            a file buffer. The file object, if provided, must have a `fileno`
+
+    Returns:
+        An iterator of the records as python Dicts
+
+    !!! Example
+        ```python
+        import io
+
+        from dataclasses_avroschema import read_container, write_container
+
+
+        schema = {
+            'type': 'record',
+            'name': 'MyRecord',
+            'fields': [
+                {'name': 'event', 'type': 'string', 'default': 'Hello World'}
+            ]
+        }
+
+        container = io.BytesIO()
+        write_container(container, [{'event': 'Hello'}, {'event': 'world'}], schema)
+        container.seek(0)
+
+        assert list(read_container(container, schema)) == [{'event': 'Hello'}, {'event': 'world'}]
+        ```
+    """
+    if isinstance(path_or_file, (str, os.PathLike)):
+        with open(path_or_file, "rb") as fo:
+            yield from _read_container(fo, schema=schema, context=context, memory_map=memory_map)
+    else:
+        yield from _read_container(path_or_file, schema=schema, context=context, memory_map=memory_map)
+
+
+def _read_container(
+    fo: typing.IO[bytes],
+    *,
+    schema: typing.Optional[JsonDict],
+    context: typing.Optional[JsonDict],
+    memory_map: bool,
+) -> typing.Iterator[JsonDict]:
+    if memory_map:
+        with mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            # `mmap` implements the `read` api, so it can be handed straight to fastavro
+            yield from _read_container(mapped_file, schema=schema, context=context, memory_map=False)  # type: ignore
+        return
+
+    records = fastavro.reader(
+        fo,
+        reader_schema=schema,
+        return_record_name=True,
+        return_record_name_override=True,
+    )
+
+    for record in records:
+        if context is not None:
+            record = deserialize_from_context(data=record, context=context)
+        yield record  # type: ignore
+
+
 def deserialize_from_context(*, data: typing.Any, context: JsonDict) -> typing.Any:
     """
     Recursively normalize deserialized data: unwrap union tuples
@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import mmap
 import typing
 from typing import Annotated
 
@@ -8,7 +9,11 @@ JsonDict = typing.Dict[str, typing.Any]
 
 # This represents how avro.type is represneted in json.
 AvroTypeRepr = typing.Union[JsonDict, typing.List, str]
-SerializationType = typing.Literal["avro", "avro-json"]
+SerializationType = typing.Literal["avro", "avro-json", "avro-single-object"]
+FingerprintAlgorithm = typing.Literal["CRC-64-AVRO", "md5", "sha256"]
+
+# Objects that implement the buffer protocol and can be deserialized without slicing them into `bytes` first
+BytesLike = typing.Union[bytes, bytearray, memoryview, mmap.mmap]
 
 
 class FieldInfo: ...
@@ -141,6 +141,70 @@ def rebuild_annotation(a_type: typing.Type, field_info: FieldInfo) -> typing.Typ
     return Annotated[a_type, field_info]  # type: ignore[return-value]
 
 
+# model -> resolved type hints, and (model, base_class) -> {field_name: whether the field is a union}
+_type_hints_cache: typing.Dict[type, typing.Dict[str, typing.Any]] = {}
+_union_fields_cache: typing.Dict[typing.Tuple[type, type], typing.Dict[str, bool]] = {}
+
+
+def get_cached_type_hints(klass: type) -> typing.Dict[str, typing.Any]:
+    """
+    `typing.get_type_hints` resolved once per model and kept until `clear_union_fields_cache` is called
+    """
+    type_hints = _type_hints_cache.get(klass)
+    if type_hints is None:
+        type_hints = _type_hints_cache[klass] = typing.get_type_hints(klass)
+    return type_hints
+
+
+def is_union_field(
+    klass: typing.Type["ModelProtocol"], field_name: str, base_class: typing.Type["ModelProtocol"]
+) -> bool:
+    """
+    Whether the field of a model is annotated with a union. The answer is computed
+    once per model and field, and kept until `clear_union_fields_cache` is called.
+
+    Arguments:
+        klass (typing.Type[ModelProtocol]): the model that contains the field
+        field_name (str): the field name
+        base_class (typing.Type[ModelProtocol]): the base class of the model family
+
+    Returns:
+        bool
+    """
+    union_fields = _union_fields_cache.setdefault((klass, base_class), {})
+    is_union_annotation = union_fields.get(field_name)
+
+    if is_union_annotation is None:
+        # A copy, because `get_klass_annotations` hands back the class's own
+        # `__annotations__` and the updates below would otherwise be written into it.
+        annotations = dict(get_klass_annotations(klass))
+        # This is a hack to get the annotations from the parent class
+        # https://github.com/marcosschroh/dataclasses-avroschema/issues/800
+        #
+        # The field can also be inherited from a plain mixin, which the check above misses
+        # when the model subclasses the base class directly, so the hints are resolved on
+        # a miss as well rather than letting the lookup raise `KeyError`.
+        if klass.mro()[1] != base_class or field_name not in annotations:
+            annotations.update(get_cached_type_hints(klass))
+
+        is_union_annotation = union_fields[field_name] = is_union(annotations[field_name])
+    return is_union_annotation
+
+
+def clear_union_fields_cache(klass: typing.Optional[type] = None) -> None:
+    """
+    Forget the resolved type hints and union annotations of a model, or of all the models when `klass` is None
+    """
+    if klass is None:
+        _type_hints_cache.clear()
+        _union_fields_cache.clear()
+        return
+
+    _type_hints_cache.pop(klass, None)
+    for key in [key for key in _union_fields_cache if key[0] is klass]:
+        del _union_fields_cache[key]
+
+
 def standardize_custom_type(
     *,
     field_name: str,
@@ -196,19 +260,7 @@ def standardize_custom_type(
         else:
             asdict = value.asdict()
 
-        # A copy, because `get_klass_annotations` hands back the class's own
-        # `__annotations__` and the updates below would otherwise be written into it.
-        annotations = dict(get_klass_annotations(model.__class__))
-        # This is a hack to get the annotations from the parent class
-        # https://github.com/marcosschroh/dataclasses-avroschema/issues/800
-        #
-        # The field can also be inherited from a plain mixin, which the check above misses
-        # when the model subclasses the base class directly, so the hints are resolved on
-        # a miss as well rather than letting the lookup raise `KeyError`.
-        if model.__class__.mro()[1] != base_class or field_name not in annotations:
-            annotations.update(typing.get_type_hints(model.__class__))
-
-        if is_union(annotations[field_name]) and include_type and not inside_collection:
+        if include_type and not inside_collection and is_union_field(model.__class__, field_name, base_class):
             return (value.get_fullname(), asdict)
         return asdict
 
@@ -226,6 +278,8 @@ class SchemaMetadata:
     field_order: typing.Optional[typing.List[str]] = None
     exclude: typing.List[str] = dataclasses.field(default_factory=list)
     convert_literal_to_enum: bool = False
+    compiled_decoder: bool = False
+    trusted: bool = False
 
     @classmethod
     def create(cls: typing.Type["SchemaMetadata"], klass: type) -> "SchemaMetadata":
@@ -239,6 +293,8 @@ class SchemaMetadata:
             field_order=getattr(klass, "field_order", None),
             exclude=getattr(klass, "exclude", []),
             convert_literal_to_enum=getattr(klass, "convert_literal_to_enum", False),
+            compiled_decoder=getattr(klass, "compiled_decoder", False),
+            trusted=getattr(klass, "trusted", False),
         )
 
     def get_alias_nested_items(self, name: str) -> typing.Optional[str]:
@@ -1,11 +1,13 @@
+import enum
 import json
 import typing
 from dataclasses import dataclass, field
 
 import pytest
+from fastavro.schema import fingerprint
 from fastavro.validation import ValidationError
 
-from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema import AvroModel, case
 from dataclasses_avroschema.types import JsonDict
 
 encoded = "test".encode()
@@ -86,6 +88,31 @@ def test_schema_cached(user_v2_dataclass, user_v2_avro_json):
     assert user_schema == user_v2_dataclass.avro_schema()
 
 
+def test_canonical_schema_and_fingerprint() -> None:
+    @dataclass
+    class User(AvroModel):
+        "An user"
+
+        first_name: str
+        age: int = 20
+
+    canonical_schema = User.canonical_schema()
+    assert (
+        canonical_schema
+        == '{"name":"User","type":"record","fields":[{"name":"first_name","type":"string"},{"name":"age","type":"long"}]}'
+    )
+    assert canonical_schema is User.canonical_schema()
+    assert User.canonical_schema(case_type=case.CAMELCASE) == canonical_schema.replace("first_name", "firstName")
+
+    assert User.fingerprint() == fingerprint(canonical_schema, "CRC-64-AVRO")
+    assert User.fingerprint("md5") == fingerprint(canonical_schema, "md5")
+    assert User.fingerprint("sha256") == fingerprint(canonical_schema, "sha256")
+    assert User.fingerprint(case_type=case.CAMELCASE) == fingerprint(
+        User.canonical_schema(case_type=case.CAMELCASE), "CRC-64-AVRO"
+    )
+    assert User.fingerprint() is User.fingerprint()
+
+
 def test_extra_avro_attributes(user_extra_avro_attributes):
     """
     This method is to test the extra avro attribute like
@@ -396,6 +423,41 @@ def test_avro_schema_method_with_inheritance() -> None:
     )
 
 
+def test_avro_schema_to_python_is_rendered_once() -> None:
+    class FavoriteColor(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @dataclass
+    class Address(AvroModel):
+        street: str
+        color: FavoriteColor
+
+    @dataclass
+    class User(AvroModel):
+        name: str
+        address: Address
+        previous_address: Address
+
+    schema = Address.avro_schema_to_python()
+    assert Address._get_schema() is Address._get_schema()
+    assert Address.avro_schema_to_python() == schema
+    assert Address.avro_schema_to_python() is not schema
+
+    # the returned schema is a copy, so it can be modified
+    schema["fields"][1]["type"]["symbols"].append("GREEN")
+    assert Address.avro_schema_to_python()["fields"][1]["type"]["symbols"] == ["BLUE", "RED"]
+
+    # rendering Address as a child of User changes its parser, so it is rendered again as a root
+    user_schema = User.avro_schema_to_python()
+    assert user_schema["fields"][2]["type"] == "Address"
+    assert Address.avro_schema_to_python()["fields"][1]["type"]["type"] == "enum"
+    assert User.avro_schema_to_python() == user_schema
+
+    assert Address.avro_schema_to_python(case_type=case.CAMELCASE)["name"] == "Address"
+    assert Address._get_schema(case_type=case.CAMELCASE) is not Address._get_schema()
+
+
 def test_generate_schema_from_avro_model() -> None:
     msg = "Schema generation must be called on a subclass of AvroModel, not AvroModel"
     with pytest.raises(AttributeError, match=msg):
@@ -1,6 +1,7 @@
+import enum
 import json
 import math
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pytest
 from pydantic import (
@@ -15,6 +16,7 @@ from pydantic_core import core_schema
 
 from dataclasses_avroschema import AVRO, AVRO_JSON, types
 from dataclasses_avroschema.pydantic import AvroBaseModel
+from dataclasses_avroschema.pydantic.main import _dumped_fields
 
 
 class CustomClass:
@@ -318,3 +320,50 @@ def test_float32_primitive_type():
     assert user.deserialize(avro_json, serialization_type="avro-json") == user
 
     assert user.to_dict() == data
+
+
+def test_asdict_encoder_matches_generic_standardization() -> None:
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    class Bus(AvroBaseModel):
+        engine_name: str
+
+    class Car(AvroBaseModel):
+        engine_name: str
+        color: Color = Color.BLUE
+
+    class Garage(AvroBaseModel):
+        name: str
+        color: Color
+        bus: Bus
+        vehicle: Union[Bus, Car]
+        parked: List[Car]
+        buses: Dict[str, Bus]
+        colors: Tuple[Color, ...]
+        tags: List[str]
+        owner: Optional[Bus] = None
+
+    garage = Garage(
+        name="main",
+        color=Color.RED,
+        bus=Bus(engine_name="diesel"),
+        vehicle=Bus(engine_name="electric"),
+        parked=[Car(engine_name="v8", color=Color.RED)],
+        buses={"a": Bus(engine_name="v6")},
+        colors=(Color.RED, Color.BLUE),
+        tags=["open"],
+        owner=Bus(engine_name="v12"),
+    )
+
+    # the records without enums and unions are converted by `model_dump`
+    assert _dumped_fields(Garage) == {"name", "bus", "buses", "tags"}
+    assert garage.asdict() == garage._standardize_asdict()
+    assert garage.asdict()["vehicle"] == ("Bus", {"engine_name": "electric"})
+    assert garage.asdict()["owner"] == ("Bus", {"engine_name": "v12"})
+    assert garage.asdict()["colors"] == ("RED", "BLUE")
+    assert Garage.deserialize(garage.serialize()) == garage
+
+    # the json_encoders are applied
+    assert parent_under_test.asdict() == {"custom_class": "custom class value"}
@@ -0,0 +1,65 @@
+import enum
+import typing
+
+import pytest
+from faust.serializers import Registry, codecs
+
+from dataclasses_avroschema.faust import AvroRecord, AvroRecordCodec
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    RED = "RED"
+
+
+class Car(AvroRecord):
+    total: int
+
+
+class Bus(AvroRecord):
+    driver: str
+
+
+class User(AvroRecord):
+    name: str
+    color: Color
+    transport: typing.Union[Car, Bus]
+    cars: typing.List[Car]
+    age: int = 20
+
+
+user = User(name="Alice", color=Color.RED, transport=Car(total=2), cars=[Car(total=1)])
+
+
+@pytest.mark.parametrize("serialization_type", ("avro", "avro-json", "avro-single-object"))
+def test_codec_registry(serialization_type) -> None:
+    name = f"{serialization_type}-user"
+    codecs.register(name, AvroRecordCodec(User, serialization_type=serialization_type))
+    registry = Registry()
+
+    event = registry.dumps_value(User, user, serializer=name)
+    assert event == user.serialize(serialization_type=serialization_type)
+    assert registry.loads_value(User, event, serializer=name) == user
+
+    # a dict with the values of the fields, the missing ones take their default
+    assert registry.dumps_value(User, user.asdict(), serializer=name) == event
+    data = {"name": "Alice", "color": Color.RED, "transport": Car(total=2), "cars": [Car(total=1)]}
+    assert registry.dumps_value(User, data, serializer=name) == event
+
+
+def test_codec_chain() -> None:
+    codec = AvroRecordCodec(User) | codecs.get_codec("binary")
+    assert repr(codec).startswith("AvroRecordCodec")
+
+    event = codec.dumps(user)
+    assert codecs.get_codec("binary").loads(event) == user.serialize()
+    assert codec.loads(event) == user
+
+
+def test_codec_many() -> None:
+    codec = AvroRecordCodec(User) | codecs.get_codec("binary")
+    users = [user, User(name="Bob", color=Color.BLUE, transport=Bus(driver="Alice"), cars=[])]
+
+    events = codec.dumps_many(users)
+    assert events == [codec.dumps(instance) for instance in users]
+    assert codec.loads_many(events) == users
@@ -1,9 +1,11 @@
 import dataclasses
 import io
+import typing
 
 import fastavro
+import pytest
 
-from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema import AvroModel, utils
 from dataclasses_avroschema.serialization import deserialize
 from dataclasses_avroschema.utils import get_klass_annotations
 
@@ -57,3 +59,43 @@ def test_avro_json_deserialize_reads_only_the_first_record() -> None:
     data = output.getvalue().encode() + b'\n{"b": 1}\n'
 
     assert deserialize(data=data, schema=schema, serialization_type="avro-json") == {"a": "first"}
+
+
+@dataclasses.dataclass
+class Base(AvroModel):
+    nested: typing.Optional[Nested] = None
+
+
+@dataclasses.dataclass
+class Child(Base):
+    own: str = "y"
+
+
+def test_union_annotations_are_resolved_once_per_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A model that does not subclass the base class directly needs `get_type_hints`."""
+    calls = []
+    resolve_type_hints = typing.get_type_hints
+
+    def get_type_hints(klass: typing.Any) -> typing.Dict[str, typing.Any]:
+        calls.append(klass)
+        return resolve_type_hints(klass)
+
+    utils.clear_union_fields_cache(Child)
+    monkeypatch.setattr(utils.typing, "get_type_hints", get_type_hints)
+
+    children = [Child(nested=Nested()) for _ in range(1000)]
+    values = [
+        utils.standardize_custom_type(field_name="nested", value=child.nested, model=child, base_class=AvroModel)
+        for child in children
+    ]
+
+    assert values == [("Nested", {"n": "n"})] * 1000
+    assert calls == [Child]
+
+    utils.clear_union_fields_cache(Child)
+    assert utils.is_union_field(Child, "nested", AvroModel)
+    assert not utils.is_union_field(Child, "own", AvroModel)
+    assert calls == [Child, Child]
+
+    utils.clear_union_fields_cache()
+    assert utils._union_fields_cache == utils._type_hints_cache == {}
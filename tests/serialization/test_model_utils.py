@@ -1,11 +1,18 @@
+import dataclasses
+import datetime
 import enum
+import functools
 import json
 import typing
+import uuid
 from dataclasses import dataclass
 
 import pytest
+from dacite import MissingValueError, UnexpectedDataError, from_dict
+from pydantic import Field, PrivateAttr, ValidationError
 
 from dataclasses_avroschema import AvroModel, main
+from dataclasses_avroschema.pydantic import AvroBaseModel
 from tests.serialization.test_serialization import CLASSES_DATA_BINARY
 
 
@@ -99,3 +106,293 @@ def test_custom_dacite_config():
     assert dacite_config.strict_unions_match
     assert dacite_config.strict
     assert dacite_config.cast != []
+
+
+def test_compiled_decoder():
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @dataclass
+    class Address(AvroModel):
+        street: str
+        created_at: datetime.datetime
+
+    @dataclass
+    class User(AvroModel):
+        name: str
+        color: Color
+        user_id: uuid.UUID
+        address: Address
+        addresses: typing.List[Address]
+        addresses_by_name: typing.Dict[str, Address]
+        routes: typing.Tuple[str, ...]
+        friend: typing.Optional["User"] = None
+        birthday: typing.Optional[datetime.date] = None
+        tags: typing.List[str] = dataclasses.field(default_factory=list)
+
+        class Meta:
+            compiled_decoder = True
+
+    data = {
+        "name": "Alice",
+        "color": "RED",
+        "user_id": "23de0fd0-bc0e-4b9f-a1d5-d32f2e71a3ee",
+        "address": {"street": "Main", "created_at": "2020-01-01T10:00:00+00:00"},
+        "addresses": [{"street": "Second", "created_at": datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)}],
+        "addresses_by_name": {"home": {"street": "Third", "created_at": "2022-01-01T10:00:00+00:00"}},
+        "routes": ["route 53", "route 51"],
+        "friend": {
+            "name": "Bob",
+            "color": "BLUE",
+            "user_id": "23de0fd0-bc0e-4b9f-a1d5-d32f2e71a3ef",
+            "address": {"street": "Main", "created_at": "2020-01-01T10:00:00+00:00"},
+            "addresses": [],
+            "addresses_by_name": {},
+            "routes": [],
+            "birthday": "2000-01-01",
+        },
+    }
+    user = User.parse_obj(data)
+    assert not isinstance(main._decoders_cache[User], functools.partial)
+
+    assert user == from_dict(data_class=User, data=data, config=main._dacite_config_cache[User])
+    assert user.color is Color.RED
+    assert user.routes == ("route 53", "route 51")
+    assert user.addresses_by_name["home"].created_at == datetime.datetime(2022, 1, 1, 10, tzinfo=datetime.timezone.utc)
+    assert user.friend.birthday == datetime.date(2000, 1, 1)
+    assert user.friend.friend is None
+    assert user.tags == []
+    assert User.deserialize(user.serialize()) == user
+
+    with pytest.raises(MissingValueError) as excinfo:
+        User.parse_obj({"name": "Alice"})
+    assert excinfo.value.field_path == "color"
+
+
+def test_compiled_decoder_from_dict_fallback():
+    @dataclass
+    class Car(AvroModel):
+        total: int
+
+    @dataclass
+    class Bus(AvroModel):
+        driver: str
+        total: int
+
+    @dataclass
+    class Trip(AvroModel):
+        transport: typing.Union[Bus, Car]
+
+        class Meta:
+            compiled_decoder = True
+
+    @dataclass
+    class Route(AvroModel):
+        name: str
+        stops: typing.List[str]
+        trip: typing.Optional[Trip] = None
+
+        class Meta:
+            compiled_decoder = True
+
+    # the union is decided by dacite for every value, so the model is created by `from_dict`
+    trip = Trip.parse_obj({"transport": {"driver": "Bob", "total": 1}})
+    assert trip == Trip(transport=Bus(driver="Bob", total=1))
+    assert isinstance(main._decoders_cache[Trip], functools.partial)
+
+    # a value that `fastavro` does not return is converted by `from_dict` as well
+    data = {"name": "53", "stops": ("first", "second"), "trip": {"transport": {"total": 2}}}
+    route = Route.parse_obj(data)
+    assert route == from_dict(data_class=Route, data=data, config=main._dacite_config_cache[Route])
+    assert route.trip == Trip(transport=Car(total=2))
+    assert not isinstance(main._decoders_cache[Route], functools.partial)
+
+
+def test_compiled_decoder_user_key_error():
+    calls = []
+
+    @dataclass
+    class User(AvroModel):
+        name: str
+        roles: typing.Dict[str, str]
+
+        class Meta:
+            compiled_decoder = True
+
+        def __post_init__(self) -> None:
+            calls.append(self.name)
+            self.role = self.roles["admin"]
+
+    with pytest.raises(KeyError, match="admin"):
+        User.parse_obj({"name": "Alice", "roles": {}})
+
+    # the error comes from the model and it is created only once
+    assert calls == ["Alice"]
+
+
+def test_trusted_decoder(monkeypatch: pytest.MonkeyPatch):
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @dataclass
+    class Car(AvroModel):
+        total: int
+
+    @dataclass
+    class Bus(AvroModel):
+        driver: str
+        total: int
+
+    @dataclass
+    class User(AvroModel):
+        name: str
+        color: Color
+        user_id: uuid.UUID
+        created_at: datetime.datetime
+        routes: typing.Tuple[str, ...]
+        transport: typing.Union[Car, Bus]
+        friend: typing.Optional["User"] = None
+
+        class Meta:
+            trusted = True
+
+    user = User(
+        name="Alice",
+        color=Color.RED,
+        user_id=uuid.uuid4(),
+        created_at=datetime.datetime(2020, 1, 1, 10, tzinfo=datetime.timezone.utc),
+        routes=("route 53",),
+        transport=Bus(driver="Bob", total=10),
+        friend=User(
+            name="Bob",
+            color=Color.BLUE,
+            user_id=uuid.uuid4(),
+            created_at=datetime.datetime(2021, 1, 1, 10, tzinfo=datetime.timezone.utc),
+            routes=(),
+            transport=Car(total=1),
+        ),
+    )
+    event = user.serialize()
+
+    # dacite is not used at all
+    monkeypatch.setattr(main, "from_dict", None)
+    assert User.deserialize(event) == user
+    assert User.deserialize(user.serialize(serialization_type="avro-json"), "avro-json") == user
+    assert list(User.deserialize_many([event, event])) == [user, user]
+    assert User.deserialize(event, create_instance=False) == user.to_dict()
+
+    # the values are trusted, so the hooks do not parse them
+    data = {
+        "name": "Alice",
+        "color": "RED",
+        "user_id": "id",
+        "created_at": "2020",
+        "routes": [],
+        "transport": {"total": 1},
+        "friend": None,
+    }
+    instance = User.parse_obj(data)
+    assert (instance.created_at, instance.color, instance.routes, instance.transport) == ("2020", Color.RED, (), Car(1))
+    monkeypatch.undo()
+    checked_data = dict(data, created_at="2020-01-01", user_id=str(user.user_id))
+    assert User.parse_obj(checked_data, trusted=False).created_at == datetime.datetime(2020, 1, 1)
+
+    # fields with defaults that are missing are filled by dacite
+    assert User.parse_obj({k: v for k, v in checked_data.items() if k != "friend"}).friend is None
+
+
+def test_trusted_decoder_unmatched_union_record():
+    calls = []
+
+    @dataclass
+    class Car(AvroModel):
+        total: int
+
+    @dataclass
+    class Bus(AvroModel):
+        driver: str
+        total: int = 0
+
+    @dataclass
+    class Trip(AvroModel):
+        transport: typing.Union[Car, Bus]
+        transports: typing.List[typing.Union[Car, Bus]] = dataclasses.field(default_factory=list)
+
+        class Meta:
+            trusted = True
+
+        def __post_init__(self) -> None:
+            calls.append(self.transport)
+
+    # the dict matches the fields of a record, so it is trusted
+    assert Trip.parse_obj({"transport": {"driver": "Bob", "total": 1}, "transports": []}).transport == Bus("Bob", 1)
+
+    # the records overlap and the dict does not have all the fields of any of them, so it is validated
+    trip = Trip.parse_obj({"transport": {"driver": "Bob"}, "transports": [{"driver": "Alice"}, {"total": 2}]})
+    assert trip == Trip(transport=Bus(driver="Bob"), transports=[Bus(driver="Alice"), Car(total=2)])
+
+    # the instances are created only once
+    calls.clear()
+    Trip.parse_obj({"transport": {"total": 2}})
+    assert calls == [Car(total=2)]
+
+
+def test_trusted_deserialize():
+    @dataclass
+    class Bus(AvroModel):
+        driver: str
+        created_at: datetime.date
+
+    bus = Bus(driver="Bob", created_at=datetime.date(2020, 1, 1))
+    event = bus.serialize()
+
+    assert main._trusted_decoders_cache.get((Bus, None)) is None
+    assert Bus.deserialize(event, trusted=True) == bus
+    assert list(Bus.deserialize_many([event], trusted=True)) == [bus]
+    assert Bus.parse_obj({"driver": "Bob", "created_at": "2020-01-01"}, trusted=True).created_at == "2020-01-01"
+    assert Bus.parse_obj({"driver": "Bob", "created_at": "2020-01-01"}).created_at == datetime.date(2020, 1, 1)
+
+
+def test_trusted_pydantic_deserialize():
+    class Car(AvroBaseModel):
+        total: int
+
+    class User(AvroBaseModel):
+        name: str
+        age: int = Field(gt=0)
+        transport: typing.Optional[Car] = None
+        _secret: str = PrivateAttr(default="secret")
+
+        class Meta:
+            trusted = True
+
+    user = User(name="Alice", age=20, transport=Car(total=1))
+    event = user.serialize()
+
+    # `model_construct` is slower than the validation, so the instances are always validated
+    assert main._trusted_decoders_cache.get((User, None)) is None
+    instance = User.deserialize(event)
+    assert instance == user
+    assert instance._secret == "secret"
+    assert User.deserialize_many([event, event], trusted=True) == [user, user]
+
+    with pytest.raises(ValidationError):
+        User.parse_obj({"name": "Alice", "age": 0}, trusted=True)
+
+
+def test_compiled_decoder_with_strict_dacite_config():
+    @dataclass
+    class Bus(AvroModel):
+        driver: str
+        total: int
+
+        class Meta:
+            compiled_decoder = True
+            dacite_config = {"strict": True}
+
+    assert Bus.parse_obj({"driver": "Bob", "total": 10}) == Bus(driver="Bob", total=10)
+
+    with pytest.raises(UnexpectedDataError):
+        Bus.parse_obj({"driver": "Bob", "total": 10, "color": "RED"})
@@ -1,10 +1,16 @@
+import copy
 import dataclasses
 import datetime
+import enum
+import io
+import pickle
 import typing
 
+import fastavro
 import pytest
+from pydantic import Field, ValidationError
 
-from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema import AvroModel, main
 from dataclasses_avroschema.faust import AvroRecord
 from dataclasses_avroschema.pydantic import AvroBaseModel
 
@@ -494,3 +500,414 @@ def test_inheritance(model_class: typing.Type[AvroModel], decorator: typing.Call
     child = Child(p=A(a=1), c=1)
     ser = child.serialize()
     assert Child.deserialize(ser) == child
+
+
+@parametrize_base_model
+def test_serialize_many(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+    @decorator
+    class Address(model_class):
+        street: str
+        street_number: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        age: int
+        address: Address
+
+    users = [
+        User(name="john", age=20, address=Address(street="test", street_number=10)),
+        User(name="jane", age=30, address=Address(street="other", street_number=1)),
+    ]
+
+    for serialization_type in ("avro", "avro-json"):
+        events = User.serialize_many(users, serialization_type=serialization_type)
+        assert events == [user.serialize(serialization_type=serialization_type) for user in users]
+
+        sent: typing.List[bytes] = []
+        assert User.serialize_many(iter(users), serialization_type=serialization_type, sink=sent.append) is None
+        assert sent == events
+
+        # the events are handed to the sink while the payloads are consumed
+        streamed: typing.List[bytes] = []
+
+        def payloads() -> typing.Iterator[User]:
+            for index, user in enumerate(users):
+                assert len(streamed) == index
+                yield user
+
+        User.serialize_many(payloads(), serialization_type=serialization_type, sink=streamed.append)
+        assert streamed == events
+
+        assert [User.deserialize(event, serialization_type=serialization_type) for event in sent] == users
+
+    assert User.serialize_many([]) == []
+    assert User.serialize_many([], serialization_type="avro-json") == []
+
+
+@parametrize_base_model
+def test_deserialize_many(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+    @decorator
+    class Address(model_class):
+        street: str
+        street_number: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        age: int
+        addresses: typing.List[Address]
+
+    users = [
+        User(name="john", age=20, addresses=[Address(street="test", street_number=10)]),
+        User(name="jane", age=30, addresses=[]),
+    ]
+
+    for serialization_type in ("avro", "avro-json"):
+        events = [user.serialize(serialization_type=serialization_type) for user in users]
+
+        instances = User.deserialize_many(events, serialization_type=serialization_type)
+        # pydantic validates the whole batch at once
+        assert isinstance(instances, list) is (model_class is AvroBaseModel)
+        assert list(instances) == users
+
+        assert list(User.deserialize_many(events, serialization_type=serialization_type, create_instance=False)) == [
+            user.to_dict() for user in users
+        ]
+
+
+def test_deserialize_many_pydantic_errors() -> None:
+    class User(AvroBaseModel):
+        name: str
+        age: int = Field(gt=0)
+
+    events = [User(name="john", age=20).serialize(), User.model_construct(name="jane", age=0).serialize()]
+
+    with pytest.raises(ValidationError) as excinfo:
+        User.deserialize_many(events)
+
+    errors = excinfo.value.errors()
+    assert len(errors) == 1
+    assert errors[0]["loc"] == (1, "age")
+    assert User.deserialize_many(events[:1]) == [User(name="john", age=20)]
+    assert User.deserialize_many([]) == []
+
+
+@parametrize_base_model
+def test_write_container(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+    @decorator
+    class Address(model_class):
+        street: str
+        street_number: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        age: int
+        address: Address
+
+    def users():
+        for number in range(100):
+            yield User(name=f"john {number}", age=number, address=Address(street="test", street_number=number))
+
+    container = io.BytesIO()
+    User.write_container(container, users(), codec="deflate", sync_interval=100, metadata={"source": "tests"})
+
+    container.seek(0)
+    reader = fastavro.block_reader(container)
+    blocks = list(reader)
+
+    assert reader.codec == "deflate"
+    assert reader.metadata["source"] == "tests"
+    assert len(blocks) > 1
+    assert [record for block in blocks for record in block] == [user.to_dict() for user in users()]
+
+
+@parametrize_base_model
+def test_read_container(model_class: typing.Type[AvroModel], decorator: typing.Callable, tmp_path) -> None:
+    @decorator
+    class Address(model_class):
+        street: str
+        street_number: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        age: int
+        addresses: typing.List[Address]
+
+    users = [
+        User(name=f"john {number}", age=number, addresses=[Address(street="test", street_number=number)])
+        for number in range(50)
+    ]
+    path = tmp_path / "users.avro"
+
+    with open(path, "wb") as fileobj:
+        User.write_container(fileobj, users, sync_interval=100)
+
+    records = User.read_container(path)
+    assert not isinstance(records, list)
+    assert list(records) == users
+
+    assert list(User.read_container(str(path), memory_map=True)) == users
+    assert list(User.read_container(path, create_instance=False)) == [user.to_dict() for user in users]
+
+    with open(path, "rb") as fileobj:
+        assert list(User.read_container(fileobj, memory_map=True)) == users
+
+
+@parametrize_base_model
+def test_serialize_into(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+    @decorator
+    class Address(model_class):
+        street: str
+        street_number: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        age: int
+        address: Address
+
+    users = [
+        User(name="john", age=20, address=Address(street="test", street_number=10)),
+        User(name="jane", age=30, address=Address(street="other", street_number=1)),
+    ]
+
+    for serialization_type in ("avro", "avro-json"):
+        events = [user.serialize(serialization_type=serialization_type) for user in users]
+
+        frame = bytearray(b"header")
+        sizes = [user.serialize_into(frame, serialization_type=serialization_type) for user in users]
+        assert sizes == [len(event) for event in events]
+        assert frame == b"header" + b"".join(events)
+
+        output = io.BytesIO()
+        output.write(b"header")
+        sizes = [user.serialize_into(output, serialization_type=serialization_type) for user in users]
+        assert sizes == [len(event) for event in events]
+        assert output.getvalue() == b"header" + b"".join(events)
+
+
+@parametrize_base_model
+def test_deserialize_fields(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @decorator
+    class Address(model_class):
+        street: str
+        street_number: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        color: Color
+        address: Address
+        previous_addresses: typing.List[Address]
+        age: int = 20
+
+    user = User(
+        name="john",
+        color=Color.RED,
+        address=Address(street="test", street_number=10),
+        previous_addresses=[Address(street="other", street_number=1)],
+    )
+    event = user.serialize()
+
+    assert User.deserialize(event, fields=["color", "address"]) == {
+        "color": Color.RED,
+        "address": Address(street="test", street_number=10),
+    }
+    assert User.deserialize(event, create_instance=False, fields=["age", "previous_addresses"]) == {
+        "previous_addresses": [{"street": "other", "street_number": 1}],
+        "age": 20,
+    }
+    assert User.deserialize(user.serialize(serialization_type="avro-json"), "avro-json", fields=["name"]) == {
+        "name": "john"
+    }
+    assert User.deserialize(event, writer_schema=User, fields=["name"]) == {"name": "john"}
+    assert User._get_projection(["address", "color"]) is User._get_projection(("color", "address"))
+
+    with pytest.raises(ValueError, match="The fields \\['email'\\] are not part of the record User"):
+        User.deserialize(event, fields=["name", "email"])
+
+
+@parametrize_base_model
+def test_deserialize_fields_with_union_of_records(
+    model_class: typing.Type[AvroModel], decorator: typing.Callable
+) -> None:
+    @decorator
+    class Car(model_class):
+        total: int
+
+    @decorator
+    class Bus(model_class):
+        driver: str
+        total: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        transport: typing.Union[Bus, Car]
+        transports: typing.List[typing.Union[Bus, Car]]
+
+    user = User(name="john", transport=Bus(driver="Bob", total=10), transports=[Car(total=1)])
+
+    for serialization_type in ("avro", "avro-json"):
+        event = user.serialize(serialization_type=serialization_type)
+
+        instance = User.deserialize(event, serialization_type)
+        assert User.deserialize(event, serialization_type, fields=["transport", "transports"]) == {
+            "transport": instance.transport,
+            "transports": instance.transports,
+        }
+        # the same plain dicts as deserializing the whole event without creating the instance
+        values = User.deserialize(event, serialization_type, create_instance=False, fields=["transport", "transports"])
+        assert values == {"transport": {"driver": "Bob", "total": 10}, "transports": [{"total": 1}]}
+        assert values.items() <= User.deserialize(event, serialization_type, create_instance=False).items()
+
+    assert User.deserialize(user.serialize(), fields=["transport"]) == {"transport": Bus(driver="Bob", total=10)}
+
+
+@parametrize_base_model
+def test_deserialize_lazy(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @decorator
+    class Address(model_class):
+        street: str
+        street_number: int
+
+    @decorator
+    class User(model_class):
+        name: str
+        color: Color
+        address: Address
+        birthday: datetime.date
+
+    user = User(
+        name="john",
+        color=Color.RED,
+        address=Address(street="test", street_number=10),
+        birthday=datetime.date(2000, 1, 1),
+    )
+    event = user.serialize()
+    record = User.deserialize(event, lazy=True)
+
+    # nothing is decoded until a field is accessed
+    assert repr(record) == "<lazy User (encoded)>"
+    assert record._event is event
+
+    assert record.color is Color.RED
+    assert repr(record) == "<lazy User (decoded)>"
+    assert record.address == Address(street="test", street_number=10)
+    assert record.address is record.address
+    assert record.birthday == datetime.date(2000, 1, 1)
+    assert record._materialize() == user
+    assert record._materialize() is record._materialize()
+    assert "name" in dir(record)
+
+    json_record = User.deserialize(user.serialize(serialization_type="avro-json"), "avro-json", lazy=True)
+    assert json_record.name == "john"
+
+    with pytest.raises(AttributeError, match="'User' has no field 'email'"):
+        record.email
+
+    with pytest.raises(AttributeError, match="can not be modified"):
+        record.name = "peter"
+
+    with pytest.raises(ValueError, match="`lazy` can not be combined"):
+        User.deserialize(event, fields=["name"], lazy=True)
+
+
+@dataclasses.dataclass
+class LazyUser(AvroModel):
+    name: str
+    birthday: datetime.date
+
+
+def test_deserialize_lazy_copy_and_pickle() -> None:
+    user = LazyUser(name="john", birthday=datetime.date(2000, 1, 1))
+    record = LazyUser.deserialize(user.serialize(), lazy=True)
+    assert record.name == "john"
+
+    for other in (copy.copy(record), copy.deepcopy(record), pickle.loads(pickle.dumps(record))):
+        assert repr(other) == "<lazy LazyUser (encoded)>"
+        assert other._event == record._event
+        assert other.birthday == datetime.date(2000, 1, 1)
+        assert other._materialize() == user
+
+
+def test_deserialize_lazy_trusted(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = LazyUser(name="john", birthday=datetime.date(2000, 1, 1))
+    record = LazyUser.deserialize(user.serialize(), lazy=True, trusted=True)
+
+    # the instance is created by the trusted decoder, not by dacite
+    monkeypatch.setattr(main, "from_dict", None)
+    assert record._materialize() == user
+    assert copy.copy(record)._trusted is True
+
+
+@parametrize_base_model
+def test_deserialize_to_dict_without_instances(
+    model_class: typing.Type[AvroModel], decorator: typing.Callable, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @decorator
+    class Address(model_class):
+        street: str
+        color: Color
+
+    @decorator
+    class Phone(model_class):
+        number: str
+        colors: typing.List[Color]
+
+    @decorator
+    class User(model_class):
+        name: str
+        color: typing.Optional[Color]
+        contact: typing.Union[Address, Phone]
+        contacts: typing.List[typing.Union[Address, Phone]]
+        addresses: typing.Dict[str, Address]
+        tags: typing.Tuple[str, ...]
+
+    user = User(
+        name="john",
+        color=Color.RED,
+        contact=Phone(number="123", colors=[Color.BLUE]),
+        contacts=[Address(street="test", color=Color.BLUE), Phone(number="456", colors=[])],
+        addresses={"home": Address(street="home", color=Color.RED)},
+        tags=("one", "two"),
+    )
+    events = [user.serialize(), user.serialize(serialization_type="avro-json")]
+    expected = user.to_dict()
+
+    # the dict is built straight from the fastavro output
+    monkeypatch.setattr(User, "parse_obj", None)
+    assert User.deserialize(events[0], create_instance=False) == expected
+    assert User.deserialize(events[1], "avro-json", create_instance=False) == expected
+    assert list(User.deserialize_many(events[:1], create_instance=False)) == [expected]
+
+
+def test_deserialize_to_dict_with_dacite_config() -> None:
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+        age: int
+
+        class Meta:
+            dacite_config = {"type_hooks": {str: str.upper}}
+
+    event = User(name="john", age=20).serialize()
+
+    # the type hooks can change the values, so the instance is created
+    assert User._get_dict_decoder() is None
+    assert User.deserialize(event, create_instance=False) == {"name": "JOHN", "age": 20}
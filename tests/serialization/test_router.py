@@ -0,0 +1,98 @@
+import dataclasses
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, ConfluentSerializer, LocalSchemaRegistry, ModelRouter
+from dataclasses_avroschema.exceptions import UnknownModel, UnknownSchemaFingerprint
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+
+    class Meta:
+        namespace = "users"
+
+
+@dataclasses.dataclass
+class Order(AvroModel):
+    id: int
+    amount: float
+
+
+@dataclasses.dataclass
+class UserV2(AvroModel):
+    name: str
+    age: int
+    nickname: typing.Optional[str] = None
+
+    class Meta:
+        schema_name = "User"
+        namespace = "users"
+
+
+user = User(name="G.R. Emlin", age=52)
+order = Order(id=1, amount=10.5)
+
+
+def test_route_single_object_events() -> None:
+    router = ModelRouter([User, Order])
+    events = [
+        user.serialize(serialization_type="avro-single-object"),
+        order.serialize(serialization_type="avro-single-object"),
+    ]
+
+    assert router.get_model("users.User") is User
+    assert router.deserialize(events[0]) == user
+    assert router.deserialize(events[1], create_instance=False) == {"id": 1, "amount": 10.5}
+    assert router.deserialize_many(events * 2) == [user, order, user, order]
+
+
+def test_route_events_of_other_versions() -> None:
+    router = ModelRouter()
+    router.register(UserV2)
+    event = user.serialize(serialization_type="avro-single-object")
+
+    # the writer schema is found in the fingerprint index and the reader by the record name
+    assert router.route(event) == (UserV2, User._get_parsed_schema(), 10)
+    assert router.deserialize(event) == UserV2(name="G.R. Emlin", age=52)
+    assert router.deserialize_many([event, bytearray(event)]) == [UserV2(name="G.R. Emlin", age=52)] * 2
+
+
+def test_route_confluent_events() -> None:
+    serializer = ConfluentSerializer(LocalSchemaRegistry())
+    router = ModelRouter([UserV2, Order], serializer=serializer)
+    events = [serializer.serialize(user), serializer.serialize(order), serializer.serialize(user)]
+
+    assert router.deserialize(events[1]) == order
+    assert router.deserialize_many(events) == [
+        UserV2(name="G.R. Emlin", age=52),
+        order,
+        UserV2(name="G.R. Emlin", age=52),
+    ]
+
+
+def test_route_with_key() -> None:
+    router = ModelRouter(
+        [User, Order],
+        key=lambda event: "Order" if b'"amount"' in event else "users.User",
+        serialization_type="avro-json",
+    )
+    events = [order.serialize(serialization_type="avro-json"), user.serialize(serialization_type="avro-json")]
+
+    assert router.deserialize(events[0]) == order
+    assert router.deserialize_many(events) == [order, user]
+
+
+def test_route_errors() -> None:
+    with pytest.raises(ValueError):
+        ModelRouter(serializer=ConfluentSerializer(LocalSchemaRegistry()), key=lambda event: "User")
+
+    router = ModelRouter([Order])
+    with pytest.raises(UnknownModel, match="There is no model registered for the record users.User"):
+        router.deserialize(user.serialize(serialization_type="avro-single-object"))
+
+    with pytest.raises(UnknownSchemaFingerprint):
+        router.deserialize(b"\xc3\x01" + bytes(8))
@@ -0,0 +1,125 @@
+import dataclasses
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, ConfluentSerializer, LocalSchemaRegistry, schema_resolution_cache
+from dataclasses_avroschema.exceptions import UnknownSchemaId
+from dataclasses_avroschema.faust import AvroRecord
+from dataclasses_avroschema.pydantic import AvroBaseModel
+
+
+class CountingRegistry(LocalSchemaRegistry):
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def get_schema(self, schema_id: int) -> typing.Dict[str, typing.Any]:
+        self.calls += 1
+        return super().get_schema(schema_id)
+
+    def register_schema(self, subject: str, schema: typing.Dict[str, typing.Any]) -> int:
+        self.calls += 1
+        return super().register_schema(subject, schema)
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+
+
+@dataclasses.dataclass
+class UserV2(AvroModel):
+    name: str
+    age: int
+    nickname: typing.Optional[str] = None
+
+    class Meta:
+        schema_name = "User"
+
+
+@pytest.mark.parametrize(
+    "model_class, decorator",
+    [
+        pytest.param(AvroModel, dataclasses.dataclass, id="AvroModel"),
+        pytest.param(AvroBaseModel, lambda f: f, id="AvroBaseModel"),
+        pytest.param(AvroRecord, dataclasses.dataclass, id="AvroRecord"),
+    ],
+)
+def test_confluent_serialization(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+    @decorator
+    class Event(model_class):
+        name: str
+
+        class Meta:
+            namespace = "events"
+
+    registry = CountingRegistry()
+    serializer = ConfluentSerializer(registry)
+    instance = Event(name="hello")
+
+    event = serializer.serialize(instance)
+    assert event == b"\x00\x00\x00\x00\x01" + instance.serialize()
+    assert registry.subjects == {"events.Event": [1]}
+
+    assert serializer.deserialize(event, Event) == instance
+    assert serializer.deserialize(bytearray(event), Event, create_instance=False) == {"name": "hello"}
+    assert serializer.serialize(instance, subject="events-value") == event
+    assert registry.subjects == {"events.Event": [1], "events-value": [1]}
+
+
+def test_confluent_deserialization_without_registry_io() -> None:
+    registry = CountingRegistry()
+    event = ConfluentSerializer(registry).serialize(User(name="G.R. Emlin", age=52))
+
+    serializer = ConfluentSerializer(registry)
+    registry.calls = 0
+    schema_resolution_cache.clear()
+
+    for _ in range(3):
+        assert serializer.deserialize(event, UserV2) == UserV2(name="G.R. Emlin", age=52)
+
+    # the writer schema is fetched once and resolved through the same cache as `writer_schema`
+    assert registry.calls == 1
+    assert schema_resolution_cache.cache_info()[:2] == (2, 1)
+
+
+def test_confluent_registered_schema_is_a_copy() -> None:
+    @dataclasses.dataclass
+    class Event(AvroModel):
+        name: str
+
+    registry = LocalSchemaRegistry()
+    schema_id = ConfluentSerializer(registry).get_schema_id(Event)
+
+    # the registry owns the schema, changing it does not change the schema of the model
+    registry.get_schema(schema_id)["fields"].append({"name": "age", "type": "int"})
+    assert Event.avro_schema_to_python() == {
+        "type": "record",
+        "name": "Event",
+        "fields": [{"name": "name", "type": "string"}],
+    }
+
+
+def test_confluent_deserialization_errors() -> None:
+    serializer = ConfluentSerializer(LocalSchemaRegistry())
+
+    with pytest.raises(UnknownSchemaId, match="There is no schema registered with the id 7"):
+        serializer.deserialize(b"\x00\x00\x00\x00\x07\x02a\x02", User)
+
+    with pytest.raises(ValueError, match="not framed with the confluent wire format"):
+        serializer.deserialize(b"\x02a\x02", User)
+
+
+def test_file_schema_registry(tmp_path) -> None:
+    path = tmp_path / "registry.json"
+    registry = LocalSchemaRegistry(path)
+
+    assert registry.register_schema("users", User.avro_schema_to_python()) == 1
+    assert registry.register_schema("users", UserV2.avro_schema_to_python()) == 2
+    assert registry.register_schema("users", User.avro_schema_to_python()) == 1
+
+    loaded_registry = LocalSchemaRegistry(path)
+    assert loaded_registry.subjects == {"users": [1, 2]}
+    assert loaded_registry.get_schema(2) == UserV2.avro_schema_to_python()
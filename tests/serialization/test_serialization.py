@@ -1,5 +1,9 @@
+import dataclasses
 import datetime
+import decimal
 import enum
+import io
+import mmap
 import typing
 import uuid
 from dataclasses import dataclass
@@ -7,7 +11,27 @@ from dataclasses import dataclass
 import pytest
 from dateutil.tz import UTC
 
-from dataclasses_avroschema import AVRO, AVRO_JSON, AvroModel
+from dataclasses_avroschema import (
+    AVRO,
+    AVRO_JSON,
+    AvroModel,
+    FingerprintIndex,
+    SchemaResolutionCache,
+    condecimal,
+    deserialize,
+    deserialize_many,
+    fingerprint_index,
+    main,
+    parse_schema,
+    project_schema,
+    read_container,
+    schema_resolution_cache,
+    serialization,
+    serialize,
+    serialize_into,
+    utils,
+)
+from dataclasses_avroschema.exceptions import SchemaFingerprintCollision, UnknownSchemaFingerprint
 from dataclasses_avroschema.types import SerializationType
 
 a_datetime = datetime.datetime(2019, 10, 12, 17, 57, 42, tzinfo=UTC)
@@ -238,6 +262,66 @@ def test_deserialization_with_writer_schema_avro_model():
     UserCompatible.deserialize(user.serialize(), writer_schema=User)
 
 
+def test_schema_resolution_cache() -> None:
+    cache = SchemaResolutionCache(maxsize=2)
+    schema = User.avro_schema_to_python()
+    compatible_schema = UserCompatible.avro_schema_to_python()
+
+    resolved = cache.resolve(schema, compatible_schema)
+    assert resolved.reader_schema is not None
+    assert cache.resolve(schema, compatible_schema) is resolved
+    # an equal schema in a different dict is the same entry
+    assert cache.resolve(User.avro_schema_to_python(), compatible_schema) is resolved
+    assert cache.cache_info() == (2, 1, 2, 1)
+
+    # the same schema does not need to be resolved
+    assert cache.resolve(schema, User.avro_schema_to_python()).reader_schema is None
+
+    # the least recently used pair is evicted
+    cache.resolve(compatible_schema, schema)
+    assert cache.cache_info().currsize == 2
+    cache.resolve(schema, compatible_schema)
+    assert cache.cache_info().misses == 4
+
+    # the fingerprints of the schemas are bounded as well
+    for _ in range(5):
+        cache.resolve(User.avro_schema_to_python(), compatible_schema)
+    assert len(cache._fingerprints) == 4
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
+def test_schema_resolution_cache_with_logical_types() -> None:
+    """
+    Schemas that only differ in the scale of a decimal have the same canonical form,
+    but they must not be taken as the same schema
+    """
+
+    @dataclass
+    class Payment(AvroModel):
+        amount: condecimal(max_digits=10, decimal_places=2)
+
+    @dataclass
+    class PaymentV2(AvroModel):
+        amount: condecimal(max_digits=10, decimal_places=3)
+
+        class Meta:
+            schema_name = "Payment"
+
+    schema_resolution_cache.clear()
+    event = Payment(amount=decimal.Decimal("1.25")).serialize()
+
+    assert Payment.deserialize(event, writer_schema=Payment) == Payment(amount=decimal.Decimal("1.25"))
+    # the event is read with the scale of the writer
+    assert PaymentV2.deserialize(event, writer_schema=Payment) == PaymentV2(amount=decimal.Decimal("1.25"))
+
+    assert PaymentV2.deserialize(event, writer_schema=Payment).amount == decimal.Decimal("1.25")
+    assert Payment.deserialize(event, writer_schema=Payment.avro_schema_to_python()).amount == decimal.Decimal("1.25")
+    # a model used as the writer of itself is not resolved at all
+    assert schema_resolution_cache.cache_info()[:2] == (1, 2)
+
+
 def test_serialization_with_forward_ref_uuid():
     """
     Test serialization/deserialization with ForwardRef UUID fields.
@@ -273,6 +357,25 @@ def test_serialization_with_forward_ref_uuid():
     assert deserialized_null.record_id is None
 
 
+def test_serialization_with_inherited_unresolved_forward_ref() -> None:
+    @dataclass
+    class Base(AvroModel):
+        # `UUID` is not defined in this module, so the type hints of the model can not be resolved
+        record_id: typing.Optional["UUID"] = None  # type: ignore[name-defined]  # noqa: F821
+
+    @dataclass
+    class Child(Base):
+        name: str = "child"
+
+    test_uuid = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    instance = Child(record_id=test_uuid)
+
+    assert instance.asdict() == {"record_id": test_uuid, "name": "child"}
+    assert instance.serialize(serialization_type=AVRO_JSON) == (
+        b'{"record_id": {"string": "12345678-1234-5678-1234-567812345678"}, "name": "child"}'
+    )
+
+
 def test_serialization_with_self_reference_and_forward_ref_uuid():
     """
     Test serialization with both self-reference and ForwardRef UUID in same model.
@@ -354,3 +457,396 @@ def test_schema_without_fields_serialization() -> None:
     assert empty.serialize() == b""
     assert empty.serialize(serialization_type=AVRO_JSON) == b"{}"
     assert EmptyModel.deserialize(b"{}", serialization_type=AVRO_JSON) == empty
+
+
+def test_parsed_schema_is_cached() -> None:
+    user = User(**data_user)
+    user.serialize()
+
+    parsed_schema = main._parsed_schemas_cache[User]
+    assert parsed_schema is User._get_parsed_schema()
+    assert parsed_schema["__fastavro_parsed"]
+
+    assert user.serialize() == user_avro_binary
+    assert User.deserialize(user_avro_binary) == user
+    assert main._parsed_schemas_cache[User] is parsed_schema
+
+
+def test_asdict_encoder_matches_generic_standardization() -> None:
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @dataclass
+    class Bus(AvroModel):
+        engine_name: str
+
+    @dataclass
+    class Car(AvroModel):
+        engine_name: str
+        color: Color = Color.BLUE
+
+    @dataclass
+    class Garage(AvroModel):
+        name: str
+        color: Color
+        vehicle: typing.Union[Bus, Car]
+        parked: typing.List[Car]
+        by_slot: typing.Dict[str, typing.Union[Bus, Car]]
+        colors: typing.Tuple[Color, ...]
+        tags: typing.List[str]
+        owner: typing.Optional[Car] = None
+        internal_id: typing.Optional[Color] = None
+
+        class Meta:
+            exclude = ["internal_id"]
+
+    garage = Garage(
+        name="main",
+        color=Color.RED,
+        vehicle=Bus(engine_name="diesel"),
+        parked=[Car(engine_name="v8", color=Color.RED)],
+        by_slot={"a": Car(engine_name="v6"), "b": Bus(engine_name="electric")},
+        colors=(Color.RED, Color.BLUE),
+        tags=["open"],
+        owner=Car(engine_name="v12"),
+        internal_id=Color.BLUE,
+    )
+
+    expected = {
+        field.name: utils.standardize_custom_type(
+            field_name=field.name, value=getattr(garage, field.name), model=garage, base_class=AvroModel
+        )
+        for field in dataclasses.fields(garage)
+    }
+
+    assert garage.asdict() == expected
+    assert garage.asdict()["vehicle"] == ("Bus", {"engine_name": "diesel"})
+    assert garage.asdict()["internal_id"] == "BLUE"
+    assert Garage in main._encoders_cache
+    assert Garage.deserialize(garage.serialize()) == dataclasses.replace(garage, internal_id=None)
+
+
+@pytest.mark.parametrize(
+    "serialization_type, data",
+    (
+        (AVRO, user_avro_binary),
+        (AVRO_JSON, user_avro_json),
+    ),
+)
+def test_serialization_with_parsed_schema(serialization_type: SerializationType, data: bytes) -> None:
+    parsed_schema = parse_schema(User.avro_schema_to_python())
+
+    assert serialize(user_json, parsed_schema, serialization_type=serialization_type) == data
+    assert deserialize(data=data, schema=parsed_schema, serialization_type=serialization_type) == user_json
+
+
+def test_serialize_many_with_union_records() -> None:
+    @dataclass
+    class Car(AvroModel):
+        total: int
+
+    @dataclass
+    class Bus(AvroModel):
+        driver: str
+        total: int
+
+    @dataclass
+    class Trip(AvroModel):
+        transport: typing.Union[Car, Bus]
+
+    trips = [Trip(transport=Car(total=1)), Trip(transport=Bus(driver="Marcos", total=10))]
+
+    for serialization_type in (AVRO, AVRO_JSON):
+        events = Trip.serialize_many(trips, serialization_type=serialization_type)
+        assert events == [trip.serialize(serialization_type=serialization_type) for trip in trips]
+
+
+def test_serialize_many_without_fields() -> None:
+    @dataclass
+    class EmptyModel(AvroModel):
+        pass
+
+    assert EmptyModel.serialize_many([EmptyModel(), EmptyModel()]) == [b"", b""]
+    assert EmptyModel.serialize_many([EmptyModel()], serialization_type=AVRO_JSON) == [b"{}"]
+
+
+def test_invalid_serialize_many_type() -> None:
+    with pytest.raises(ValueError):
+        User.serialize_many([User(**data_user)], serialization_type="json")  # type: ignore
+
+
+def test_deserialize_many_with_writer_schema() -> None:
+    events = [User(**data_user).serialize(), user_avro_binary]
+    expected = UserCompatible(**data_user)
+
+    assert list(UserCompatible.deserialize_many(events, writer_schema=User)) == [expected, expected]
+    assert list(UserCompatible.deserialize_many(events, writer_schema=User.avro_schema_to_python())) == [
+        expected,
+        expected,
+    ]
+
+
+def test_single_object_serialization() -> None:
+    user = User(**data_user)
+    event = user.serialize(serialization_type="avro-single-object")
+
+    assert event[:2] == b"\xc3\x01"
+    assert event[2:10] == bytes.fromhex(User.fingerprint())
+    assert event[10:] == user.serialize()
+
+    assert User.deserialize(event, serialization_type="avro-single-object") == user
+    # the writer schema is found by its fingerprint
+    assert UserCompatible.deserialize(event, serialization_type="avro-single-object") == UserCompatible(**data_user)
+    assert list(
+        UserCompatible.deserialize_many([event, memoryview(event)], serialization_type="avro-single-object")
+    ) == [
+        UserCompatible(**data_user),
+        UserCompatible(**data_user),
+    ]
+
+    assert User.serialize_many([user], serialization_type="avro-single-object") == [event]
+    buffer = bytearray()
+    assert user.serialize_into(buffer, serialization_type="avro-single-object") == len(event)
+    assert buffer == event
+
+
+def test_single_object_serialization_with_schema() -> None:
+    schema = {"type": "record", "name": "Event", "fields": [{"name": "event", "type": "string"}]}
+    event = serialize({"event": "Hello"}, schema, serialization_type="avro-single-object")
+
+    assert event == fingerprint_index.header(schema) + b"\nHello"
+    assert fingerprint_index.register(schema) in fingerprint_index
+    assert deserialize(data=event, schema=schema, serialization_type="avro-single-object") == {"event": "Hello"}
+    assert list(
+        deserialize_many(data=[event], schema=schema, writer_schema=schema, serialization_type="avro-single-object")
+    ) == [{"event": "Hello"}]
+
+
+def test_single_object_deserialization_errors() -> None:
+    schema = {"type": "record", "name": "Unknown", "fields": [{"name": "event", "type": "string"}]}
+    index = FingerprintIndex(maxsize=1)
+    event = index.header(schema) + b"\nHello"
+    # the fingerprints of the schema dicts are bounded
+    index.register(dict(schema))
+    assert len(index) == 1
+
+    with pytest.raises(UnknownSchemaFingerprint, match=event[2:10].hex()):
+        deserialize(data=event, schema=schema, serialization_type="avro-single-object")
+
+    # the writer schema can be provided instead
+    assert deserialize(data=event, schema=schema, writer_schema=schema, serialization_type="avro-single-object") == {
+        "event": "Hello"
+    }
+
+    with pytest.raises(ValueError, match="not encoded with the avro single object encoding"):
+        deserialize(data=b"\nHello", schema=schema, serialization_type="avro-single-object")
+
+    index.clear()
+    assert len(index) == 0
+
+
+def test_single_object_fingerprint_collision() -> None:
+    def schema(logical_type: str) -> typing.Dict[str, typing.Any]:
+        return {
+            "type": "record",
+            "name": "Event",
+            "fields": [{"name": "created", "type": {"type": "long", "logicalType": logical_type}}],
+        }
+
+    index = FingerprintIndex()
+    schema_fingerprint = index.register(schema("timestamp-millis"))
+
+    # the same schema, or one that is only documented differently, can be registered again
+    assert index.register(schema("timestamp-millis")) == schema_fingerprint
+    assert index.register({**schema("timestamp-millis"), "doc": "An event"}) == schema_fingerprint
+
+    event = index.header(schema("timestamp-millis")) + b"\x02"
+    assert index.get(schema_fingerprint)["fields"][0]["type"]["logicalType"] == "timestamp-millis"
+
+    # the parsing canonical form does not have the logical types
+    assert index.register(schema("timestamp-micros")) == schema_fingerprint
+
+    with pytest.raises(SchemaFingerprintCollision, match=schema_fingerprint.hex()):
+        index.get(event[2:10])
+
+    with pytest.raises(SchemaFingerprintCollision, match=schema_fingerprint.hex()):
+        index.header(schema("timestamp-millis"))
+
+    index.clear()
+    assert index.register(schema("timestamp-micros")) == schema_fingerprint
+    assert index.get(schema_fingerprint)["fields"][0]["type"]["logicalType"] == "timestamp-micros"
+
+
+def test_deserialize_many_helper() -> None:
+    payloads = deserialize_many(data=iter([user_avro_binary, user_avro_binary]), schema=User.avro_schema_to_python())
+    assert list(payloads) == [user_json, user_json]
+
+    with pytest.raises(ValueError):
+        deserialize_many(data=[user_avro_binary], schema=User.avro_schema_to_python(), serialization_type="json")  # type: ignore
+
+
+def test_project_schema_with_named_types() -> None:
+    schema = {
+        "type": "record",
+        "name": "Trip",
+        "namespace": "trips",
+        "fields": [
+            {
+                "name": "origin",
+                "type": {"type": "record", "name": "Place", "fields": [{"name": "name", "type": "string"}]},
+            },
+            {"name": "destination", "type": "Place"},
+            {"name": "stops", "type": {"type": "array", "items": "Place"}},
+            {"name": "tags", "type": {"type": "map", "values": "string"}},
+            {"name": "kind", "type": {"type": "enum", "name": "Kind", "symbols": ["BUS", "CAR"]}},
+            {"name": "previous_kinds", "type": {"type": "array", "items": "Kind"}},
+            {"name": "last_stop", "type": ["null", "Place"]},
+        ],
+    }
+    event = serialize(
+        {
+            "origin": {"name": "A"},
+            "destination": {"name": "B"},
+            "stops": [{"name": "C"}],
+            "tags": {"k": "v"},
+            "kind": "BUS",
+            "previous_kinds": ["CAR"],
+            "last_stop": {"name": "C"},
+        },
+        schema,
+    )
+
+    # `Place` is defined in a field that is not part of the projection
+    reader_schema = project_schema(schema, ["stops", "destination"])
+    assert [field["name"] for field in reader_schema["fields"]] == ["destination", "stops"]
+    assert reader_schema["fields"][0]["type"] == "trips.Place"
+    assert reader_schema["fields"][1]["type"] == {"type": "array", "items": "trips.Place"}
+
+    assert deserialize(data=event, schema=reader_schema, writer_schema=schema) == {
+        "destination": {"name": "B"},
+        "stops": [{"name": "C"}],
+    }
+    assert deserialize(data=event, schema=project_schema(schema, ["tags"]), writer_schema=schema) == {
+        "tags": {"k": "v"}
+    }
+    assert deserialize(
+        data=event, schema=project_schema(schema, ["previous_kinds", "last_stop"]), writer_schema=schema
+    ) == {"previous_kinds": ["CAR"], "last_stop": {"name": "C"}}
+
+
+def test_union_paths_without_record_unions() -> None:
+    union_paths = serialization.UnionPaths(User.avro_schema_to_python())
+
+    assert union_paths.is_empty
+    assert User._get_union_paths().is_empty
+    assert User.deserialize(user_avro_binary) == User(**data_user)
+
+
+def test_union_paths() -> None:
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        RED = "RED"
+
+    @dataclass
+    class Bus(AvroModel):
+        engine_name: str
+
+    @dataclass
+    class Car(AvroModel):
+        engine_name: str
+        color: Color = Color.BLUE
+
+    @dataclass
+    class Trip(AvroModel):
+        vehicles_by_stop: typing.Dict[str, typing.Union[Bus, Car]]
+        duration: typing.Optional[int] = None
+
+    @dataclass
+    class Node(AvroModel):
+        name: str
+        trips: typing.List[Trip]
+        last_trip: typing.Optional[Trip] = None
+        children: typing.List[typing.Type["Node"]] = dataclasses.field(default_factory=list)
+        tags: typing.Union[typing.List[str], typing.Dict[str, str]] = dataclasses.field(default_factory=list)
+
+    trip = Trip(vehicles_by_stop={"first": Bus(engine_name="diesel"), "second": Car(engine_name="electric")})
+    node = Node(
+        name="root",
+        trips=[trip],
+        last_trip=trip,
+        children=[Node(name="child", trips=[trip, Trip(vehicles_by_stop={}, duration=10)])],
+    )
+    event = node.serialize()
+    schema = Node.avro_schema_to_python()
+    context = Node._get_serialization_context()
+
+    union_paths = serialization.UnionPaths(schema)
+    assert not union_paths.is_empty
+
+    payload = deserialize(data=event, schema=schema, context=context, union_paths=union_paths)
+    assert payload == deserialize(data=event, schema=schema, context=context)
+    assert payload["trips"][0]["vehicles_by_stop"]["first"] == Bus(engine_name="diesel")
+    assert payload["children"][0]["trips"][0]["vehicles_by_stop"]["second"] == Car(engine_name="electric")
+
+    instance = Node.parse_obj(payload)
+    assert Node.deserialize(event) == instance
+    assert list(Node.deserialize_many([event, event])) == [instance, instance]
+
+    # with a writer schema every path is visited
+    assert Node.deserialize(event, writer_schema=Node) == instance
+
+
+def test_read_container_with_writer_schema_from_header() -> None:
+    container = io.BytesIO()
+    User.write_container(container, [User(**data_user)] * 3)
+    container.seek(0)
+
+    assert list(UserCompatible.read_container(container)) == [UserCompatible(**data_user)] * 3
+
+    container.seek(0)
+    assert list(read_container(container)) == [user_json] * 3
+
+
+@pytest.mark.parametrize("buffer_type", (bytes, bytearray, memoryview))
+@pytest.mark.parametrize(
+    "serialization_type, data",
+    (
+        (AVRO, user_avro_binary),
+        (AVRO_JSON, user_avro_json),
+    ),
+)
+def test_deserialization_from_buffers(
+    buffer_type: typing.Callable, serialization_type: SerializationType, data: bytes
+) -> None:
+    frame = buffer_type(b"header" + data + b"trailer")
+    event = memoryview(frame)[len(b"header") : -len(b"trailer")]
+
+    assert User.deserialize(event, serialization_type=serialization_type) == User(**data_user)
+    assert (
+        deserialize(data=event, schema=User.avro_schema_to_python(), serialization_type=serialization_type) == user_json
+    )
+    assert list(User.deserialize_many([event, event], serialization_type=serialization_type)) == [User(**data_user)] * 2
+
+
+def test_deserialization_from_mmap(tmp_path) -> None:
+    path = tmp_path / "events"
+    path.write_bytes(user_avro_binary * 2)
+
+    with open(path, "rb") as fileobj, mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        assert User.deserialize(mapped_file) == User(**data_user)
+
+        with memoryview(mapped_file) as view:
+            size = len(user_avro_binary)
+            assert User.deserialize(view[size:]) == User(**data_user)
+
+
+def test_serialize_into_helper() -> None:
+    frame = bytearray()
+    size = serialize_into(user_json, User.avro_schema_to_python(), frame)
+
+    assert size == len(user_avro_binary)
+    assert frame == user_avro_binary
+
+    with pytest.raises(ValueError):
+        serialize_into(user_json, User.avro_schema_to_python(), frame, serialization_type="json")  # type: ignore
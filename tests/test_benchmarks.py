@@ -170,3 +170,36 @@ def test_serialization(benchmark, fixture_name: str, request: pytest.FixtureRequ
         bench_avro_serialization,
         model,
     )
+
+
+def bench_avro_deserialization_to_dict(model: Type[AvroModel], event: bytes) -> Dict[str, Any]:
+    return model.deserialize(event, create_instance=False)
+
+
+def bench_avro_deserialization_to_dict_with_instance(model: Type[AvroModel], event: bytes) -> Dict[str, Any]:
+    # what `create_instance=False` did before: creating the instance and calling `to_dict`
+    return model.parse_obj(model.deserialize_to_python(event)).to_dict()
+
+
+@pytest.mark.benchmark(group="binary_deserialization_to_dict")
+@pytest.mark.parametrize(
+    "bench",
+    (bench_avro_deserialization_to_dict, bench_avro_deserialization_to_dict_with_instance),
+)
+@pytest.mark.parametrize(
+    "fixture_name",
+    (
+        "user_advance_dataclass_with_enum",
+        "user_advance_dataclass_with_sub_record_and_enum",
+        "user_advance_with_defaults_dataclass_with_enum",
+    ),
+)
+def test_deserialization_to_dict(
+    benchmark, bench: Callable[..., Dict[str, Any]], fixture_name: str, request: pytest.FixtureRequest
+):
+    model: Type[AvroModel] = request.getfixturevalue(fixture_name)
+    instance = model.fake()
+    event = instance.serialize()
+
+    result = benchmark(bench, model, event)
+    assert result == instance.to_dict()